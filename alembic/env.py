@@ -12,6 +12,9 @@ from alembic import context
 # Import your models here
 from src.infrastructure.database.connection import Base
 from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.message_model import MessageModel
+from src.infrastructure.database.models.outbox_model import OutboxEventModel
+from src.infrastructure.database.models.email_outbox_model import EmailOutboxModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
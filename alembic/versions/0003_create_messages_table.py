@@ -0,0 +1,50 @@
+"""create messages table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'messages',
+        sa.Column('id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('sender_id', postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column('recipient_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_messages_recipient_id_created_at_id', 'messages', ['recipient_id', 'created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_messages_sender_id_created_at_id', 'messages', ['sender_id', 'created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_messages_undelivered',
+        'messages',
+        ['recipient_id', 'created_at'],
+        unique=False,
+        postgresql_where=sa.text('delivered_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_undelivered', table_name='messages')
+    op.drop_index('ix_messages_sender_id_created_at_id', table_name='messages')
+    op.drop_index('ix_messages_recipient_id_created_at_id', table_name='messages')
+    op.drop_table('messages')
@@ -0,0 +1,35 @@
+"""create outbox_events table
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('aggregate_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_outbox_events_occurred_at_id', 'outbox_events', ['occurred_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_occurred_at_id', table_name='outbox_events')
+    op.drop_table('outbox_events')
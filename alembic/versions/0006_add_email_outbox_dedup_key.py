@@ -0,0 +1,26 @@
+"""add email_outbox dedup_key
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('email_outbox', sa.Column('dedup_key', sa.String(length=255), nullable=True))
+    op.create_index('ix_email_outbox_dedup_key', 'email_outbox', ['dedup_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_outbox_dedup_key', table_name='email_outbox')
+    op.drop_column('email_outbox', 'dedup_key')
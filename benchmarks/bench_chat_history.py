@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark: storing chat messages one INSERT each vs. through the write-behind buffer.
+
+The database is simulated: every statement costs one round trip
+(``ROUND_TRIP_MS``) plus a small per-row cost, on at most ``POOL_SIZE``
+connections at a time, which is what bounds message persistence in practice. Senders call ``ChatService.record_message`` the way
+the Socket.IO handler does, so the measured rate includes the service path.
+"""
+
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.application.services.chat_service import ChatService  # noqa: E402
+from src.domain.value_objects.user_id import UserId  # noqa: E402
+from src.infrastructure.adapters.message_repository_impl import MessageRepositoryImpl  # noqa: E402
+from src.infrastructure.adapters.write_behind_message_repository import WriteBehindMessageRepository  # noqa: E402
+
+MESSAGES = 20000
+SENDERS = 50
+ROUND_TRIP_MS = 0.5
+ROW_US = 2.0
+POOL_SIZE = 10
+
+
+class SimulatedSession:
+    """Session whose statements take a round trip plus per-row time."""
+
+    statements = 0
+
+    async def execute(self, stmt, *args, **kwargs):
+        rows = len(getattr(stmt, "_multi_values", [[None]])[0]) or 1
+        SimulatedSession.statements += 1
+        await asyncio.sleep(ROUND_TRIP_MS / 1000 + rows * ROW_US / 1_000_000)
+
+    async def commit(self):
+        pass
+
+
+pool = None
+
+
+@asynccontextmanager
+async def session_factory():
+    async with pool:
+        yield SimulatedSession()
+
+
+class PerMessageRepository(WriteBehindMessageRepository):
+    """Baseline: every message is its own INSERT and commit."""
+
+    async def save_many(self, messages):
+        async with session_factory() as session:
+            await MessageRepositoryImpl(session).save_many(messages)
+
+
+async def run(repository) -> tuple:
+    chat_service = ChatService(repository)
+    sender = UserId.generate()
+    recipient = UserId.generate()
+    SimulatedSession.statements = 0
+
+    async def send(count):
+        for i in range(count):
+            await chat_service.record_message(sender, recipient, f"message {i}")
+
+    repository.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(send(MESSAGES // SENDERS) for _ in range(SENDERS)))
+    await repository.close()
+    elapsed = time.perf_counter() - started
+    return MESSAGES / elapsed, SimulatedSession.statements
+
+
+async def main() -> None:
+    global pool
+    pool = asyncio.Semaphore(POOL_SIZE)
+    print(f"{MESSAGES} messages from {SENDERS} senders, {ROUND_TRIP_MS} ms per round trip, {POOL_SIZE} connections")
+    for name, repository in (
+        ("per-message INSERT", PerMessageRepository(session_factory)),
+        ("write-behind", WriteBehindMessageRepository(session_factory)),
+    ):
+        rate, statements = await run(repository)
+        print(f"  {name:<20} {rate:>10,.0f} msg/s  {statements:>6} statements")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark: personalized bulk email, per message vs. campaign.
+
+Part 1 times building one personalized welcome message:
+
+- f-string + MIME: the old per-message f-string and ``MIMEMultipart`` tree,
+  flattened the way ``smtplib.send_message`` does
+- compiled template: ``EmailTemplate.render`` + ``prepare_message``
+
+Part 2 sends the welcome email to ``USERS`` users streamed from an async
+generator to the in-process SMTP stand-in (``LATENCY_MS`` per reply):
+
+- per message: one ``send_email`` per user, ``POOL_SIZE`` at a time
+- batched: prepared messages sent ``BATCH_SIZE`` at a time on
+  ``POOL_SIZE`` pooled connections, the way ``EmailOutboxWorker`` delivers
+  what ``EmailCampaign`` queues
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from email.generator import BytesGenerator
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.entities.user import User  # noqa: E402
+from src.domain.value_objects.email import Email  # noqa: E402
+from src.domain.value_objects.user_id import UserId  # noqa: E402
+from src.infrastructure.external_apis.email_campaign import user_template_values  # noqa: E402
+from src.infrastructure.external_apis.email_templates import WELCOME  # noqa: E402
+from src.infrastructure.external_apis.pooled_smtp_email_service import PooledSMTPEmailService  # noqa: E402
+from src.infrastructure.external_apis.smtp_sink import LocalSMTPServer  # noqa: E402
+
+RENDERS = 20_000
+USERS = 2_000
+POOL_SIZE = 4
+BATCH_SIZE = 100
+LATENCY_MS = 0.2
+CREATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def legacy_welcome(user_name: str) -> tuple:
+    subject = "Welcome to our platform!"
+    body = f"""
+        <html>
+        <body>
+            <h2>Welcome {user_name}!</h2>
+            <p>Thank you for joining our platform. We're excited to have you on board!</p>
+            <p>If you have any questions, feel free to reach out to our support team.</p>
+            <br>
+            <p>Best regards,<br>The Team</p>
+        </body>
+        </html>
+        """
+    return subject, body
+
+
+def bench_render(sender: PooledSMTPEmailService) -> None:
+    print(f"Build {RENDERS:,} personalized messages")
+
+    started = time.perf_counter()
+    for i in range(RENDERS):
+        subject, body = legacy_welcome(f"User {i}")
+        BytesGenerator(BytesIO()).flatten(sender.build_message(f"u{i}@example.com", subject, body))
+    legacy = time.perf_counter() - started
+    print(f"  f-string + MIME      {legacy / RENDERS * 1e6:>7.1f} us/message")
+
+    started = time.perf_counter()
+    for i in range(RENDERS):
+        subject, body = WELCOME.render({"user_name": f"User {i}"})
+        sender.prepare_message(f"u{i}@example.com", subject, body)
+    compiled = time.perf_counter() - started
+    print(f"  compiled template    {compiled / RENDERS * 1e6:>7.1f} us/message  ({legacy / compiled:.1f}x)")
+
+
+async def users():
+    for i in range(USERS):
+        yield User.from_trusted(
+            id=UserId.generate(),
+            email=Email.from_string(f"user{i}@example.com"),
+            first_name="User",
+            last_name=str(i),
+            is_active=True,
+            created_at=CREATED_AT,
+            updated_at=None,
+        )
+
+
+async def per_message(sender: PooledSMTPEmailService) -> None:
+    slots = asyncio.Semaphore(POOL_SIZE)
+
+    async def send(user):
+        async with slots:
+            await sender.send_welcome_email(str(user.email), user.full_name)
+
+    await asyncio.gather(*[send(user) async for user in users()])
+
+
+async def batched(sender: PooledSMTPEmailService) -> None:
+    slots = asyncio.Semaphore(POOL_SIZE)
+
+    async def send(batch):
+        async with slots:
+            await sender.send_messages(batch)
+
+    batches, batch = [], []
+    async for user in users():
+        batch.append(sender.prepare_message(str(user.email), *WELCOME.render(user_template_values(user))))
+        if len(batch) == BATCH_SIZE:
+            batches.append(batch)
+            batch = []
+    if batch:
+        batches.append(batch)
+    await asyncio.gather(*(send(batch) for batch in batches))
+
+
+async def main() -> None:
+    with LocalSMTPServer(latency=LATENCY_MS / 1000) as server:
+        settings = ("127.0.0.1", server.port, "", "", "no-reply@example.com")
+        bench_render(PooledSMTPEmailService(*settings, starttls=False))
+
+        print(f"\nSend to {USERS:,} users, pool of {POOL_SIZE}, {LATENCY_MS} ms per reply")
+        for name, run in (("per message", per_message), ("batched", batched)):
+            sender = PooledSMTPEmailService(*settings, starttls=False, pool_size=POOL_SIZE)
+            received = len(server.messages)
+            started = time.perf_counter()
+            await run(sender)
+            elapsed = time.perf_counter() - started
+            await sender.close()
+            print(
+                f"  {name:<12} {USERS / elapsed:>8,.0f} msg/s  "
+                f"{len(server.messages) - received:>6,} delivered"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
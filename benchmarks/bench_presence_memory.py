@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Benchmark: presence registry memory and lookup cost at 100k connections."""
+
+import sys
+import timeit
+import tracemalloc
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.value_objects.user_id import UserId  # noqa: E402
+from src.presentation.websockets.presence import PresenceRegistry  # noqa: E402
+
+CONNECTIONS = 100_000
+MULTI_DEVICE_SHARE = 0.1
+
+
+def main() -> None:
+    """Run the benchmark."""
+    second_devices = int(CONNECTIONS * MULTI_DEVICE_SHARE)
+    users = [UserId.from_trusted(str(uuid.uuid4())) for _ in range(CONNECTIONS - second_devices)]
+    sids = [uuid.uuid4().hex[:20] for _ in range(CONNECTIONS)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    registry = PresenceRegistry()
+    for user_id, sid in zip(users, sids):
+        registry.add(user_id, sid)
+    for user_id, sid in zip(users, sids[len(users):]):
+        registry.add(user_id, sid)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    lookup = timeit.timeit(lambda: registry.sids(users[12345]), number=100_000) / 100_000
+
+    print(f"{CONNECTIONS} connections, {registry.online_users} users ({MULTI_DEVICE_SHARE:.0%} with two devices)")
+    print(f"  registry memory  {size / 1024 / 1024:8.2f} MiB ({size / CONNECTIONS:.0f} B/connection, ids excluded)")
+    print(f"  sids(user)       {lookup * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
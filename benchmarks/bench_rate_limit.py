@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark: per-request cost of the rate limiting middleware.
+
+Calls a no-op ASGI app directly, bare and behind ``RateLimitMiddleware``
+with the in-process backend, matching against the real application's
+routes. Clients are spread over ``CLIENTS`` addresses with buckets large
+enough that nothing is rejected.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.rate_limiting.config import RateLimitConfig  # noqa: E402
+from src.infrastructure.rate_limiting.rate_limit_backend import LocalRateLimitBackend  # noqa: E402
+from src.presentation.rest.api.app import create_app  # noqa: E402
+from src.presentation.rest.middleware.rate_limit import RateLimitMiddleware  # noqa: E402
+
+REQUESTS = 100_000
+CLIENTS = 1_000
+PATHS = ["/users/", "/users/123e4567-e89b-12d3-a456-426614174000", "/emails/status"]
+
+
+async def noop_app(scope, receive, send):
+    pass
+
+
+async def run(app) -> float:
+    scopes = [
+        {
+            "type": "http",
+            "method": "GET",
+            "path": PATHS[i % len(PATHS)],
+            "headers": [(b"host", b"localhost"), (b"accept", b"application/json")],
+            "client": (f"10.0.{i // 256 % 256}.{i % 256}", 5000),
+        }
+        for i in range(CLIENTS)
+    ]
+    started = time.perf_counter()
+    for i in range(REQUESTS):
+        await app(dict(scopes[i % CLIENTS]), None, None)
+    return (time.perf_counter() - started) / REQUESTS * 1e6
+
+
+async def main() -> None:
+    fastapi_app = create_app()
+    config = RateLimitConfig(RATE_LIMIT_RATE=1e6, RATE_LIMIT_BURST=1e6)
+    fastapi_app.state.rate_limit_backend = LocalRateLimitBackend()
+    limited = RateLimitMiddleware(noop_app, config, fastapi_app.state, fastapi_app.router.routes)
+
+    print(f"{REQUESTS:,} requests, {CLIENTS:,} clients, {len(fastapi_app.router.routes)} routes")
+    bare = await run(noop_app)
+    with_limit = await run(limited)
+    print(f"  bare          {bare:>6.2f} us/request")
+    print(f"  rate limited  {with_limit:>6.2f} us/request  (+{with_limit - bare:.2f} us)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
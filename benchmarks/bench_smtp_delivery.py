@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark: SMTP delivery throughput and event-loop stalls.
+
+Sends welcome-sized emails to the in-process SMTP stand-in, which delays
+every reply by ``LATENCY_MS`` and the greeting by ``HANDSHAKE_MS`` (standing
+in for TCP, STARTTLS and login against a remote server). Compares:
+
+- inline: a new blocking connection per message on the event loop (the old
+  ``SMTPEmailService`` behaviour)
+- thread: a new connection per message on a worker thread
+- pooled: ``PooledSMTPEmailService`` reusing persistent connections
+
+"max stall" is the longest the event loop went without running a 1 ms ticker.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.external_apis.pooled_smtp_email_service import PooledSMTPEmailService  # noqa: E402
+from src.infrastructure.external_apis.smtp_email_service import SMTPEmailService  # noqa: E402
+from src.infrastructure.external_apis.smtp_sink import LocalSMTPServer  # noqa: E402
+
+MESSAGES = 200
+CONCURRENCY = 20
+POOL_SIZE = 8
+LATENCY_MS = 1.0
+HANDSHAKE_MS = 50.0
+BODY = "<html><body><h2>Welcome!</h2><p>Thank you for joining our platform.</p></body></html>"
+
+
+class InlineSMTPEmailService(SMTPEmailService):
+    """Baseline: connects and sends on the event loop thread."""
+
+    async def send_email(self, to, subject, body, **kwargs):
+        self._send_on_new_connection(self.prepare_message(to, subject, body))
+        return True
+
+
+async def run(service) -> tuple:
+    stalls = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    queue = asyncio.Queue()
+    for i in range(MESSAGES):
+        queue.put_nowait(f"user{i}@example.com")
+
+    async def sender():
+        while not queue.empty():
+            await service.send_email(queue.get_nowait(), "Welcome to our platform!", BODY)
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(sender() for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker_task
+    return MESSAGES / elapsed, max(stalls) * 1000
+
+
+async def main() -> None:
+    print(
+        f"{MESSAGES} messages, {CONCURRENCY} concurrent senders, "
+        f"{LATENCY_MS} ms per reply, {HANDSHAKE_MS} ms handshake"
+    )
+    with LocalSMTPServer(latency=LATENCY_MS / 1000, connect_latency=HANDSHAKE_MS / 1000) as server:
+        settings = ("127.0.0.1", server.port, "", "", "no-reply@example.com")
+        for name, service in (
+            ("inline", InlineSMTPEmailService(*settings, starttls=False)),
+            ("thread", SMTPEmailService(*settings, starttls=False)),
+            (f"pooled ({POOL_SIZE})", PooledSMTPEmailService(*settings, starttls=False, pool_size=POOL_SIZE)),
+        ):
+            connections = server.connections
+            rate, stall_ms = await run(service)
+            print(
+                f"  {name:<12} {rate:>8,.0f} msg/s  max stall {stall_ms:>8.1f} ms  "
+                f"{server.connections - connections:>4} connections"
+            )
+            if isinstance(service, PooledSMTPEmailService):
+                await service.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark: cross-worker Socket.IO message latency and throughput.
+
+Two ``AsyncServer`` instances stand in for two workers. A client is attached
+to the second one and the first emits to its sid, so every message crosses
+the client manager's message queue. Transports are stubbed at the
+Engine.IO packet level, so only routing is measured.
+
+Uses the in-memory pub/sub manager by default; set
+``SOCKETIO_MESSAGE_QUEUE=redis://...`` to measure through Redis instead.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import socketio
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.messaging.config import SocketIOConfig  # noqa: E402
+from src.infrastructure.messaging.socketio_managers import create_client_manager  # noqa: E402
+
+LATENCY_MESSAGES = 2000
+THROUGHPUT_MESSAGES = 20000
+
+
+async def start_server(manager: socketio.AsyncManager, received: asyncio.Queue) -> socketio.AsyncServer:
+    """Create a server whose outgoing packets land in ``received``."""
+    server = socketio.AsyncServer(async_mode="asgi", client_manager=manager)
+
+    async def send_eio_packet(eio_sid, eio_packet):
+        received.put_nowait(time.perf_counter())
+
+    server._send_eio_packet = send_eio_packet
+    server.manager.initialize()
+    server.manager_initialized = True
+    return server
+
+
+async def run(name: str, sender_manager, receiver_manager) -> None:
+    """Measure one routing setup."""
+    received: asyncio.Queue = asyncio.Queue()
+    sender = await start_server(sender_manager, asyncio.Queue())
+    receiver = await start_server(receiver_manager, received)
+    sid = await receiver.manager.connect("eio-1", "/")
+    await asyncio.sleep(0.1)  # let pub/sub listeners subscribe
+
+    latencies = []
+    for i in range(LATENCY_MESSAGES):
+        sent = time.perf_counter()
+        await sender.emit("receive_message", {"from": "bench", "message": i}, to=sid)
+        latencies.append(await received.get() - sent)
+
+    started = time.perf_counter()
+    for i in range(THROUGHPUT_MESSAGES):
+        await sender.emit("receive_message", {"from": "bench", "message": i}, to=sid)
+    for _ in range(THROUGHPUT_MESSAGES):
+        await received.get()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"  {name:<26} p50 {statistics.median(latencies) * 1e6:8.1f} us"
+        f"  p99 {latencies[int(len(latencies) * 0.99)] * 1e6:8.1f} us"
+        f"  {THROUGHPUT_MESSAGES / elapsed:10.0f} msg/s"
+    )
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    queue_url = os.environ.get("SOCKETIO_MESSAGE_QUEUE") or "memory://"
+    config = SocketIOConfig(SOCKETIO_MESSAGE_QUEUE=queue_url, SOCKETIO_CHANNEL="bench")
+
+    print(f"emit to a sid on another server, {LATENCY_MESSAGES} sequential / {THROUGHPUT_MESSAGES} burst")
+    local = socketio.AsyncManager()
+    await run("same server (no queue)", local, local)
+    await run(f"cross server ({queue_url.split(':')[0]})", create_client_manager(config), create_client_manager(config))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
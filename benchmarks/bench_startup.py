@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Startup benchmark: import time, lifespan startup and first-request latency.
+
+Each mode runs in a fresh interpreter so import caches do not leak between
+runs. No database is needed: production mode never touches it before
+serving, and development mode's failed ``create_tables`` is part of what
+gets measured.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNS = 5
+
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+import httpx
+
+async def probe():
+    async with main.fastapi_app.router.lifespan_context(main.fastapi_app):
+        booted = time.perf_counter()
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/health")
+            assert response.status_code == 200
+        served = time.perf_counter()
+    return booted, served
+
+booted, served = asyncio.run(probe())
+print(json.dumps({
+    "import": imported - started,
+    "startup": booted - imported,
+    "first_request": served - booted,
+    "total": served - started,
+}))
+"""
+
+MODES = {
+    "development": {"APP_ENV": "development"},
+    "production": {"APP_ENV": "production"},
+    "production, no Socket.IO": {"APP_ENV": "production", "APP_SOCKETIO_ENABLED": "false"},
+}
+
+
+def run_probe(env: dict) -> dict:
+    """Run the probe once in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        env={**os.environ, "APP_LOG_LEVEL": "error", "CACHE_ENABLED": "false", **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"median of {RUNS} cold starts, ms")
+    print(f"  {'mode':<26} {'import':>8} {'startup':>8} {'1st req':>8} {'total':>8}")
+    for name, env in MODES.items():
+        runs = [run_probe(env) for _ in range(RUNS)]
+        median = {
+            key: sorted(run[key] for run in runs)[RUNS // 2] * 1000
+            for key in ("import", "startup", "first_request", "total")
+        }
+        print(
+            f"  {name:<26} {median['import']:8.1f} {median['startup']:8.1f}"
+            f" {median['first_request']:8.1f} {median['total']:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: hydrating a 1000-row user page, validated vs trusted path."""
+
+import sys
+import timeit
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.application.services.user_service import UserService  # noqa: E402
+from src.domain.entities.user import User  # noqa: E402
+from src.domain.value_objects.email import Email  # noqa: E402
+from src.domain.value_objects.user_id import UserId  # noqa: E402
+from src.infrastructure.adapters.user_repository_impl import UserRepositoryImpl  # noqa: E402
+
+PAGE_SIZE = 1000
+ROUNDS = 20
+
+
+def make_rows(count: int) -> list:
+    """Rows shaped like the users table result set."""
+    now = datetime.now(timezone.utc)
+    return [
+        SimpleNamespace(
+            id=str(uuid.uuid4()),
+            email=f"user{i}@example.com",
+            first_name="John",
+            last_name="Doe",
+            is_active=True,
+            created_at=now,
+            updated_at=None,
+        )
+        for i in range(count)
+    ]
+
+
+def validated_page(rows: list) -> list:
+    """Hydrate through the validating constructors (the pre-trusted path)."""
+    return [
+        User(
+            id=UserId.from_string(row.id),
+            email=Email.from_string(row.email),
+            first_name=row.first_name,
+            last_name=row.last_name,
+            is_active=row.is_active,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in rows
+    ]
+
+
+def trusted_page(repository: UserRepositoryImpl, rows: list) -> list:
+    """Hydrate through the repository's trusted path."""
+    return [repository._to_entity(row) for row in rows]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = make_rows(PAGE_SIZE)
+    repository = UserRepositoryImpl(session=None)
+    service = UserService(repository, user_domain_service=None)
+
+    results = {
+        "validated hydration": timeit.timeit(lambda: validated_page(rows), number=ROUNDS),
+        "trusted hydration": timeit.timeit(lambda: trusted_page(repository, rows), number=ROUNDS),
+        "validated page -> UserResponse": timeit.timeit(
+            lambda: [service._to_user_response(user) for user in validated_page(rows)], number=ROUNDS
+        ),
+        "trusted page -> UserResponse": timeit.timeit(
+            lambda: [service._to_user_response(user) for user in trusted_page(repository, rows)], number=ROUNDS
+        ),
+    }
+
+    print(f"{PAGE_SIZE}-row page, mean of {ROUNDS} rounds")
+    for name, total in results.items():
+        print(f"  {name:<32} {total / ROUNDS * 1000:8.2f} ms/page")
+    print(f"  hydration speedup: {results['validated hydration'] / results['trusted hydration']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
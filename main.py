@@ -1,37 +1,188 @@
 """Main application entry point."""
 
 import asyncio
-import uvicorn
+import contextlib
+import os
+import time
 from contextlib import asynccontextmanager
-from socketio import ASGIApp
+from src.infrastructure.cache.cache_backend import RedisCacheBackend
+from src.infrastructure.cache.config import CacheConfig
+from src.infrastructure.cache.lru_cache import LRUCache
+from src.infrastructure.cache.tiered_cache import TieredCache
 from src.infrastructure.configs.config_init import ConfigInit
 from src.infrastructure.database.connection import DatabaseConnection
 from src.infrastructure.database.config import DatabaseConfig
+from src.infrastructure.external_apis.config import EmailConfig
+from src.infrastructure.rate_limiting.config import RateLimitConfig
+from src.infrastructure.rate_limiting.rate_limit_backend import RedisRateLimitBackend
 from src.presentation.rest.api.app import create_app
-from src.presentation.websockets.websocket_server import sio
 from src.infrastructure.configs.loggers import logger, print  # or your overridden print
 
+WARM_UP_MAX_DELAY = 5.0
+
+
+async def warm_up(app, db_connection, redis_client, connections):
+    """Pre-open pooled connections, retrying until they succeed, then mark the app ready."""
+    started = time.perf_counter()
+    delay = 0.25
+    while True:
+        try:
+            await db_connection.warm_up(connections)
+            if redis_client is not None:
+                await redis_client.ping()
+            break
+        except Exception as e:
+            print(f"Warm-up failed, retrying in {delay}s: {e}", level="warn")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARM_UP_MAX_DELAY)
+    app.state.ready = True
+    logger.info("Ready", warm_up_ms=round((time.perf_counter() - started) * 1000, 1))
+
 
 @asynccontextmanager
 async def lifespan(app):
     """Application lifespan events."""
     # Startup
     print("Starting up...")
+    app.state.ready = False
+    config = ConfigInit()
     # Initialize database
     
     db_config = DatabaseConfig()
     db_connection = DatabaseConnection(db_config)
+    app.state.db_connection = db_connection
+    
+    # In production the schema is managed by Alembic migrations
+    if not config.is_production:
+        try:
+            await db_connection.create_tables_async()
+            print("Database tables created successfully")
+        except Exception as e:
+            print(f"Failed to create database tables: {e}")
+    
+    # Initialize user cache (in-process LRU, optionally backed by Redis)
+    cache_config = CacheConfig()
+    redis_client = None
+    if cache_config.enabled:
+        remote_cache = None
+        if cache_config.redis_url:
+            import redis.asyncio as redis
+
+            redis_client = redis.from_url(cache_config.redis_url)
+            remote_cache = RedisCacheBackend(redis_client)
+        app.state.user_cache = TieredCache(
+            LRUCache(maxsize=cache_config.local_maxsize, ttl=cache_config.local_ttl),
+            remote_cache,
+            remote_ttl=cache_config.remote_ttl,
+        )
+        app.state.user_cache.start()
     
-    try:
-        await db_connection.create_tables_async()
-        print("Database tables created successfully")
-    except Exception as e:
-        print(f"Failed to create database tables: {e}")
+    # Share rate limit buckets across workers through Redis when configured
+    rate_limit_config = RateLimitConfig()
+    rate_limit_redis = None
+    if rate_limit_config.enabled and rate_limit_config.redis_url:
+        if redis_client is not None and rate_limit_config.redis_url == cache_config.redis_url:
+            app.state.rate_limit_backend = RedisRateLimitBackend(redis_client)
+        else:
+            import redis.asyncio as redis
+
+            rate_limit_redis = redis.from_url(rate_limit_config.redis_url)
+            app.state.rate_limit_backend = RedisRateLimitBackend(rate_limit_redis)
+    
+    # Persist chat messages through a write-behind buffer and push outbox
+    # events (user changes) to Socket.IO rooms
+    message_repository = None
+    outbox_relay = None
+    if config.app_socketio_enabled:
+        from src.application.services.chat_service import ChatService
+        from src.infrastructure.adapters.write_behind_message_repository import WriteBehindMessageRepository
+        from src.infrastructure.messaging.config import OutboxConfig
+        from src.infrastructure.messaging.outbox import OutboxRelay
+        from src.presentation.websockets import websocket_server
+
+        socketio_config = websocket_server.socketio_config
+        if socketio_config.history_enabled:
+            message_repository = WriteBehindMessageRepository(
+                db_connection.async_session_factory,
+                max_batch=socketio_config.history_flush_size,
+                max_delay=socketio_config.history_flush_interval_ms / 1000,
+                max_pending=socketio_config.history_max_pending,
+            )
+            message_repository.start()
+            websocket_server.chat_service = ChatService(message_repository)
+        outbox_config = OutboxConfig()
+        # Only relays with a message queue, so its emits reach every worker (see relay_active)
+        if outbox_config.relay_active:
+            outbox_relay = OutboxRelay(
+                db_connection.async_session_factory,
+                websocket_server.publish_user_events,
+                batch_size=outbox_config.batch_size,
+                poll_interval=outbox_config.poll_interval_ms / 1000,
+            )
+            outbox_relay.start()
+    
+    # Deliver queued emails over pooled SMTP connections
+    email_sender = None
+    email_worker = None
+    email_config = EmailConfig()
+    if email_config.enabled:
+        from src.infrastructure.external_apis.email_outbox_worker import EmailOutboxWorker
+        from src.infrastructure.external_apis.pooled_smtp_email_service import PooledSMTPEmailService
+
+        email_sender = PooledSMTPEmailService(
+            email_config.smtp_host,
+            email_config.smtp_port,
+            email_config.smtp_username,
+            email_config.smtp_password,
+            email_config.from_email,
+            starttls=email_config.smtp_starttls,
+            timeout=email_config.smtp_timeout,
+            pool_size=email_config.smtp_pool_size,
+            max_messages_per_connection=email_config.smtp_max_messages_per_connection,
+            keepalive=email_config.smtp_keepalive_seconds,
+        )
+        email_worker = EmailOutboxWorker(
+            db_connection.async_session_factory,
+            email_sender,
+            batch_size=email_config.outbox_batch_size,
+            concurrency=email_config.outbox_concurrency,
+            max_attempts=email_config.outbox_max_attempts,
+            retry_base_delay=email_config.outbox_retry_base_seconds,
+            retry_max_delay=email_config.outbox_retry_max_seconds,
+            lease_seconds=email_config.outbox_lease_seconds,
+            poll_interval=email_config.outbox_poll_interval_ms / 1000,
+        )
+        email_worker.start()
+    
+    # Serve liveness immediately; readiness flips once the pools are warm
+    warm_up_task = asyncio.create_task(
+        warm_up(app, db_connection, redis_client, db_config.pool_warm_up)
+    )
     
     yield
     
     # Shutdown
     print("Shutting down...")
+    warm_up_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await warm_up_task
+    if email_worker is not None:
+        await email_worker.close()
+        await email_sender.close()
+    if outbox_relay is not None:
+        await outbox_relay.close()
+    if message_repository is not None:
+        websocket_server.chat_service = None
+        await message_repository.close()
+    await db_connection.dispose()
+    print("Database connections closed")
+    user_cache = getattr(app.state, "user_cache", None)
+    if user_cache is not None:
+        await user_cache.close()
+    if redis_client is not None:
+        await redis_client.aclose()
+    if rate_limit_redis is not None:
+        await rate_limit_redis.aclose()
 
 
 # Create the FastAPI app instance
@@ -40,14 +191,45 @@ fastapi_app = create_app()
 # Set the lifespan context
 fastapi_app.router.lifespan_context = lifespan
 
+
+
+def build_asgi_app(config: ConfigInit):
+    """Wrap the FastAPI app with Socket.IO when it is enabled."""
+    if not config.app_socketio_enabled:
+        return fastapi_app
+
+    from socketio import ASGIApp
+    from src.infrastructure.metrics.collectors import register_socketio_metrics
+    from src.presentation.websockets.websocket_server import connection_count, sio
+
+    register_socketio_metrics(fastapi_app.state.metrics, connection_count, lambda: sio.outbound_stats)
+    return ASGIApp(sio, other_asgi_app=fastapi_app)
+
+
 # Combine FastAPI + Socket.IO
-app = ASGIApp(sio, other_asgi_app=fastapi_app)
+app = build_asgi_app(ConfigInit())
 
 
 def main():
-    """Main function to run the application."""
+    """Main function to run the application.
+
+    Runs ``APP_WORKERS`` pre-forked uvicorn workers (the CPU count by
+    default, and a single one when Socket.IO is enabled without
+    ``SOCKETIO_MESSAGE_QUEUE``). The supervisor restarts workers that die or hit
+    ``APP_MAX_REQUESTS`` and restarts all of them gracefully on SIGHUP.
+    """
+    import uvicorn
+
     _config = ConfigInit()
     uvicorn_config = _config.uvicorn_config
+    if (_config.app_workers or 1) > uvicorn_config["workers"] and not _config.app_reload:
+        logger.warn(
+            "APP_WORKERS ignored: Socket.IO needs SOCKETIO_MESSAGE_QUEUE to run in several workers",
+            workers=_config.app_workers,
+        )
+    # Workers size their DB pools from the connection budget divided by this
+    os.environ["APP_WORKERS"] = str(uvicorn_config["workers"])
+    print(f"Starting {uvicorn_config['workers']} worker(s)", level="info")
     uvicorn.run(
         "main:app",
         **uvicorn_config,
@@ -1,13 +1,7 @@
 #!/usr/bin/env python3
 """Simple script to run the application."""
 
-import uvicorn
+from main import main
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info",
-    )
+    main()
@@ -0,0 +1,28 @@
+"""Email outbox DTOs for application layer."""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+class EmailStatusResponse(BaseModel):
+    """Response DTO for the delivery state of one queued email."""
+
+    id: str
+    to: str
+    subject: str
+    status: str
+    attempts: int
+    created_at: datetime
+    next_attempt_at: datetime
+    sent_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+
+class EmailQueueStatusResponse(BaseModel):
+    """Response DTO for the state of the email outbox."""
+
+    counts: Dict[str, int]
+    oldest_pending_at: Optional[datetime] = None
+    oldest_pending_age_seconds: Optional[float] = None
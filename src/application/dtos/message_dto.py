@@ -0,0 +1,25 @@
+"""Chat message DTOs for application layer."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class MessageResponse(BaseModel):
+    """Response DTO for a chat message."""
+
+    id: str
+    sender_id: Optional[str] = None
+    recipient_id: str
+    message: str
+    created_at: datetime
+    delivered_at: Optional[datetime] = None
+
+
+class MessageListResponse(BaseModel):
+    """Response DTO for a page of chat history."""
+
+    messages: list[MessageResponse]
+    limit: int
+    next_cursor: Optional[str] = None
@@ -1,10 +1,13 @@
 """User DTOs for application layer."""
 
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
+_object_setattr = object.__setattr__
+
 
 class CreateUserRequest(BaseModel):
     """Request DTO for creating a user."""
@@ -14,6 +17,12 @@ class CreateUserRequest(BaseModel):
     last_name: str = Field(..., min_length=1, max_length=100)
 
 
+class BulkCreateUsersRequest(BaseModel):
+    """Request DTO for creating many users at once."""
+
+    users: list[CreateUserRequest] = Field(..., min_length=1, max_length=10000)
+
+
 class UpdateUserRequest(BaseModel):
     """Request DTO for updating a user."""
 
@@ -38,11 +47,84 @@ class UserResponse(BaseModel):
         """Pydantic configuration."""
         from_attributes = True
 
+    @classmethod
+    def from_trusted(
+        cls,
+        id: str,
+        email: str,
+        first_name: str,
+        last_name: str,
+        full_name: str,
+        is_active: bool,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> "UserResponse":
+        """Build from already validated entity data without re-validating it."""
+        response = cls.__new__(cls)
+        _object_setattr(response, "__dict__", {
+            "id": id,
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "full_name": full_name,
+            "is_active": is_active,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+        _object_setattr(response, "__pydantic_fields_set__", set(_USER_RESPONSE_FIELDS))
+        _object_setattr(response, "__pydantic_extra__", None)
+        _object_setattr(response, "__pydantic_private__", None)
+        return response
+
+
+_USER_RESPONSE_FIELDS = frozenset(UserResponse.model_fields)
+
+
+class TotalMode(str, Enum):
+    """How the total of a user list is computed."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+
+
+class ExportFormat(str, Enum):
+    """Output format of a user export."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
 
 class UserListResponse(BaseModel):
     """Response DTO for user list."""
 
     users: list[UserResponse]
     total: int
+    total_estimated: bool = False
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
+
+
+class BulkItemStatus(str, Enum):
+    """Outcome of a single item in a bulk operation."""
+
+    CREATED = "created"
+    CONFLICT = "conflict"
+    INVALID = "invalid"
+
+
+class BulkCreateUserResult(BaseModel):
+    """Response DTO for one item of a bulk user creation."""
+
+    index: int
+    status: BulkItemStatus
+    user: Optional[UserResponse] = None
+    error: Optional[str] = None
+
+
+class BulkCreateUsersResponse(BaseModel):
+    """Response DTO for bulk user creation."""
+
+    results: list[BulkCreateUserResult]
+    created: int
+    failed: int
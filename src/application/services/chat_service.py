@@ -0,0 +1,73 @@
+"""Chat application service (use cases)."""
+
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from src.application.dtos.message_dto import MessageListResponse, MessageResponse
+from src.domain.entities.message import Message
+from src.domain.repositories.message_repository import MessageRepository
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.user_id import UserId
+
+
+class ChatService:
+    """Chat application service: message persistence, delivery and history."""
+
+    def __init__(self, message_repository: MessageRepository):
+        """Initialize with dependencies."""
+        self._message_repository = message_repository
+
+    async def record_message(
+        self,
+        sender_id: Optional[UserId],
+        recipient_id: UserId,
+        body: str,
+    ) -> MessageResponse:
+        """Store a message sent to a user, undelivered until acknowledged."""
+        message = Message(sender_id=sender_id, recipient_id=recipient_id, body=body)
+        await self._message_repository.save_many([message])
+        return self._to_message_response(message)
+
+    async def get_undelivered(self, recipient_id: UserId, limit: int = 500) -> List[MessageResponse]:
+        """Get the messages the recipient has not acknowledged yet, oldest first."""
+        messages = await self._message_repository.find_undelivered(recipient_id, limit)
+        return [self._to_message_response(message) for message in messages]
+
+    async def acknowledge(self, recipient_id: UserId, message_ids: List[str]) -> None:
+        """Mark messages the recipient confirmed receiving as delivered."""
+        for message_id in message_ids:
+            try:
+                uuid.UUID(message_id)
+            except (TypeError, ValueError, AttributeError):
+                raise ValueError("Invalid message id")
+        if message_ids:
+            await self._message_repository.mark_delivered(recipient_id, message_ids, datetime.now(timezone.utc))
+
+    async def get_history(self, user_id: str, limit: int = 50, cursor: Optional[str] = None) -> MessageListResponse:
+        """Get messages sent or received by a user, newest first (keyset pagination)."""
+        user_id_obj = UserId.from_string(user_id)
+        page_cursor = PageCursor.from_string(cursor) if cursor is not None else None
+        # Fetch one extra row to know whether another page exists
+        messages = await self._message_repository.find_page(user_id_obj, limit=limit + 1, cursor=page_cursor)
+        next_cursor = None
+        if len(messages) > limit:
+            messages = messages[:limit]
+            last_message = messages[-1]
+            next_cursor = str(PageCursor.after(last_message.created_at, last_message.id))
+        return MessageListResponse(
+            messages=[self._to_message_response(message) for message in messages],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+
+    def _to_message_response(self, message: Message) -> MessageResponse:
+        """Convert Message entity to MessageResponse DTO."""
+        return MessageResponse(
+            id=message.id,
+            sender_id=str(message.sender_id) if message.sender_id else None,
+            recipient_id=str(message.recipient_id),
+            message=message.body,
+            created_at=message.created_at,
+            delivered_at=message.delivered_at,
+        )
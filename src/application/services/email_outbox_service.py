@@ -0,0 +1,55 @@
+"""Email outbox application service (use cases)."""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.application.dtos.email_dto import EmailQueueStatusResponse, EmailStatusResponse
+from src.domain.entities.outbound_email import EmailStatus, OutboundEmail
+from src.domain.repositories.email_outbox_repository import EmailOutboxRepository
+
+
+class EmailOutboxService:
+    """Email outbox application service: delivery status of queued emails."""
+
+    def __init__(self, email_outbox_repository: EmailOutboxRepository):
+        """Initialize with dependencies."""
+        self._email_outbox_repository = email_outbox_repository
+
+    async def get_email(self, email_id: str) -> Optional[EmailStatusResponse]:
+        """Get the delivery state of a queued email."""
+        try:
+            uuid.UUID(email_id)
+        except ValueError:
+            raise ValueError("Invalid email ID")
+        email = await self._email_outbox_repository.find_by_id(email_id)
+        if email is None:
+            return None
+        return self._to_email_response(email)
+
+    async def get_queue_status(self) -> EmailQueueStatusResponse:
+        """Get email counts per status and the age of the oldest undelivered email."""
+        counts = await self._email_outbox_repository.count_by_status()
+        oldest_pending_at = await self._email_outbox_repository.oldest_pending_at()
+        age = None
+        if oldest_pending_at is not None:
+            age = max((datetime.now(timezone.utc) - oldest_pending_at).total_seconds(), 0.0)
+        return EmailQueueStatusResponse(
+            counts={status.value: counts.get(status, 0) for status in EmailStatus},
+            oldest_pending_at=oldest_pending_at,
+            oldest_pending_age_seconds=age,
+        )
+
+    def _to_email_response(self, email: OutboundEmail) -> EmailStatusResponse:
+        """Convert OutboundEmail entity to EmailStatusResponse DTO."""
+        return EmailStatusResponse(
+            id=email.id,
+            to=email.to,
+            subject=email.subject,
+            status=email.status.value,
+            attempts=email.attempts,
+            created_at=email.created_at,
+            next_attempt_at=email.next_attempt_at,
+            sent_at=email.sent_at,
+            last_error=email.last_error,
+        )
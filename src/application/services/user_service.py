@@ -1,13 +1,35 @@
 """User application service (use cases)."""
 
-from typing import List, Optional
+import csv
+import io
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from typing import AsyncContextManager, AsyncIterator, Dict, List, Optional, Tuple
 
 from src.domain.entities.user import User
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.repositories.unit_of_work import UnitOfWork
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.services.user_domain_service import UserDomainService
 from src.domain.value_objects.email import Email
+from src.domain.value_objects.page_cursor import PageCursor
 from src.domain.value_objects.user_id import UserId
-from src.application.dtos.user_dto import CreateUserRequest, UpdateUserRequest, UserResponse, UserListResponse
+from src.application.dtos.user_dto import (
+    BulkCreateUserResult,
+    BulkCreateUsersResponse,
+    BulkItemStatus,
+    CreateUserRequest,
+    ExportFormat,
+    TotalMode,
+    UpdateUserRequest,
+    UserResponse,
+    UserListResponse,
+)
+from src.infrastructure.configs.loggers import logger
+from src.infrastructure.external_apis.email_service import EmailService
+
+
+EXPORT_FIELDS = ["id", "email", "first_name", "last_name", "full_name", "is_active", "created_at", "updated_at"]
 
 
 class UserService:
@@ -17,32 +39,109 @@ class UserService:
         self,
         user_repository: UserRepository,
         user_domain_service: UserDomainService,
+        unit_of_work: Optional[UnitOfWork] = None,
+        optimistic_create: bool = False,
+        email_service: Optional[EmailService] = None,
     ):
-        """Initialize with dependencies."""
+        """Initialize with dependencies.
+
+        When a unit of work is given, the repository must come from it; each
+        write use case then runs in one transaction with a single commit.
+        With ``optimistic_create`` email uniqueness is left to the repository
+        (the unique index) instead of a lookup before every write.
+        An ``email_service`` sends the welcome email of created users; give
+        one that writes through the same unit of work (the email outbox) so
+        the email is queued exactly when the user is committed.
+        """
         self._user_repository = user_repository
         self._user_domain_service = user_domain_service
+        self._unit_of_work = unit_of_work
+        self._optimistic_create = optimistic_create
+        self._email_service = email_service
 
     async def create_user(self, request: CreateUserRequest) -> UserResponse:
         """Create a new user."""
-        print("Creating user ......", request)
+        logger.debug("Creating user", email=request.email)
         email = Email.from_string(request.email)
         
-        # Validate using domain service
-        await self._user_domain_service.validate_user_creation(
-            email, request.first_name, request.last_name
-        )
+        async with self._transaction():
+            # Validate using domain service
+            await self._user_domain_service.validate_user_creation(
+                email,
+                request.first_name,
+                request.last_name,
+                check_email_unique=not self._optimistic_create,
+            )
+            
+            # Create user entity
+            user = User(
+                email=email,
+                first_name=request.first_name,
+                last_name=request.last_name,
+            )
+            
+            # Save user
+            saved_user = await self._user_repository.save(user)
+            
+            if self._email_service is not None:
+                await self._email_service.send_welcome_email(str(saved_user.email), saved_user.full_name)
         
-        # Create user entity
-        user = User(
-            email=email,
-            first_name=request.first_name,
-            last_name=request.last_name,
-        )
+        return self._to_user_response(saved_user)
+
+    async def create_users_bulk(self, requests: List[CreateUserRequest]) -> BulkCreateUsersResponse:
+        """Create many users with one conflict check and batched inserts."""
+        results: List[Optional[BulkCreateUserResult]] = [None] * len(requests)
+        candidates: Dict[Email, Tuple[int, User]] = {}
         
-        # Save user
-        saved_user = await self._user_repository.save(user)
+        # Validate everything up front; invalid items never reach the database
+        for index, request in enumerate(requests):
+            try:
+                email = Email.from_string(request.email)
+                user = User(
+                    email=email,
+                    first_name=request.first_name,
+                    last_name=request.last_name,
+                )
+            except ValueError as e:
+                results[index] = BulkCreateUserResult(index=index, status=BulkItemStatus.INVALID, error=str(e))
+                continue
+            if email in candidates:
+                results[index] = BulkCreateUserResult(
+                    index=index, status=BulkItemStatus.CONFLICT, error="Duplicate email in request"
+                )
+                continue
+            candidates[email] = (index, user)
         
-        return self._to_user_response(saved_user)
+        async with self._transaction():
+            existing_emails = await self._user_repository.find_existing_emails(list(candidates))
+            pending = []
+            for email, (index, user) in candidates.items():
+                if email in existing_emails:
+                    results[index] = BulkCreateUserResult(
+                        index=index, status=BulkItemStatus.CONFLICT, error="Email already exists"
+                    )
+                else:
+                    pending.append((index, user))
+            
+            saved_users = await self._user_repository.save_many([user for _, user in pending])
+        saved_by_id = {saved_user.id: saved_user for saved_user in saved_users}
+        for index, user in pending:
+            saved_user = saved_by_id.get(user.id)
+            if saved_user is None:
+                # Lost a race with a concurrent insert of the same email
+                results[index] = BulkCreateUserResult(
+                    index=index, status=BulkItemStatus.CONFLICT, error="Email already exists"
+                )
+            else:
+                results[index] = BulkCreateUserResult(
+                    index=index, status=BulkItemStatus.CREATED, user=self._to_user_response(saved_user)
+                )
+        
+        return BulkCreateUsersResponse(
+            results=results,
+            created=len(saved_users),
+            failed=len(requests) - len(saved_users),
+        )
 
     async def get_user_by_id(self, user_id: str) -> Optional[UserResponse]:
         """Get user by ID."""
@@ -64,43 +163,98 @@ class UserService:
         
         return self._to_user_response(user)
 
-    async def get_users(self, skip: int = 0, limit: int = 100) -> UserListResponse:
-        """Get list of users with pagination."""
-        users = await self._user_repository.find_all(skip=skip, limit=limit)
+    async def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.ESTIMATED,
+    ) -> UserListResponse:
+        """Get list of users with offset or cursor (keyset) pagination."""
+        # Fetch one extra row to know whether another page exists
+        if cursor is not None:
+            page_cursor = PageCursor.from_string(cursor)
+            users = await self._user_repository.find_page(limit=limit + 1, cursor=page_cursor)
+        else:
+            users = await self._user_repository.find_all(skip=skip, limit=limit + 1)
+        
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            last_user = users[-1]
+            next_cursor = str(PageCursor.after(last_user.created_at, last_user.id))
         
         user_responses = [self._to_user_response(user) for user in users]
         
+        if total_mode == TotalMode.EXACT:
+            total, total_estimated = await self._user_repository.count(), False
+        else:
+            total, total_estimated = await self._user_repository.estimate_count()
+        
         return UserListResponse(
             users=user_responses,
-            total=len(user_responses),
+            total=total,
+            total_estimated=total_estimated,
             skip=skip,
             limit=limit,
+            next_cursor=next_cursor,
         )
 
+    async def export_users(self, export_format: ExportFormat, batch_size: int = 1000) -> AsyncIterator[str]:
+        """Export all users as NDJSON or CSV text, one chunk per batch of rows."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if export_format == ExportFormat.CSV else None
+        if writer is not None:
+            writer.writerow(EXPORT_FIELDS)
+        
+        rows = 0
+        async for user in self._user_repository.stream_all(batch_size=batch_size):
+            user_response = self._to_user_response(user)
+            if writer is not None:
+                data = user_response.model_dump(mode="json")
+                writer.writerow([data[field] for field in EXPORT_FIELDS])
+            else:
+                buffer.write(user_response.model_dump_json())
+                buffer.write("\n")
+            rows += 1
+            if rows % batch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        
+        if buffer.tell():
+            yield buffer.getvalue()
+
     async def update_user(self, user_id: str, request: UpdateUserRequest) -> Optional[UserResponse]:
         """Update user."""
         user_id_obj = UserId.from_string(user_id)
-        user = await self._user_repository.find_by_id(user_id_obj)
-        
-        if user is None:
-            return None
-        
-        # Update fields if provided
-        if request.first_name is not None or request.last_name is not None:
-            first_name = request.first_name or user.first_name
-            last_name = request.last_name or user.last_name
-            user.update_name(first_name, last_name)
-        
-        if request.email is not None:
-            email = Email.from_string(request.email)
-            # Check if email is unique (excluding current user)
-            if not await self._user_domain_service.is_email_unique(email, user_id_obj):
-                print("Email already exists")
-                raise ValueError("Email already exists")
-            user.update_email(email)
         
-        # Save updated user
-        updated_user = await self._user_repository.save(user)
+        async with self._transaction():
+            # The whole row is written back, so read it from the database (not
+            # a possibly stale cache) in the same transaction
+            user = await self._uncached_users.find_by_id(user_id_obj)
+            
+            if user is None:
+                return None
+            
+            # Update fields if provided
+            if request.first_name is not None or request.last_name is not None:
+                first_name = request.first_name or user.first_name
+                last_name = request.last_name or user.last_name
+                user.update_name(first_name, last_name)
+            
+            if request.email is not None:
+                email = Email.from_string(request.email)
+                # Check if email is unique (excluding current user)
+                if not self._optimistic_create and not await self._user_domain_service.is_email_unique(
+                    email, user_id_obj
+                ):
+                    logger.debug("Email already exists", user_id=user_id)
+                    raise EmailAlreadyExistsError()
+                user.update_email(email)
+            
+            # Save updated user
+            updated_user = await self._user_repository.save(user)
         
         return self._to_user_response(updated_user)
 
@@ -108,41 +262,53 @@ class UserService:
         """Delete user."""
         user_id_obj = UserId.from_string(user_id)
         
-        # Check if user can be deleted
-        if not await self._user_domain_service.can_user_be_deleted(user_id_obj):
-            raise ValueError("User cannot be deleted")
-        
-        return await self._user_repository.delete(user_id_obj)
+        async with self._transaction():
+            # Check if user can be deleted
+            if not await self._user_domain_service.can_user_be_deleted(user_id_obj):
+                raise ValueError("User cannot be deleted")
+            
+            return await self._user_repository.delete(user_id_obj)
 
     async def activate_user(self, user_id: str) -> Optional[UserResponse]:
         """Activate user."""
-        user_id_obj = UserId.from_string(user_id)
-        user = await self._user_repository.find_by_id(user_id_obj)
-        
-        if user is None:
-            return None
-        
-        user.activate()
-        updated_user = await self._user_repository.save(user)
-        
-        return self._to_user_response(updated_user)
+        return await self._set_user_status(user_id, is_active=True)
 
     async def deactivate_user(self, user_id: str) -> Optional[UserResponse]:
         """Deactivate user."""
+        return await self._set_user_status(user_id, is_active=False)
+
+    @property
+    def _uncached_users(self) -> UserRepository:
+        """Repository reading straight from the database."""
+        if self._unit_of_work is not None:
+            return self._unit_of_work.users
+        return self._user_repository
+
+    async def _set_user_status(self, user_id: str, is_active: bool) -> Optional[UserResponse]:
+        """Change a user's active flag in a single repository call."""
         user_id_obj = UserId.from_string(user_id)
-        user = await self._user_repository.find_by_id(user_id_obj)
+        async with self._transaction():
+            updated_user = await self._user_repository.update_status(
+                user_id_obj, is_active, datetime.now(timezone.utc)
+            )
         
-        if user is None:
+        if updated_user is None:
             return None
         
-        user.deactivate()
-        updated_user = await self._user_repository.save(user)
-        
         return self._to_user_response(updated_user)
 
+    def _transaction(self) -> AsyncContextManager:
+        """Transaction boundary for a write use case."""
+        if self._unit_of_work is None:
+            return nullcontext()
+        return self._unit_of_work
+
     def _to_user_response(self, user: User) -> UserResponse:
-        """Convert User entity to UserResponse DTO."""
-        return UserResponse(
+        """Convert User entity to UserResponse DTO.
+
+        Entities are valid by construction, so the DTO skips re-validation.
+        """
+        return UserResponse.from_trusted(
             id=str(user.id),
             email=str(user.email),
             first_name=user.first_name,
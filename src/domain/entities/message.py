@@ -0,0 +1,75 @@
+"""Chat message domain entity."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from src.domain.value_objects.user_id import UserId
+
+_object_setattr = object.__setattr__
+
+
+class Message(BaseModel):
+    """Chat message addressed to a user."""
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    sender_id: Optional[UserId] = Field(default=None)
+    recipient_id: UserId
+    body: str = Field(..., min_length=1, max_length=4000)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    delivered_at: Optional[datetime] = Field(default=None)
+
+    @field_validator("body")
+    @classmethod
+    def validate_body(cls, v: str) -> str:
+        """Reject characters text columns cannot store."""
+        if "\x00" in v:
+            raise ValueError("Message cannot contain NUL characters")
+        return v
+
+    @property
+    def is_delivered(self) -> bool:
+        """Whether the recipient has received the message."""
+        return self.delivered_at is not None
+
+    def mark_delivered(self, delivered_at: Optional[datetime] = None) -> None:
+        """Record delivery to the recipient."""
+        self.delivered_at = delivered_at or datetime.now(timezone.utc)
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"Message(id={self.id}, from={self.sender_id}, to={self.recipient_id})"
+
+    @classmethod
+    def from_trusted(
+        cls,
+        id: str,
+        sender_id: Optional[UserId],
+        recipient_id: UserId,
+        body: str,
+        created_at: datetime,
+        delivered_at: Optional[datetime],
+    ) -> Message:
+        """Rebuild a persisted message without re-running field validation."""
+        message = cls.__new__(cls)
+        _object_setattr(message, "__dict__", {
+            "id": id,
+            "sender_id": sender_id,
+            "recipient_id": recipient_id,
+            "body": body,
+            "created_at": created_at,
+            "delivered_at": delivered_at,
+        })
+        _object_setattr(message, "__pydantic_fields_set__", set(_MESSAGE_FIELDS))
+        _object_setattr(message, "__pydantic_extra__", None)
+        _object_setattr(message, "__pydantic_private__", None)
+        return message
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+_MESSAGE_FIELDS = frozenset(Message.model_fields)
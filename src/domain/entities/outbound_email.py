@@ -0,0 +1,69 @@
+"""Outbound email domain entity."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class EmailStatus(str, Enum):
+    """Delivery state of an outbound email."""
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+
+
+class OutboundEmail(BaseModel):
+    """Email queued for delivery, with its retry state."""
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    to: str = Field(..., min_length=1, max_length=255)
+    subject: str = Field(..., max_length=998)
+    body: str
+    status: EmailStatus = Field(default=EmailStatus.PENDING)
+    attempts: int = Field(default=0, ge=0)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    next_attempt_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    sent_at: Optional[datetime] = Field(default=None)
+    last_error: Optional[str] = Field(default=None)
+    # Queued at most once per key (e.g. one campaign email per user)
+    dedup_key: Optional[str] = Field(default=None, max_length=255)
+
+    def record_sent(self, sent_at: datetime) -> None:
+        """Record a successful delivery."""
+        self.status = EmailStatus.SENT
+        self.sent_at = sent_at
+        self.last_error = None
+
+    def record_rejected(self, error: str) -> None:
+        """Give up at once on an email that can never be delivered."""
+        self.status = EmailStatus.DEAD
+        self.last_error = error[:1000]
+
+    def record_failure(
+        self,
+        error: str,
+        failed_at: datetime,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+    ) -> None:
+        """Schedule a retry with exponential backoff, or give up after ``max_attempts``.
+
+        The delay doubles with every attempt up to ``max_delay``; a random
+        factor of 0.5-1 spreads retries of emails that failed together.
+        """
+        self.last_error = error[:1000]
+        if self.attempts >= max_attempts:
+            self.status = EmailStatus.DEAD
+            return
+        delay = min(base_delay * 2 ** max(self.attempts - 1, 0), max_delay)
+        self.status = EmailStatus.PENDING
+        self.next_attempt_at = failed_at + timedelta(seconds=delay * random.uniform(0.5, 1.0))
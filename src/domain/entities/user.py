@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
+from src.domain.events.domain_event import DomainEvent
+from src.domain.events.user_events import (
+    UserActivated,
+    UserDeactivated,
+    UserEmailChanged,
+    UserNameChanged,
+)
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.user_id import UserId
 
+_object_setattr = object.__setattr__
+
 
 class User(BaseModel):
     """User domain entity."""
@@ -22,6 +31,9 @@ class User(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime] = Field(default=None)
 
+    # Events recorded by state changes, until a repository pulls them
+    _events: List[DomainEvent] = PrivateAttr(default_factory=list)
+
     @property
     def full_name(self) -> str:
         """Get user's full name."""
@@ -31,11 +43,13 @@ class User(BaseModel):
         """Activate the user."""
         self.is_active = True
         self.updated_at = datetime.now(timezone.utc)
+        self._record(UserActivated(aggregate_id=str(self.id), occurred_at=self.updated_at))
 
     def deactivate(self) -> None:
         """Deactivate the user."""
         self.is_active = False
         self.updated_at = datetime.now(timezone.utc)
+        self._record(UserDeactivated(aggregate_id=str(self.id), occurred_at=self.updated_at))
 
     def update_name(self, first_name: str, last_name: str) -> None:
         """Update user's name."""
@@ -45,14 +59,71 @@ class User(BaseModel):
         self.first_name = first_name
         self.last_name = last_name
         self.updated_at = datetime.now(timezone.utc)
+        self._record(UserNameChanged(
+            aggregate_id=str(self.id),
+            occurred_at=self.updated_at,
+            first_name=first_name,
+            last_name=last_name,
+        ))
 
     def update_email(self, email: Email) -> None:
         """Update user's email."""
         self.email = email
         self.updated_at = datetime.now(timezone.utc)
+        self._record(UserEmailChanged(aggregate_id=str(self.id), occurred_at=self.updated_at, email=str(email)))
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Return the events recorded so far and forget them."""
+        if not self.__pydantic_private__:
+            return []
+        events = self._events
+        self._events = []
+        return events
+
+    def _record(self, event: DomainEvent) -> None:
+        """Record a domain event for the repository to persist."""
+        if self.__pydantic_private__ is None:
+            # Users rebuilt by from_trusted get their event list on first use
+            _object_setattr(self, "__pydantic_private__", {"_events": []})
+        self._events.append(event)
 
     def __str__(self) -> str:
         """String representation."""
         return f"User(id={self.id}, email={self.email}, name={self.full_name})"
 
+    @classmethod
+    def from_trusted(
+        cls,
+        id: UserId,
+        email: Email,
+        first_name: str,
+        last_name: str,
+        is_active: bool,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> User:
+        """Rebuild a persisted user without re-running field validation.
+
+        Sets the model state directly, as ``model_construct`` does, minus its
+        per-field default handling, which makes it slower than validating.
+        """
+        user = cls.__new__(cls)
+        _object_setattr(user, "__dict__", {
+            "id": id,
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "is_active": is_active,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
+        _object_setattr(user, "__pydantic_fields_set__", set(_USER_FIELDS))
+        _object_setattr(user, "__pydantic_extra__", None)
+        _object_setattr(user, "__pydantic_private__", None)
+        return user
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+# Resolved once: reading model_fields costs about as much as building a user
+_USER_FIELDS = frozenset(User.model_fields)
@@ -0,0 +1,28 @@
+"""Domain event base type."""
+
+import dataclasses
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, ClassVar, Dict
+
+_BASE_FIELDS = frozenset(("event_id", "aggregate_id", "occurred_at"))
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """Something that happened to an aggregate."""
+
+    name: ClassVar[str] = "domain_event"
+
+    aggregate_id: str
+    occurred_at: datetime
+    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    def payload(self) -> Dict[str, Any]:
+        """Event-specific fields, JSON serializable."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in dataclasses.fields(self)
+            if f.name not in _BASE_FIELDS
+        }
@@ -0,0 +1,46 @@
+"""User domain events."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import ClassVar
+
+from .domain_event import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserActivated(DomainEvent):
+    """A user was activated."""
+
+    name: ClassVar[str] = "user.activated"
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserDeactivated(DomainEvent):
+    """A user was deactivated."""
+
+    name: ClassVar[str] = "user.deactivated"
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserNameChanged(DomainEvent):
+    """A user's name changed."""
+
+    name: ClassVar[str] = "user.name_changed"
+
+    first_name: str
+    last_name: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserEmailChanged(DomainEvent):
+    """A user's email changed."""
+
+    name: ClassVar[str] = "user.email_changed"
+
+    email: str
+
+
+def user_status_changed(user_id: str, is_active: bool, occurred_at: datetime) -> DomainEvent:
+    """Event for a user's active flag being set to ``is_active``."""
+    event_type = UserActivated if is_active else UserDeactivated
+    return event_type(aggregate_id=user_id, occurred_at=occurred_at)
@@ -0,0 +1,9 @@
+"""Domain exceptions."""
+
+
+class EmailAlreadyExistsError(ValueError):
+    """Raised when an email is already used by another user."""
+
+    def __init__(self, message: str = "Email already exists"):
+        """Initialize with a default message."""
+        super().__init__(message)
@@ -0,0 +1,50 @@
+"""Email outbox repository interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..entities.outbound_email import EmailStatus, OutboundEmail
+
+
+class EmailOutboxRepository(ABC):
+    """Abstract email outbox repository interface."""
+
+    @abstractmethod
+    async def add(self, email: OutboundEmail) -> OutboundEmail:
+        """Queue an email for delivery."""
+        pass
+
+    @abstractmethod
+    async def add_many(self, emails: List[OutboundEmail]) -> List[OutboundEmail]:
+        """Queue emails, skipping those whose dedup key is already queued; return the queued ones."""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, email_id: str) -> Optional[OutboundEmail]:
+        """Find a queued email by ID."""
+        pass
+
+    @abstractmethod
+    async def count_by_status(self) -> Dict[EmailStatus, int]:
+        """Count emails per delivery status."""
+        pass
+
+    @abstractmethod
+    async def oldest_pending_at(self) -> Optional[datetime]:
+        """Creation time of the oldest email not yet sent or dead."""
+        pass
+
+    @abstractmethod
+    async def claim_due(self, limit: int, now: datetime, lease_seconds: float) -> List[OutboundEmail]:
+        """Take emails due for an attempt, counting the attempt.
+
+        Claimed emails are hidden from other callers for ``lease_seconds``;
+        after that they are due again in case their sender died.
+        """
+        pass
+
+    @abstractmethod
+    async def save_results(self, emails: List[OutboundEmail]) -> None:
+        """Store the outcome of delivery attempts."""
+        pass
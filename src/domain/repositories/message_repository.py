@@ -0,0 +1,33 @@
+"""Chat message repository interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from ..entities.message import Message
+from ..value_objects.page_cursor import PageCursor
+from ..value_objects.user_id import UserId
+
+
+class MessageRepository(ABC):
+    """Abstract chat message repository interface."""
+
+    @abstractmethod
+    async def save_many(self, messages: List[Message]) -> None:
+        """Store new messages."""
+        pass
+
+    @abstractmethod
+    async def mark_delivered(self, recipient_id: UserId, message_ids: List[str], delivered_at: datetime) -> None:
+        """Record that the recipient received the given messages."""
+        pass
+
+    @abstractmethod
+    async def find_undelivered(self, recipient_id: UserId, limit: int = 500) -> List[Message]:
+        """Find messages the recipient has not received yet, oldest first."""
+        pass
+
+    @abstractmethod
+    async def find_page(self, user_id: UserId, limit: int = 50, cursor: Optional[PageCursor] = None) -> List[Message]:
+        """Find messages sent or received by the user after the cursor, newest first."""
+        pass
@@ -0,0 +1,69 @@
+"""Unit of work interface."""
+
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Awaitable, Callable, List, Optional, Type
+
+from .email_outbox_repository import EmailOutboxRepository
+from .user_repository import UserRepository
+
+
+class UnitOfWork(ABC):
+    """Abstract unit of work spanning several repository calls.
+
+    Repositories obtained from a unit of work never commit on their own.
+    Entering the unit of work opens a transaction boundary; only the
+    outermost ``async with`` commits, so use cases can be nested and grouped
+    into a single transaction. Any exception rolls the whole transaction back.
+    Callbacks registered with ``after_commit`` run once the outermost block
+    has committed, and are dropped on rollback.
+    """
+
+    users: UserRepository
+    emails: EmailOutboxRepository
+
+    def __init__(self) -> None:
+        """Initialize nesting state."""
+        self._depth = 0
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction boundary is currently open."""
+        return self._depth > 0
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` after the current transaction commits."""
+        self._after_commit.append(callback)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        """Open (or join) the transaction."""
+        self._depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Commit at the outermost boundary, roll back on error."""
+        self._depth -= 1
+        if exc_type is not None:
+            self._after_commit.clear()
+            await self.rollback()
+        elif self._depth == 0:
+            await self.commit()
+            callbacks, self._after_commit = self._after_commit, []
+            for callback in callbacks:
+                await callback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the current transaction."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Roll back the current transaction."""
+        pass
@@ -1,10 +1,12 @@
 """User repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Set, Tuple
 
 from ..entities.user import User
 from ..value_objects.email import Email
+from ..value_objects.page_cursor import PageCursor
 from ..value_objects.user_id import UserId
 
 
@@ -16,6 +18,16 @@ class UserRepository(ABC):
         """Save a user."""
         pass
 
+    @abstractmethod
+    async def update_status(self, user_id: UserId, is_active: bool, updated_at: datetime) -> Optional[User]:
+        """Set a user's active flag; return the updated user or None if missing."""
+        pass
+
+    @abstractmethod
+    async def save_many(self, users: List[User]) -> List[User]:
+        """Insert new users, skipping any that conflict; return those inserted."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, user_id: UserId) -> Optional[User]:
         """Find user by ID."""
@@ -31,6 +43,26 @@ class UserRepository(ABC):
         """Find all users with pagination."""
         pass
 
+    @abstractmethod
+    async def find_page(self, limit: int = 100, cursor: Optional[PageCursor] = None) -> List[User]:
+        """Find users after the cursor, newest first (keyset pagination)."""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Iterate over all users, newest first, without loading them all at once."""
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Count all users exactly."""
+        pass
+
+    @abstractmethod
+    async def estimate_count(self) -> Tuple[int, bool]:
+        """Cheaply estimate the number of users; also tell whether the count is an estimate."""
+        pass
+
     @abstractmethod
     async def delete(self, user_id: UserId) -> bool:
         """Delete a user by ID."""
@@ -40,3 +72,8 @@ class UserRepository(ABC):
     async def exists_by_email(self, email: Email) -> bool:
         """Check if user exists by email."""
         pass
+
+    @abstractmethod
+    async def find_existing_emails(self, emails: List[Email]) -> Set[Email]:
+        """Return the subset of emails already used by some user."""
+        pass
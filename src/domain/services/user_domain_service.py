@@ -3,6 +3,7 @@
 from typing import Optional
 
 from src.domain.entities.user import User
+from src.domain.exceptions import EmailAlreadyExistsError
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.user_id import UserId
@@ -39,10 +40,16 @@ class UserDomainService:
         # For now, we'll allow deletion of any existing user
         return True
 
-    async def validate_user_creation(self, email: Email, first_name: str, last_name: str) -> None:
-        """Validate user creation data."""
+    async def validate_user_creation(
+        self, email: Email, first_name: str, last_name: str, check_email_unique: bool = True
+    ) -> None:
+        """Validate user creation data.
+
+        Pass ``check_email_unique=False`` when the repository enforces email
+        uniqueness on insert and raises ``EmailAlreadyExistsError`` itself.
+        """
         if not first_name or not last_name:
             raise ValueError("First name and last name are required")
         
-        if not await self.is_email_unique(email):
-            raise ValueError("Email already exists")
+        if check_email_unique and not await self.is_email_unique(email):
+            raise EmailAlreadyExistsError()
@@ -5,35 +5,62 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+# Basic email regex pattern, compiled once
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+EMAIL_MAX_LENGTH = 255
 
 
-class Email(BaseModel):
-    """Email value object with validation."""
+class Email:
+    """Email value object with validation.
 
-    value: str = Field(..., max_length=255)
+    Immutable and slotted; ``from_trusted`` skips validation for values that
+    were already validated before being persisted.
+    """
 
-    @field_validator("value")
-    @classmethod
-    def validate_email(cls, v: str) -> str:
+    __slots__ = ("value",)
+
+    value: str
+
+    def __init__(self, value: str):
+        """Create a validated, normalized email."""
+        object.__setattr__(self, "value", self.validate_email(value))
+
+    @staticmethod
+    def validate_email(v: str) -> str:
         """Validate email format."""
+        if not isinstance(v, str):
+            raise ValueError("Email must be a string")
+        
         # Normalize first (trim and lowercase)
         normalized = v.strip().lower()
         
         if not normalized:
             raise ValueError("Email cannot be empty")
         
-        # Basic email regex pattern
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, normalized):
+        if len(normalized) > EMAIL_MAX_LENGTH:
+            raise ValueError(f"Email cannot be longer than {EMAIL_MAX_LENGTH} characters")
+        
+        if not EMAIL_PATTERN.match(normalized):
             raise ValueError("Invalid email format")
         
         return normalized
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent mutation."""
+        raise AttributeError("Email is immutable")
+
+    def __reduce__(self) -> tuple:
+        """Support copy and pickle despite immutability."""
+        return (self.__class__.from_trusted, (self.value,))
+
     def __str__(self) -> str:
         """String representation."""
         return self.value
 
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"Email(value={self.value!r})"
+
     def __eq__(self, other: Any) -> bool:
         """Equality comparison."""
         if not isinstance(other, Email):
@@ -47,4 +74,11 @@ class Email(BaseModel):
     @classmethod
     def from_string(cls, email_str: str) -> Email:
         """Create Email from string."""
-        return cls(value=email_str)
+        return cls(email_str)
+
+    @classmethod
+    def from_trusted(cls, email_str: str) -> Email:
+        """Create Email from an already validated, normalized string."""
+        email = cls.__new__(cls)
+        object.__setattr__(email, "value", email_str)
+        return email
@@ -0,0 +1,53 @@
+"""Page cursor value object."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class PageCursor(BaseModel):
+    """Position in a list ordered by ``(created_at DESC, id DESC)``.
+
+    Clients only ever see the opaque string form produced by ``__str__``.
+    """
+
+    created_at: datetime
+    id: str
+
+    def __str__(self) -> str:
+        """Opaque, URL-safe string representation."""
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def __eq__(self, other: Any) -> bool:
+        """Equality comparison."""
+        if not isinstance(other, PageCursor):
+            return False
+        return self.created_at == other.created_at and self.id == other.id
+
+    def __hash__(self) -> int:
+        """Hash for use in sets and dicts."""
+        return hash((self.created_at, self.id))
+
+    @classmethod
+    def from_string(cls, cursor_str: str) -> PageCursor:
+        """Decode a cursor produced by ``__str__``."""
+        try:
+            padded = cursor_str + "=" * (-len(cursor_str) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            created_at_str, id_str = raw.split("|", 1)
+            uuid.UUID(id_str)
+            return cls(created_at=datetime.fromisoformat(created_at_str), id=id_str)
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            raise ValueError("Invalid cursor")
+
+    @classmethod
+    def after(cls, created_at: datetime, item_id: Any) -> PageCursor:
+        """Create a cursor pointing just past the given item."""
+        return cls(created_at=created_at, id=str(item_id))
@@ -5,28 +5,49 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
 
+class UserId:
+    """User ID value object.
 
-class UserId(BaseModel):
-    """User ID value object."""
+    Immutable and slotted; ``from_trusted`` skips UUID parsing for IDs read
+    back from storage.
+    """
 
-    value: str = Field(..., min_length=1)
+    __slots__ = ("value",)
 
-    @field_validator("value")
-    @classmethod
-    def validate_uuid(cls, v: str) -> str:
+    value: str
+
+    def __init__(self, value: str):
+        """Create a validated user ID."""
+        object.__setattr__(self, "value", self.validate_uuid(value))
+
+    @staticmethod
+    def validate_uuid(v: str) -> str:
         """Validate UUID format."""
+        if not isinstance(v, str) or not v:
+            raise ValueError("Invalid UUID format")
         try:
             uuid.UUID(v)
             return v
         except ValueError:
             raise ValueError("Invalid UUID format")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent mutation."""
+        raise AttributeError("UserId is immutable")
+
+    def __reduce__(self) -> tuple:
+        """Support copy and pickle despite immutability."""
+        return (self.__class__.from_trusted, (self.value,))
+
     def __str__(self) -> str:
         """String representation."""
         return self.value
 
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"UserId(value={self.value!r})"
+
     def __eq__(self, other: Any) -> bool:
         """Equality comparison."""
         if not isinstance(other, UserId):
@@ -40,9 +61,16 @@ class UserId(BaseModel):
     @classmethod
     def generate(cls) -> UserId:
         """Generate a new UserId."""
-        return cls(value=str(uuid.uuid4()))
+        return cls.from_trusted(str(uuid.uuid4()))
 
     @classmethod
     def from_string(cls, user_id_str: str) -> UserId:
         """Create UserId from string."""
-        return cls(value=user_id_str)
+        return cls(user_id_str)
+
+    @classmethod
+    def from_trusted(cls, user_id_str: str) -> UserId:
+        """Create UserId from an already validated string."""
+        user_id = cls.__new__(cls)
+        object.__setattr__(user_id, "value", user_id_str)
+        return user_id
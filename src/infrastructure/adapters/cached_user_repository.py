@@ -0,0 +1,167 @@
+"""Caching user repository decorator."""
+
+import json
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+from src.domain.entities.user import User
+from src.domain.repositories.unit_of_work import UnitOfWork
+from src.domain.repositories.user_repository import UserRepository
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.cache.tiered_cache import TieredCache
+
+
+class CachedUserRepository(UserRepository):
+    """Read-through cache for user lookups by ID and email.
+
+    Users are cached under their ID; email keys only point at an ID and are
+    verified against the cached user, so an email change never needs the old
+    address to invalidate correctly. Writes invalidate the affected ID, and
+    an ID is only filled if it was not invalidated while the row was read.
+
+    With a unit of work, a write made inside its transaction is invalidated
+    after the commit, so no other request can cache the old row again in
+    between; until then the written users bypass the cache, so uncommitted
+    rows are never cached.
+    """
+
+    def __init__(self, repository: UserRepository, cache: TieredCache, unit_of_work: Optional[UnitOfWork] = None):
+        """Initialize with the wrapped repository, cache and the repository's unit of work."""
+        self._repository = repository
+        self._cache = cache
+        self._unit_of_work = unit_of_work
+        self._uncommitted: Set[str] = set()
+
+    async def save(self, user: User) -> User:
+        """Save a user and invalidate its cache entry."""
+        saved_user = await self._repository.save(user)
+        await self._invalidate(self._id_key(saved_user.id))
+        return saved_user
+
+    async def update_status(self, user_id: UserId, is_active: bool, updated_at: datetime) -> Optional[User]:
+        """Set a user's active flag and invalidate its cache entry."""
+        updated_user = await self._repository.update_status(user_id, is_active, updated_at)
+        await self._invalidate(self._id_key(user_id))
+        return updated_user
+
+    async def save_many(self, users: List[User]) -> List[User]:
+        """Insert new users (nothing cached yet for them)."""
+        return await self._repository.save_many(users)
+
+    async def find_by_id(self, user_id: UserId) -> Optional[User]:
+        """Find user by ID, from cache when possible."""
+        id_key = self._id_key(user_id)
+        if id_key in self._uncommitted:
+            return await self._repository.find_by_id(user_id)
+        cached = await self._cache.get(id_key)
+        if cached is not None:
+            return self._deserialize(cached)
+
+        version = await self._cache.version(id_key)
+        user = await self._repository.find_by_id(user_id)
+        if user is not None and id_key not in self._uncommitted:
+            await self._cache.fill(id_key, self._serialize(user), version)
+            await self._cache.set(self._email_key(user.email), str(user.id).encode())
+        return user
+
+    async def find_by_email(self, email: Email) -> Optional[User]:
+        """Find user by email, from cache when possible."""
+        cached_id = await self._cache.get(self._email_key(email))
+        if cached_id is not None:
+            user = await self.find_by_id(UserId.from_trusted(cached_id.decode()))
+            if user is not None and user.email == email:
+                return user
+
+        # The ID is unknown before this read, so only the email key is cached;
+        # the next lookup fills the user through ``find_by_id``
+        user = await self._repository.find_by_email(email)
+        if user is not None:
+            await self._cache.set(self._email_key(email), str(user.id).encode())
+        return user
+
+    async def find_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """Find all users with pagination."""
+        return await self._repository.find_all(skip=skip, limit=limit)
+
+    async def find_page(self, limit: int = 100, cursor: Optional[PageCursor] = None) -> List[User]:
+        """Find users after the cursor, newest first (keyset pagination)."""
+        return await self._repository.find_page(limit=limit, cursor=cursor)
+
+    def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Iterate over all users."""
+        return self._repository.stream_all(batch_size=batch_size)
+
+    async def count(self) -> int:
+        """Count all users exactly."""
+        return await self._repository.count()
+
+    async def estimate_count(self) -> Tuple[int, bool]:
+        """Cheaply estimate the number of users; also tell whether the count is an estimate."""
+        return await self._repository.estimate_count()
+
+    async def delete(self, user_id: UserId) -> bool:
+        """Delete a user and invalidate its cache entry."""
+        deleted = await self._repository.delete(user_id)
+        await self._invalidate(self._id_key(user_id))
+        return deleted
+
+    async def exists_by_email(self, email: Email) -> bool:
+        """Check if user exists by email."""
+        return await self._repository.exists_by_email(email)
+
+    async def find_existing_emails(self, emails: List[Email]) -> Set[Email]:
+        """Return the subset of emails already used by some user."""
+        return await self._repository.find_existing_emails(emails)
+
+    async def _invalidate(self, key: str) -> None:
+        """Drop a cache entry, after the commit when inside a transaction."""
+        if self._unit_of_work is None or not self._unit_of_work.in_transaction:
+            await self._cache.delete(key)
+            return
+        if key not in self._uncommitted:
+            self._uncommitted.add(key)
+            self._unit_of_work.after_commit(lambda: self._committed(key))
+
+    async def _committed(self, key: str) -> None:
+        """Drop a cache entry once its write has committed."""
+        self._uncommitted.discard(key)
+        await self._cache.delete(key)
+
+    @staticmethod
+    def _id_key(user_id: object) -> str:
+        """Cache key of a user by ID."""
+        return f"user:id:{user_id}"
+
+    @staticmethod
+    def _email_key(email: Email) -> str:
+        """Cache key of a user ID by email."""
+        return f"user:email:{email}"
+
+    @staticmethod
+    def _serialize(user: User) -> bytes:
+        """Encode a user for caching."""
+        return json.dumps([
+            str(user.id),
+            str(user.email),
+            user.first_name,
+            user.last_name,
+            user.is_active,
+            user.created_at.isoformat(),
+            user.updated_at.isoformat() if user.updated_at else None,
+        ]).encode()
+
+    @staticmethod
+    def _deserialize(data: bytes) -> User:
+        """Decode a cached user into a fresh entity."""
+        user_id, email, first_name, last_name, is_active, created_at, updated_at = json.loads(data)
+        return User.from_trusted(
+            id=UserId.from_trusted(user_id),
+            email=Email.from_trusted(email),
+            first_name=first_name,
+            last_name=last_name,
+            is_active=is_active,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        )
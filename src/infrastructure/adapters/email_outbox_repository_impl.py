@@ -0,0 +1,171 @@
+"""Email outbox repository implementation."""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.outbound_email import EmailStatus, OutboundEmail
+from src.domain.repositories.email_outbox_repository import EmailOutboxRepository
+from src.infrastructure.database.models.email_outbox_model import EmailOutboxModel
+
+email_outbox_table = EmailOutboxModel.__table__
+
+_DUE_STATUSES = (EmailStatus.PENDING.value, EmailStatus.SENDING.value)
+
+
+class EmailOutboxRepositoryImpl(EmailOutboxRepository):
+    """Email outbox repository implementation using SQLAlchemy."""
+
+    # Rows per multi-row INSERT, keeping bind parameters well under the 32767 limit
+    BULK_INSERT_CHUNK_SIZE = 1000
+
+    def __init__(self, session: AsyncSession, autocommit: bool = True):
+        """Initialize with database session.
+
+        With ``autocommit=False`` the repository leaves transaction control
+        to a unit of work.
+        """
+        self._session = session
+        self._autocommit = autocommit
+
+    async def add(self, email: OutboundEmail) -> OutboundEmail:
+        """Queue an email for delivery with a single INSERT."""
+        await self._session.execute(insert(email_outbox_table).values(self._to_row(email)))
+        await self._commit()
+        return email
+
+    async def add_many(self, emails: List[OutboundEmail]) -> List[OutboundEmail]:
+        """Queue emails with multi-row INSERTs, skipping dedup keys already queued."""
+        queued: List[OutboundEmail] = []
+        for start in range(0, len(emails), self.BULK_INSERT_CHUNK_SIZE):
+            chunk = emails[start:start + self.BULK_INSERT_CHUNK_SIZE]
+            stmt = (
+                insert(email_outbox_table)
+                .values([self._to_row(email) for email in chunk])
+                .on_conflict_do_nothing(index_elements=[email_outbox_table.c.dedup_key])
+                .returning(email_outbox_table.c.id)
+            )
+            result = await self._session.execute(stmt)
+            inserted_ids = set(result.scalars())
+            queued.extend(email for email in chunk if email.id in inserted_ids)
+        await self._commit()
+        return queued
+
+    async def find_by_id(self, email_id: str) -> Optional[OutboundEmail]:
+        """Find a queued email by ID."""
+        stmt = select(*email_outbox_table.c).where(email_outbox_table.c.id == email_id)
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        return self._to_entity(row) if row else None
+
+    async def count_by_status(self) -> Dict[EmailStatus, int]:
+        """Count emails per delivery status."""
+        stmt = select(email_outbox_table.c.status, func.count()).group_by(email_outbox_table.c.status)
+        result = await self._session.execute(stmt)
+        counts = {status: 0 for status in EmailStatus}
+        for status, count in result:
+            counts[EmailStatus(status)] = count
+        return counts
+
+    async def oldest_pending_at(self) -> Optional[datetime]:
+        """Creation time of the oldest email not yet sent or dead."""
+        stmt = select(func.min(email_outbox_table.c.created_at)).where(
+            email_outbox_table.c.status.in_(_DUE_STATUSES)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def claim_due(self, limit: int, now: datetime, lease_seconds: float) -> List[OutboundEmail]:
+        """Claim due emails with one UPDATE over rows locked ``FOR UPDATE SKIP LOCKED``.
+
+        Claimed rows become ``sending`` and are due again once the lease
+        expires, so emails of a worker that died mid-send are retried.
+        """
+        due = (
+            select(email_outbox_table.c.id)
+            .where(email_outbox_table.c.status.in_(_DUE_STATUSES))
+            .where(email_outbox_table.c.next_attempt_at <= now)
+            .order_by(email_outbox_table.c.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(email_outbox_table)
+            .where(email_outbox_table.c.id.in_(due.scalar_subquery()))
+            .values(
+                status=EmailStatus.SENDING.value,
+                attempts=email_outbox_table.c.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(*email_outbox_table.c)
+        )
+        result = await self._session.execute(stmt)
+        emails = [self._to_entity(row) for row in result]
+        await self._commit()
+        return emails
+
+    async def save_results(self, emails: List[OutboundEmail]) -> None:
+        """Store delivery outcomes with one executemany UPDATE."""
+        if not emails:
+            return
+        stmt = (
+            update(email_outbox_table)
+            .where(email_outbox_table.c.id == bindparam("email_id"))
+            .values(
+                status=bindparam("new_status"),
+                next_attempt_at=bindparam("new_next_attempt_at"),
+                sent_at=bindparam("new_sent_at"),
+                last_error=bindparam("new_last_error"),
+            )
+        )
+        await self._session.execute(stmt, [
+            {
+                "email_id": email.id,
+                "new_status": email.status.value,
+                "new_next_attempt_at": email.next_attempt_at,
+                "new_sent_at": email.sent_at,
+                "new_last_error": email.last_error,
+            }
+            for email in emails
+        ])
+        await self._commit()
+
+    async def _commit(self) -> None:
+        """Commit unless a unit of work owns the transaction."""
+        if self._autocommit:
+            await self._session.commit()
+
+    def _to_row(self, email: OutboundEmail) -> dict:
+        """Convert domain entity to an email_outbox table row."""
+        return {
+            "id": email.id,
+            "to": email.to,
+            "subject": email.subject,
+            "body": email.body,
+            "status": email.status.value,
+            "attempts": email.attempts,
+            "created_at": email.created_at,
+            "next_attempt_at": email.next_attempt_at,
+            "sent_at": email.sent_at,
+            "last_error": email.last_error,
+            "dedup_key": email.dedup_key,
+        }
+
+    def _to_entity(self, row: Any) -> OutboundEmail:
+        """Convert an email_outbox table row to domain entity."""
+        return OutboundEmail.model_construct(
+            id=row.id,
+            to=row.to,
+            subject=row.subject,
+            body=row.body,
+            status=EmailStatus(row.status),
+            attempts=row.attempts,
+            created_at=row.created_at,
+            next_attempt_at=row.next_attempt_at,
+            sent_at=row.sent_at,
+            last_error=row.last_error,
+            dedup_key=row.dedup_key,
+        )
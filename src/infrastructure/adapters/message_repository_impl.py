@@ -0,0 +1,120 @@
+"""Chat message repository implementation."""
+
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, tuple_, union_all, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.message import Message
+from src.domain.repositories.message_repository import MessageRepository
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.database.models.message_model import MessageModel
+
+messages_table = MessageModel.__table__
+
+
+class MessageRepositoryImpl(MessageRepository):
+    """Chat message repository implementation using SQLAlchemy."""
+
+    # Rows per multi-row INSERT, keeping bind parameters well under the 32767 limit
+    BULK_INSERT_CHUNK_SIZE = 1000
+
+    def __init__(self, session: AsyncSession, autocommit: bool = True):
+        """Initialize with database session.
+
+        With ``autocommit=False`` the caller owns the transaction.
+        """
+        self._session = session
+        self._autocommit = autocommit
+
+    async def save_many(self, messages: List[Message]) -> None:
+        """Insert messages with multi-row INSERTs; already stored ids are skipped."""
+        for start in range(0, len(messages), self.BULK_INSERT_CHUNK_SIZE):
+            chunk = messages[start:start + self.BULK_INSERT_CHUNK_SIZE]
+            stmt = insert(messages_table).values([self._to_row(message) for message in chunk])
+            await self._session.execute(stmt.on_conflict_do_nothing(index_elements=[messages_table.c.id]))
+        await self._commit()
+
+    async def mark_delivered(self, recipient_id: UserId, message_ids: List[str], delivered_at: datetime) -> None:
+        """Record that the recipient received the given messages."""
+        await self.mark_delivered_many([(recipient_id, message_id) for message_id in message_ids], delivered_at)
+
+    async def mark_delivered_many(self, deliveries: Sequence[Tuple[UserId, str]], delivered_at: datetime) -> None:
+        """Mark ``(recipient_id, message_id)`` pairs delivered with one UPDATE."""
+        if not deliveries:
+            return
+        # Matching on the recipient too means a client can only ack its own messages
+        pairs = [(message_id, str(recipient_id)) for recipient_id, message_id in deliveries]
+        stmt = (
+            update(messages_table)
+            .where(tuple_(messages_table.c.id, messages_table.c.recipient_id).in_(pairs))
+            .where(messages_table.c.delivered_at.is_(None))
+            .values(delivered_at=delivered_at)
+        )
+        await self._session.execute(stmt)
+        await self._commit()
+
+    async def find_undelivered(self, recipient_id: UserId, limit: int = 500) -> List[Message]:
+        """Find messages the recipient has not received yet, oldest first."""
+        stmt = (
+            select(*messages_table.c)
+            .where(messages_table.c.recipient_id == str(recipient_id))
+            .where(messages_table.c.delivered_at.is_(None))
+            .order_by(messages_table.c.created_at, messages_table.c.id)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [self._to_entity(row) for row in result]
+
+    async def find_page(self, user_id: UserId, limit: int = 50, cursor: Optional[PageCursor] = None) -> List[Message]:
+        """Find messages sent or received by the user after the cursor, newest first.
+
+        Each side is a seek on its own (participant, created_at, id) index;
+        merging the two short pages is cheaper than an OR over both columns.
+        """
+        received = self._participant_page(messages_table.c.recipient_id, user_id, limit, cursor)
+        # Messages to oneself are already on the received side
+        sent = self._participant_page(messages_table.c.sender_id, user_id, limit, cursor).where(
+            messages_table.c.recipient_id != str(user_id)
+        )
+        both = union_all(received, sent).subquery()
+        stmt = select(*both.c).order_by(both.c.created_at.desc(), both.c.id.desc()).limit(limit)
+        result = await self._session.execute(stmt)
+        return [self._to_entity(row) for row in result]
+
+    @staticmethod
+    def _participant_page(column: Any, user_id: UserId, limit: int, cursor: Optional[PageCursor]) -> Any:
+        stmt = select(*messages_table.c).where(column == str(user_id))
+        if cursor is not None:
+            stmt = stmt.where(tuple_(messages_table.c.created_at, messages_table.c.id) < (cursor.created_at, cursor.id))
+        return stmt.order_by(messages_table.c.created_at.desc(), messages_table.c.id.desc()).limit(limit)
+
+    async def _commit(self) -> None:
+        """Commit unless the caller owns the transaction."""
+        if self._autocommit:
+            await self._session.commit()
+
+    def _to_row(self, message: Message) -> dict:
+        """Convert domain entity to a messages table row."""
+        return {
+            "id": message.id,
+            "sender_id": str(message.sender_id) if message.sender_id else None,
+            "recipient_id": str(message.recipient_id),
+            "body": message.body,
+            "created_at": message.created_at,
+            "delivered_at": message.delivered_at,
+        }
+
+    def _to_entity(self, row: Any) -> Message:
+        """Convert a messages table row to domain entity."""
+        return Message.from_trusted(
+            id=row.id,
+            sender_id=UserId.from_trusted(row.sender_id) if row.sender_id else None,
+            recipient_id=UserId.from_trusted(row.recipient_id),
+            body=row.body,
+            created_at=row.created_at,
+            delivered_at=row.delivered_at,
+        )
@@ -0,0 +1,26 @@
+"""SQLAlchemy unit of work implementation."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.repositories.unit_of_work import UnitOfWork
+from src.infrastructure.adapters.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+from src.infrastructure.adapters.user_repository_impl import UserRepositoryImpl
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """Unit of work bound to a single SQLAlchemy session."""
+
+    def __init__(self, session: AsyncSession, record_events: bool = True):
+        """Initialize with database session; ``record_events`` is passed to the user repository."""
+        super().__init__()
+        self._session = session
+        self.users = UserRepositoryImpl(session, autocommit=False, record_events=record_events)
+        self.emails = EmailOutboxRepositoryImpl(session, autocommit=False)
+
+    async def commit(self) -> None:
+        """Commit the session transaction."""
+        await self._session.commit()
+
+    async def rollback(self) -> None:
+        """Roll back the session transaction."""
+        await self._session.rollback()
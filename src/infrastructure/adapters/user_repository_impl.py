@@ -1,97 +1,267 @@
 """User repository implementation."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import String, any_, bindparam, delete, func, literal, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.user import User
+from src.domain.events.domain_event import DomainEvent
+from src.domain.events.user_events import user_status_changed
+from src.domain.exceptions import EmailAlreadyExistsError
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.value_objects.email import Email
+from src.domain.value_objects.page_cursor import PageCursor
 from src.domain.value_objects.user_id import UserId
 from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.messaging.outbox import outbox_row, outbox_table
+
+# Statements go through the Core table so each command is one round trip and
+# never hands back stale instances from the session identity map.
+users_table = UserModel.__table__
+
+# Name of the unique index backing users.email
+EMAIL_UNIQUE_INDEX = "ix_users_email"
 
 
 class UserRepositoryImpl(UserRepository):
     """User repository implementation using SQLAlchemy."""
 
-    def __init__(self, session: AsyncSession):
-        """Initialize with database session."""
+    # Below this many rows an exact COUNT(*) is cheap and beats stale statistics
+    EXACT_COUNT_THRESHOLD = 10_000
+    # Rows per multi-row INSERT, keeping bind parameters well under the 32767 limit
+    BULK_INSERT_CHUNK_SIZE = 1000
+
+    # Columns an upsert may overwrite; created_at keeps its original value
+    _UPDATABLE_COLUMNS = ("email", "first_name", "last_name", "is_active", "updated_at")
+
+    def __init__(self, session: AsyncSession, autocommit: bool = True, record_events: bool = True):
+        """Initialize with database session.
+
+        With ``autocommit=False`` the repository leaves transaction control
+        to a unit of work. With ``record_events=False`` domain events are
+        dropped instead of written to the outbox (no relay would drain it).
+        """
         self._session = session
+        self._autocommit = autocommit
+        self._record = record_events
 
     async def save(self, user: User) -> User:
-        """Save a user."""
-        # Check if user exists
-        existing_user = await self._session.get(UserModel, str(user.id))
-        
-        if existing_user:
-            # Update existing user
-            existing_user.email = str(user.email)
-            existing_user.first_name = user.first_name
-            existing_user.last_name = user.last_name
-            existing_user.is_active = user.is_active
-            existing_user.updated_at = user.updated_at
-            await self._session.commit()
-            await self._session.refresh(existing_user)
-            return self._to_entity(existing_user)
-        else:
-            # Create new user
-            user_model = UserModel(
-                id=str(user.id),
-                email=str(user.email),
-                first_name=user.first_name,
-                last_name=user.last_name,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
+        """Save a user with a single upsert statement.
+
+        Domain events the user recorded are written to the outbox in the
+        same transaction.
+        """
+        stmt = insert(users_table).values(self._to_row(user))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[users_table.c.id],
+            set_={column: stmt.excluded[column] for column in self._UPDATABLE_COLUMNS},
+        ).returning(*users_table.c)
+        events = user.pull_events()
+        try:
+            result = await self._session.execute(stmt)
+            saved_row = result.one()
+            await self._record_events(events)
+        except IntegrityError as e:
+            if self._autocommit:
+                await self._session.rollback()
+            if self._is_email_conflict(e):
+                raise EmailAlreadyExistsError() from e
+            raise
+        await self._commit()
+        return self._to_entity(saved_row)
+
+    async def update_status(self, user_id: UserId, is_active: bool, updated_at: datetime) -> Optional[User]:
+        """Set a user's active flag and record the event in one statement.
+
+        The UPDATE ... RETURNING and the outbox INSERT are data-modifying
+        CTEs of one query; the event row is only written if the user exists.
+        """
+        updated = (
+            update(users_table)
+            .where(users_table.c.id == str(user_id))
+            .values(is_active=is_active, updated_at=updated_at)
+            .returning(*users_table.c)
+        )
+        if not self._record:
+            result = await self._session.execute(updated)
+            row = result.one_or_none()
+            await self._commit()
+            return self._to_entity(row) if row else None
+        updated = updated.cte("updated")
+        row = outbox_row(user_status_changed(str(user_id), is_active, updated_at))
+        event_values = select(
+            literal(row["id"], outbox_table.c.id.type),
+            updated.c.id,
+            literal(row["event_type"], outbox_table.c.event_type.type),
+            literal(row["payload"], JSONB),
+            literal(row["occurred_at"], outbox_table.c.occurred_at.type),
+        ).select_from(updated)
+        recorded = insert(outbox_table).from_select(
+            ["id", "aggregate_id", "event_type", "payload", "occurred_at"], event_values
+        ).cte("recorded")
+        stmt = select(*updated.c).add_cte(recorded)
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        await self._commit()
+        return self._to_entity(row) if row else None
+
+    async def save_many(self, users: List[User]) -> List[User]:
+        """Insert new users, skipping any that conflict; return those inserted."""
+        saved_users: List[User] = []
+        for start in range(0, len(users), self.BULK_INSERT_CHUNK_SIZE):
+            chunk = users[start:start + self.BULK_INSERT_CHUNK_SIZE]
+            stmt = (
+                insert(users_table)
+                .values([self._to_row(user) for user in chunk])
+                .on_conflict_do_nothing()
+                .returning(*users_table.c)
             )
-            self._session.add(user_model)
-            await self._session.commit()
-            await self._session.refresh(user_model)
-            return self._to_entity(user_model)
+            result = await self._session.execute(stmt)
+            inserted = [self._to_entity(row) for row in result]
+            inserted_ids = {user.id for user in inserted}
+            await self._record_events(
+                [event for user in chunk if user.id in inserted_ids for event in user.pull_events()]
+            )
+            saved_users.extend(inserted)
+        await self._commit()
+        return saved_users
 
     async def find_by_id(self, user_id: UserId) -> Optional[User]:
         """Find user by ID."""
-        user_model = await self._session.get(UserModel, str(user_id))
-        return self._to_entity(user_model) if user_model else None
+        stmt = select(*users_table.c).where(users_table.c.id == str(user_id))
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        return self._to_entity(row) if row else None
 
     async def find_by_email(self, email: Email) -> Optional[User]:
         """Find user by email."""
-        stmt = select(UserModel).where(UserModel.email == str(email))
+        stmt = select(*users_table.c).where(users_table.c.email == str(email))
         result = await self._session.execute(stmt)
-        user_model = result.scalar_one_or_none()
-        return self._to_entity(user_model) if user_model else None
+        row = result.one_or_none()
+        return self._to_entity(row) if row else None
 
     async def find_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Find all users with pagination."""
-        stmt = select(UserModel).offset(skip).limit(limit).order_by(UserModel.created_at.desc())
+        stmt = (
+            select(*users_table.c)
+            .order_by(users_table.c.created_at.desc(), users_table.c.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [self._to_entity(row) for row in result]
+
+    async def find_page(self, limit: int = 100, cursor: Optional[PageCursor] = None) -> List[User]:
+        """Find users after the cursor, newest first (keyset pagination)."""
+        stmt = select(*users_table.c).order_by(users_table.c.created_at.desc(), users_table.c.id.desc()).limit(limit)
+        if cursor is not None:
+            # Row-value comparison lets Postgres seek straight into ix_users_created_at_id
+            stmt = stmt.where(tuple_(users_table.c.created_at, users_table.c.id) < (cursor.created_at, cursor.id))
+        result = await self._session.execute(stmt)
+        return [self._to_entity(row) for row in result]
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Iterate over all users, newest first, through a server-side cursor."""
+        stmt = (
+            select(*users_table.c)
+            .order_by(users_table.c.created_at.desc(), users_table.c.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        async for row in result:
+            yield self._to_entity(row)
+
+    async def count(self) -> int:
+        """Count all users exactly."""
+        stmt = select(func.count()).select_from(users_table)
         result = await self._session.execute(stmt)
-        user_models = result.scalars().all()
-        return [self._to_entity(user_model) for user_model in user_models]
+        return result.scalar_one()
+
+    async def estimate_count(self) -> Tuple[int, bool]:
+        """Estimate the number of users from planner statistics.
+
+        ``pg_class.reltuples`` is maintained by VACUUM/ANALYZE and read without
+        scanning the table; small or never-analyzed tables fall back to COUNT(*).
+        """
+        stmt = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+        result = await self._session.execute(stmt, {"table": users_table.name})
+        estimate = result.scalar_one_or_none()
+        if estimate is None or estimate < self.EXACT_COUNT_THRESHOLD:
+            return await self.count(), False
+        return estimate, True
 
     async def delete(self, user_id: UserId) -> bool:
-        """Delete a user by ID."""
-        user_model = await self._session.get(UserModel, str(user_id))
-        if user_model:
-            await self._session.delete(user_model)
-            await self._session.commit()
-            return True
-        return False
+        """Delete a user by ID with a single DELETE ... RETURNING."""
+        stmt = delete(users_table).where(users_table.c.id == str(user_id)).returning(users_table.c.id)
+        result = await self._session.execute(stmt)
+        deleted = result.one_or_none() is not None
+        await self._commit()
+        return deleted
 
     async def exists_by_email(self, email: Email) -> bool:
         """Check if user exists by email."""
-        stmt = select(UserModel.id).where(UserModel.email == str(email))
+        stmt = select(users_table.c.id).where(users_table.c.email == str(email))
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
-    def _to_entity(self, user_model: UserModel) -> User:
-        """Convert database model to domain entity."""
-        return User(
-            id=UserId.from_string(user_model.id),
-            email=Email.from_string(user_model.email),
-            first_name=user_model.first_name,
-            last_name=user_model.last_name,
-            is_active=user_model.is_active,
-            created_at=user_model.created_at,
-            updated_at=user_model.updated_at,
+    async def find_existing_emails(self, emails: List[Email]) -> Set[Email]:
+        """Return the subset of emails already used by some user."""
+        if not emails:
+            return set()
+        # A single array parameter keeps this one statement regardless of size
+        email_values = bindparam("emails", [str(email) for email in emails], type_=ARRAY(String))
+        stmt = select(users_table.c.email).where(users_table.c.email == any_(email_values))
+        result = await self._session.execute(stmt)
+        return {Email.from_trusted(email) for email in result.scalars()}
+
+    async def _record_events(self, events: List[DomainEvent]) -> None:
+        """Write domain events to the outbox in the current transaction."""
+        if events and self._record:
+            await self._session.execute(insert(outbox_table).values([outbox_row(event) for event in events]))
+
+    async def _commit(self) -> None:
+        """Commit unless a unit of work owns the transaction."""
+        if self._autocommit:
+            await self._session.commit()
+
+    @staticmethod
+    def _is_email_conflict(error: IntegrityError) -> bool:
+        """Whether an integrity error is a violation of the unique email index."""
+        # asyncpg reports the constraint on the driver exception wrapped by the adapter
+        for driver_error in (error.orig, getattr(error.orig, "__cause__", None)):
+            constraint_name = getattr(driver_error, "constraint_name", None)
+            if constraint_name is not None:
+                return constraint_name == EMAIL_UNIQUE_INDEX
+        return EMAIL_UNIQUE_INDEX in str(error.orig)
+
+    def _to_row(self, user: User) -> dict:
+        """Convert domain entity to a users table row."""
+        return {
+            "id": str(user.id),
+            "email": str(user.email),
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_active": user.is_active,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+
+    def _to_entity(self, row: Any) -> User:
+        """Convert a users table row (or model) to domain entity.
+
+        Rows were validated before they were written, so they take the trusted
+        construction path instead of being validated again.
+        """
+        return User.from_trusted(
+            id=UserId.from_trusted(row.id),
+            email=Email.from_trusted(row.email),
+            first_name=row.first_name,
+            last_name=row.last_name,
+            is_active=row.is_active,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
         )
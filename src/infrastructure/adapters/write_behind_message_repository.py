@@ -0,0 +1,100 @@
+"""Message repository that batches writes behind an in-memory buffer."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.message import Message
+from src.domain.repositories.message_repository import MessageRepository
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.adapters.message_repository_impl import MessageRepositoryImpl
+from src.infrastructure.database.write_behind import WriteBehindBuffer
+
+
+@dataclass(frozen=True)
+class _Delivery:
+    recipient_id: UserId
+    message_id: str
+    delivered_at: datetime
+
+
+class WriteBehindMessageRepository(MessageRepository):
+    """Message repository whose writes return at once and land in batches.
+
+    New messages and delivery marks share one buffer and are flushed in order,
+    each batch as one transaction: a multi-row INSERT for the messages, then
+    one UPDATE for the deliveries. Reads go to the database on a fresh
+    session; ``find_undelivered`` also sees messages still in the buffer.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_batch: int = 500,
+        max_delay: float = 0.05,
+        max_pending: int = 50_000,
+    ):
+        """Initialize with a session factory and buffer limits."""
+        self._session_factory = session_factory
+        self.buffer: WriteBehindBuffer[Union[Message, _Delivery]] = WriteBehindBuffer(
+            self._write, max_batch=max_batch, max_delay=max_delay, max_pending=max_pending
+        )
+
+    def start(self) -> None:
+        """Start flushing in the background."""
+        self.buffer.start()
+
+    async def close(self) -> None:
+        """Flush what is left and stop."""
+        await self.buffer.close()
+
+    async def save_many(self, messages: List[Message]) -> None:
+        """Queue messages for the next batched INSERT."""
+        for message in messages:
+            self.buffer.add(message)
+
+    async def mark_delivered(self, recipient_id: UserId, message_ids: List[str], delivered_at: datetime) -> None:
+        """Queue delivery marks for the next batched UPDATE."""
+        for message_id in message_ids:
+            self.buffer.add(_Delivery(recipient_id, message_id, delivered_at))
+
+    async def find_undelivered(self, recipient_id: UserId, limit: int = 500) -> List[Message]:
+        """Find undelivered messages, stored or still buffered, oldest first."""
+        async with self._session_factory() as session:
+            stored = await MessageRepositoryImpl(session).find_undelivered(recipient_id, limit)
+        buffered, delivered = [], set()
+        for item in self.buffer.unwritten():
+            if isinstance(item, _Delivery):
+                delivered.add(item.message_id)
+            elif item.recipient_id == recipient_id and item.delivered_at is None:
+                buffered.append(item)
+        seen = set()
+        messages = []
+        for message in stored + buffered:
+            if message.id not in seen and message.id not in delivered:
+                seen.add(message.id)
+                messages.append(message)
+        messages.sort(key=lambda message: (message.created_at, message.id))
+        return messages[:limit]
+
+    async def find_page(self, user_id: UserId, limit: int = 50, cursor: Optional[PageCursor] = None) -> List[Message]:
+        """Find stored messages of the user after the cursor, newest first."""
+        async with self._session_factory() as session:
+            return await MessageRepositoryImpl(session).find_page(user_id, limit, cursor)
+
+    async def _write(self, batch: List[Union[Message, _Delivery]]) -> None:
+        messages = [item for item in batch if isinstance(item, Message)]
+        deliveries = [item for item in batch if isinstance(item, _Delivery)]
+        async with self._session_factory() as session:
+            repository = MessageRepositoryImpl(session, autocommit=False)
+            if messages:
+                await repository.save_many(messages)
+            if deliveries:
+                await repository.mark_delivered_many(
+                    [(item.recipient_id, item.message_id) for item in deliveries],
+                    max(item.delivered_at for item in deliveries),
+                )
+            await session.commit()
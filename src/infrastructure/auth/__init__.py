@@ -0,0 +1 @@
+# Auth infrastructure
@@ -0,0 +1,16 @@
+"""Authentication configuration."""
+
+from typing import Optional
+
+from pydantic import Field
+from src.infrastructure.configs.config_init import ConfigInit
+
+
+class AuthConfig(ConfigInit):
+
+    # HMAC key of user tokens; unset refuses every identity-bound request
+    token_secret: Optional[str] = Field(default=None, alias="AUTH_TOKEN_SECRET")
+    # Lifetime of the tokens issued by the user_tokens command
+    token_ttl_seconds: int = Field(default=86_400, ge=1, alias="AUTH_TOKEN_TTL_SECONDS")
+    # Bearer token of operator endpoints (email delivery status); unset closes them
+    operator_token: Optional[str] = Field(default=None, alias="AUTH_OPERATOR_TOKEN")
@@ -0,0 +1,177 @@
+"""Shared cache backend interface and implementations."""
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.infrastructure.configs.loggers import print
+
+# Called with the keys another process deleted, or None when any key may have changed
+InvalidationCallback = Callable[[Optional[Sequence[str]]], None]
+
+# Seconds between attempts to resubscribe to invalidations
+RESUBSCRIBE_DELAY = 1.0
+
+# Seconds a key's invalidation count is kept; far longer than any read-through fill
+GENERATION_TTL = 3600
+
+# SET KEYS[1] only while KEYS[2] (the invalidation count) still equals ARGV[3]
+_SET_IF_GENERATION = """
+if (redis.call('GET', KEYS[2]) or '') == ARGV[3] then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+class CacheBackend(ABC):
+    """Abstract shared (out-of-process) cache backend."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value for ``ttl`` seconds."""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove values, count the invalidation and notify the listening processes."""
+        pass
+
+    @abstractmethod
+    async def generation(self, key: str) -> str:
+        """How often ``key`` was invalidated, as an opaque token."""
+        pass
+
+    @abstractmethod
+    async def set_if_generation(self, key: str, value: bytes, ttl: int, generation: str) -> bool:
+        """Store a value unless ``key`` was invalidated since ``generation`` was read."""
+        pass
+
+    async def listen(self, on_invalidate: InvalidationCallback) -> None:
+        """Call ``on_invalidate`` with the keys other processes delete, until cancelled."""
+        await asyncio.Event().wait()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend on a ``redis.asyncio`` client.
+
+    Deletes are published on ``channel``, so every process can drop the keys
+    from its in-process tier, and counted under ``gen:<key>``, so a fill
+    that read the database before the delete cannot store its old row.
+    """
+
+    def __init__(self, client: Any, channel: str = "cache:invalidate"):
+        """Initialize with a redis client and the invalidation channel."""
+        self._client = client
+        self._channel = channel
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value."""
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value for ``ttl`` seconds."""
+        await self._client.set(key, value, ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        """Remove values, count the invalidation and publish their keys."""
+        if keys:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(self._generation_key(key))
+                    pipe.expire(self._generation_key(key), GENERATION_TTL)
+                pipe.delete(*keys)
+                pipe.publish(self._channel, json.dumps(keys))
+                await pipe.execute()
+
+    async def generation(self, key: str) -> str:
+        """How often ``key`` was invalidated, as an opaque token."""
+        generation = await self._client.get(self._generation_key(key))
+        return generation.decode() if generation else ""
+
+    async def set_if_generation(self, key: str, value: bytes, ttl: int, generation: str) -> bool:
+        """Store a value unless ``key`` was invalidated since ``generation`` was read (atomic script)."""
+        stored = await self._client.eval(
+            _SET_IF_GENERATION, 2, key, self._generation_key(key), value, ttl, generation
+        )
+        return bool(stored)
+
+    @staticmethod
+    def _generation_key(key: str) -> str:
+        return f"gen:{key}"
+
+    async def listen(self, on_invalidate: InvalidationCallback) -> None:
+        """Call ``on_invalidate`` with published keys, resubscribing after errors."""
+        while True:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._channel)
+                async for message in pubsub.listen():
+                    on_invalidate(json.loads(message["data"]))
+            except Exception as e:
+                print(f"Cache invalidation listener failed: {e}", level="warn")
+            finally:
+                await pubsub.aclose()
+            # Invalidations published while disconnected were missed
+            on_invalidate(None)
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local stand-in for Redis, for tests and single-process setups."""
+
+    def __init__(self) -> None:
+        """Initialize empty store."""
+        self._values: Dict[str, Tuple[float, bytes]] = {}
+        self._generations: Dict[str, int] = {}
+        self._listeners: List[InvalidationCallback] = []
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value."""
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value for ``ttl`` seconds."""
+        self._values[key] = (time.monotonic() + ttl, value)
+
+    async def delete(self, *keys: str) -> None:
+        """Remove values, count the invalidation and notify listeners."""
+        for key in keys:
+            self._values.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+        for listener in self._listeners:
+            listener(list(keys))
+
+    async def generation(self, key: str) -> str:
+        """How often ``key`` was invalidated, as an opaque token."""
+        return str(self._generations.get(key, ""))
+
+    async def set_if_generation(self, key: str, value: bytes, ttl: int, generation: str) -> bool:
+        """Store a value unless ``key`` was invalidated since ``generation`` was read."""
+        if await self.generation(key) != generation:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def listen(self, on_invalidate: InvalidationCallback) -> None:
+        """Call ``on_invalidate`` with deleted keys, until cancelled."""
+        self._listeners.append(on_invalidate)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self._listeners.remove(on_invalidate)
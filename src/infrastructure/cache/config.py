@@ -0,0 +1,16 @@
+"""Cache configuration."""
+
+from typing import Optional
+
+from pydantic import Field
+from src.infrastructure.configs.config_init import ConfigInit
+
+
+class CacheConfig(ConfigInit):
+
+    enabled: bool = Field(default=True, alias="CACHE_ENABLED")
+    redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")
+    local_maxsize: int = Field(default=10_000, ge=1, alias="CACHE_LOCAL_MAXSIZE")
+    # Short local TTL bounds staleness across worker processes
+    local_ttl: float = Field(default=30.0, gt=0, alias="CACHE_LOCAL_TTL")
+    remote_ttl: int = Field(default=300, ge=1, alias="CACHE_REMOTE_TTL")
@@ -0,0 +1,54 @@
+"""In-process LRU cache with TTL."""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Bounded in-process cache evicting by TTL and least-recent use.
+
+    Not thread-safe: it is meant to be used from the event loop thread.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """Initialize cache limits."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[V]:
+        """Get a live value, refreshing its recency."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        """Remove entries if present."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries, including not yet collected expired ones."""
+        return len(self._entries)
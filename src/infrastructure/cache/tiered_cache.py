@@ -0,0 +1,141 @@
+"""Two-tier cache: in-process LRU in front of a shared backend."""
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from src.infrastructure.cache.cache_backend import CacheBackend
+from src.infrastructure.cache.lru_cache import LRUCache
+from src.infrastructure.configs.loggers import print
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of a tiered cache."""
+
+    local_hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served by either tier."""
+        lookups = self.local_hits + self.remote_hits + self.misses
+        return (self.local_hits + self.remote_hits) / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class CacheVersion:
+    """Invalidation state of a key, read before loading the value to cache."""
+
+    local: int
+    # None when the shared tier could not be asked; the fill then skips it
+    remote: Optional[str]
+
+
+class TieredCache:
+    """Read-through cache over an ``LRUCache`` and an optional shared backend.
+
+    Shared backend failures are treated as misses so an unavailable Redis
+    degrades to database reads instead of failing requests. Once started,
+    keys deleted by other processes are dropped from the local tier too;
+    without a shared backend, other processes' local entries only expire.
+
+    Read-through fills take a ``version`` before loading and ``fill`` after,
+    which stores nothing if the key was invalidated in between, so a slow
+    reader cannot cache a row that a concurrent commit replaced.
+    """
+
+    def __init__(self, local: LRUCache[bytes], remote: Optional[CacheBackend] = None, remote_ttl: int = 300):
+        """Initialize with cache tiers."""
+        self.local = local
+        self.remote = remote
+        self.remote_ttl = remote_ttl
+        self.stats = CacheStats()
+        self._listener: Optional[asyncio.Task] = None
+        # Bumped by every local invalidation; fills started before it are dropped
+        self._local_generation = 0
+
+    def start(self) -> None:
+        """Start following invalidations from other processes."""
+        if self.remote is not None and self._listener is None:
+            self._listener = asyncio.create_task(self.remote.listen(self._invalidate_local))
+
+    async def close(self) -> None:
+        """Stop following invalidations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    def _invalidate_local(self, keys: Optional[Sequence[str]]) -> None:
+        """Drop keys deleted elsewhere (everything when unknown) from the local tier."""
+        self._local_generation += 1
+        if keys is None:
+            self.local.clear()
+        else:
+            self.local.delete(*keys)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value from the nearest tier holding it."""
+        value = self.local.get(key)
+        if value is not None:
+            self.stats.local_hits += 1
+            return value
+        if self.remote is not None:
+            local_generation = self._local_generation
+            try:
+                value = await self.remote.get(key)
+            except Exception as e:
+                print(f"Cache backend get failed: {e}", level="warn")
+                value = None
+            if value is not None:
+                self.stats.remote_hits += 1
+                if local_generation == self._local_generation:
+                    self.local.set(key, value)
+                return value
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Store a value in every tier."""
+        self.local.set(key, value)
+        if self.remote is not None:
+            try:
+                await self.remote.set(key, value, self.remote_ttl)
+            except Exception as e:
+                print(f"Cache backend set failed: {e}", level="warn")
+
+    async def version(self, key: str) -> CacheVersion:
+        """Invalidation state of ``key``, to pass to ``fill`` once the value is loaded."""
+        local_generation = self._local_generation
+        remote_generation = None
+        if self.remote is not None:
+            try:
+                remote_generation = await self.remote.generation(key)
+            except Exception as e:
+                print(f"Cache backend generation failed: {e}", level="warn")
+        return CacheVersion(local_generation, remote_generation)
+
+    async def fill(self, key: str, value: bytes, version: CacheVersion) -> None:
+        """Store a loaded value in every tier where ``key`` was not invalidated since ``version``."""
+        if self.remote is not None and version.remote is not None:
+            try:
+                if not await self.remote.set_if_generation(key, value, self.remote_ttl, version.remote):
+                    return
+            except Exception as e:
+                print(f"Cache backend set failed: {e}", level="warn")
+        if version.local == self._local_generation:
+            self.local.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        """Invalidate keys in every tier."""
+        self._local_generation += 1
+        self.local.delete(*keys)
+        if self.remote is not None:
+            try:
+                await self.remote.delete(*keys)
+            except Exception as e:
+                print(f"Cache backend delete failed: {e}", level="warn")
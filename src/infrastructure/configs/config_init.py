@@ -1,3 +1,6 @@
+import os
+from typing import Optional
+
 from pydantic_settings import BaseSettings,SettingsConfigDict
 from pydantic import Field
 class ConfigInit(BaseSettings):
@@ -7,10 +10,45 @@ class ConfigInit(BaseSettings):
         extra="ignore",
     )
 
+    # "production" skips schema creation at boot and leaves it to migrations
+    app_env: str = Field(default="development", alias="APP_ENV")
     app_host: str = Field(default="0.0.0.0", alias="APP_HOST")
     app_port: int = Field(default=8000, alias="APP_PORT")
     app_log_level: str = Field(default="info", alias="APP_LOG_LEVEL")
-    app_reload: bool = Field(default=True, alias="APP_RELOAD")
+    app_reload: bool = Field(default=False, alias="APP_RELOAD")
+    # Socket.IO (and its imports) are only loaded when enabled
+    app_socketio_enabled: bool = Field(default=True, alias="APP_SOCKETIO_ENABLED")
+    # Worker processes; defaults to the CPU count (always 1 with reload, and
+    # with Socket.IO enabled but no SOCKETIO_MESSAGE_QUEUE)
+    app_workers: Optional[int] = Field(default=None, ge=1, alias="APP_WORKERS")
+    # Recycle a worker after this many requests (0 disables)
+    app_max_requests: int = Field(default=0, ge=0, alias="APP_MAX_REQUESTS")
+    app_graceful_timeout: int = Field(default=30, ge=0, alias="APP_GRACEFUL_TIMEOUT")
+    app_loop: str = Field(default="uvloop", alias="APP_LOOP")
+    app_http: str = Field(default="httptools", alias="APP_HTTP")
+    # Rely on the unique email index instead of a SELECT before inserting users
+    app_optimistic_create: bool = Field(default=True, alias="APP_OPTIMISTIC_CREATE")
+    # Also read by SocketIOConfig; without it Socket.IO only works in one worker
+    socketio_message_queue: Optional[str] = Field(default=None, alias="SOCKETIO_MESSAGE_QUEUE")
+
+    @property
+    def is_production(self) -> bool:
+        """Whether the app runs in production mode."""
+        return self.app_env.lower() in ("production", "prod")
+
+    @property
+    def multi_worker_safe(self) -> bool:
+        """Whether the app can run in more than one worker process."""
+        # The in-process Socket.IO manager only reaches clients of its own
+        # worker, and long-polling requests land on random workers
+        return not self.app_socketio_enabled or bool(self.socketio_message_queue)
+
+    @property
+    def worker_count(self) -> int:
+        """Number of worker processes to run."""
+        if self.app_reload or not self.multi_worker_safe:
+            return 1
+        return self.app_workers or os.cpu_count() or 1
 
     @property
     def uvicorn_config(self) -> dict:
@@ -19,5 +57,12 @@ class ConfigInit(BaseSettings):
             "port": self.app_port,
             "log_level": self.app_log_level,
             "reload": self.app_reload,
+            "workers": self.worker_count,
+            "loop": self.app_loop,
+            "http": self.app_http,
+            "limit_max_requests": self.app_max_requests or None,
+            "timeout_graceful_shutdown": self.app_graceful_timeout,
+            # Requests are logged by ServerTimingMiddleware, with DB timings
+            "access_log": False,
             
         }
\ No newline at end of file
@@ -1,67 +1,187 @@
-import inspect
+"""Structured, non-blocking logger.
+
+Records are JSON lines. The calling thread only checks the level, looks up
+its caller frame and enqueues a tuple; timestamp formatting, encoding and I/O
+happen on a background writer thread.
+"""
+
+import atexit
 import datetime
-from colorama import Fore, Style
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Any, Optional, TextIO
+
 from src.infrastructure.configs.config_init import ConfigInit
-import builtins
-
-real_print = builtins.print
-LOG_COLORS = {
-    "DEBUG": Fore.CYAN,
-    "INFO": Fore.GREEN,
-    "WARN": Fore.YELLOW,
-    "ERROR": Fore.RED,
+
+LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARN": 30,
+    "ERROR": 40,
 }
+# Accept lower case and the uvicorn/stdlib spellings of the same levels
+_LEVEL_ALIASES = {"TRACE": "DEBUG", "WARNING": "WARN", "CRITICAL": "ERROR"}
+_LEVEL_NAMES = {}
+for _name in LEVELS:
+    _LEVEL_NAMES[_name] = _LEVEL_NAMES[_name.lower()] = _name
+for _alias, _name in _LEVEL_ALIASES.items():
+    _LEVEL_NAMES[_alias] = _LEVEL_NAMES[_alias.lower()] = _name
+
+_STOP = object()
+_MAX_BATCH = 512
+
 
 class Logger:
-    def __init__(self):
+    """JSON-lines logger with a queue-fed writer thread."""
+
+    def __init__(self, level: Optional[str] = None, stream: Optional[TextIO] = None):
+        """Initialize from ``APP_LOG_LEVEL`` unless a level is given.
+
+        ``stream`` defaults to whatever ``sys.stdout`` is at write time.
+        """
         cfg = ConfigInit()
-        self.level = cfg.model_dump().get("app_log_level", "DEBUG").upper()
-        self.env = cfg.model_dump().get("env", "dev").upper()
+        self.level = _LEVEL_NAMES[level or cfg.app_log_level]
+        self.env = cfg.app_env.upper()
+        self._threshold = LEVELS[self.level]
+        self._stream = stream
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
 
-    def _should_log(self, level):
-        order = ["DEBUG", "INFO", "WARN", "ERROR"]
-        return order.index(level) >= order.index(self.level)
+    def is_enabled_for(self, level: str) -> bool:
+        """Whether records of ``level`` would be written."""
+        return LEVELS[_LEVEL_NAMES[level]] >= self._threshold
 
-    def log(self, level, *args):
-        if not self._should_log(level):
-            return
-        
-        frame = inspect.stack()[2]
-        file = frame.filename.split("/")[-1]
-        line = frame.lineno
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        color = LOG_COLORS[level]
+    def log(self, level: str, *args: Any, **fields: Any) -> None:
+        """Log ``args`` joined by spaces, with ``fields`` as extra JSON keys."""
+        self._log(_LEVEL_NAMES[level], args, fields)
 
-        real_print(f"{color}[{timestamp}] {level} {file}:{line} -> {' '.join(map(str,args))}{Style.RESET_ALL}")
+    def debug(self, *args: Any, **fields: Any) -> None:
+        """Log at DEBUG level."""
+        self._log("DEBUG", args, fields)
 
-        
+    def info(self, *args: Any, **fields: Any) -> None:
+        """Log at INFO level."""
+        self._log("INFO", args, fields)
 
-# Global logger
-logger = Logger()
-    
+    def warn(self, *args: Any, **fields: Any) -> None:
+        """Log at WARN level."""
+        self._log("WARN", args, fields)
 
-def print(*args, level=None, **kwargs):
-    if level is None:
-        level = "DEBUG"
-    logger.log(level.upper(), *args)
+    def error(self, *args: Any, **fields: Any) -> None:
+        """Log at ERROR level."""
+        self._log("ERROR", args, fields)
 
-def debug(*args): logger.log("DEBUG", *args)
-def info(*args): logger.log("INFO", *args)
-def warn(*args): logger.log("WARN", *args)
-def error(*args): logger.log("ERROR", *args)
+    def _log(self, level: str, args: tuple, fields: dict) -> None:
+        # Must be called directly by the public entry point: frame 2 is its caller.
+        if LEVELS[level] < self._threshold:
+            return
+        frame = sys._getframe(2)
+        code = frame.f_code
+        message = " ".join(map(str, args))
+        self._queue.put((time.time(), level, code.co_filename, frame.f_lineno, code.co_name, message, fields))
+        if self._writer is None:
+            self._start_writer()
 
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every record enqueued so far has been written."""
+        if self._writer is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
 
-def test_logs(env):
-        if env != "DEV":
+    def close(self) -> None:
+        """Write pending records and stop the writer thread."""
+        writer = self._writer
+        if writer is None:
             return
-        print("**************************************************")
-        print("Testing logs...")
-        print("**************************************************")
-        debug("Debug message")
-        info("Info message")
-        warn("Some warning")
-        error("Boom!")
-        print("Hello")
-test_logs(logger.env)
+        self._queue.put(_STOP)
+        writer.join()
+        self._writer = None
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                return
+            writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            writer.start()
+            self._writer = writer
+
+    def _after_fork(self) -> None:
+        # The writer thread does not survive fork; the child starts its own.
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < _MAX_BATCH:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+
+            lines = []
+            waiters = []
+            stop = False
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(self._format(item))
+            if lines:
+                self._write("".join(lines))
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    @staticmethod
+    def _format(record: tuple) -> str:
+        timestamp, level, filename, line, function, message, fields = record
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).isoformat(),
+            "level": level,
+            "file": os.path.basename(filename),
+            "line": line,
+            "func": function,
+            "msg": message,
+        }
+        if fields:
+            entry.update(fields)
+        return json.dumps(entry, default=str) + "\n"
+
+    def _write(self, data: str) -> None:
+        stream = self._stream or sys.stdout
+        try:
+            stream.write(data)
+            stream.flush()
+        except (OSError, ValueError):
+            # Closed or broken stream (e.g. at interpreter shutdown): drop the batch
+            pass
 
 
+# Global logger
+logger = Logger()
+atexit.register(logger.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=logger._after_fork)
+
+
+def print(*args, level=None, **kwargs):
+    """Drop-in for the builtin ``print`` that logs at ``level`` (default DEBUG)."""
+    logger._log("DEBUG" if level is None else _LEVEL_NAMES[level], args, {})
+
+def debug(*args, **fields): logger._log("DEBUG", args, fields)
+def info(*args, **fields): logger._log("INFO", args, fields)
+def warn(*args, **fields): logger._log("WARN", args, fields)
+def error(*args, **fields): logger._log("ERROR", args, fields)
@@ -1,6 +1,8 @@
 """Database configuration."""
 
 
+from typing import Optional
+
 from pydantic import Field
 from src.infrastructure.configs.config_init import ConfigInit
 
@@ -14,8 +16,43 @@ class DatabaseConfig(ConfigInit):
     password: str = Field(default="password", alias="DB_PASSWORD")
     echo: bool = Field(default=False, alias="DB_ECHO")
 
-    
+    # Connection pool settings (per engine, i.e. per worker process)
+    pool_size: int = Field(default=10, ge=1, alias="DB_POOL_SIZE")
+    max_overflow: int = Field(default=10, ge=0, alias="DB_MAX_OVERFLOW")
+    # Postgres connections all workers may hold together; caps the per-worker pool
+    max_connections: Optional[int] = Field(default=None, ge=1, alias="DB_MAX_CONNECTIONS")
+    pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    pool_timeout: float = Field(default=30.0, gt=0, alias="DB_POOL_TIMEOUT")
+    pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    # Connections opened at startup before the app reports ready
+    pool_warm_up: int = Field(default=2, ge=0, alias="DB_POOL_WARM_UP")
+    # Statements slower than this are logged (0 disables)
+    slow_query_ms: float = Field(default=200.0, ge=0, alias="DB_SLOW_QUERY_MS")
+
+
     @property
     def url(self) -> str:
         """Get database URL."""
-        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
\ No newline at end of file
+        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+
+    @property
+    def worker_pool_limits(self) -> tuple:
+        """Get this worker's ``(pool_size, max_overflow)`` within the connection budget."""
+        if self.max_connections is None:
+            return self.pool_size, self.max_overflow
+        per_worker = max(self.max_connections // self.worker_count, 1)
+        pool_size = min(self.pool_size, per_worker)
+        return pool_size, min(self.max_overflow, per_worker - pool_size)
+
+    @property
+    def engine_options(self) -> dict:
+        """Get keyword arguments for engine creation."""
+        pool_size, max_overflow = self.worker_pool_limits
+        return {
+            "echo": self.echo,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": self.pool_recycle,
+            "pool_timeout": self.pool_timeout,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
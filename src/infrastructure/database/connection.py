@@ -1,10 +1,17 @@
 """Database connection setup."""
 
-from sqlalchemy import create_engine
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import create_engine, exc, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from .config import DatabaseConfig
+from .query_stats import instrument_engine
 
 
 class Base(DeclarativeBase):
@@ -12,6 +19,45 @@ class Base(DeclarativeBase):
     pass
 
 
+@dataclass
+class PoolStats:
+    """Snapshot of the async engine's connection pool."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    wait_seconds: float
+    timeouts: int
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that accounts for the time spent obtaining connections.
+
+    The time covers waiting for a free slot, connecting new connections and
+    the pre-ping, i.e. everything a request waits for before its first query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize pool and its counters."""
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+    def connect(self):
+        """Check out a connection, recording how long it took."""
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.checkouts += 1
+            self.wait_seconds += time.perf_counter() - started
+
+
 class DatabaseConnection:
     """Database connection manager."""
 
@@ -29,9 +75,9 @@ class DatabaseConnection:
         if self._engine is None:
             self._engine = create_engine(
                 self.config.url,
-                echo=self.config.echo,
-                pool_pre_ping=True,
+                **self.config.engine_options,
             )
+            instrument_engine(self._engine, self.config.slow_query_ms / 1000)
         return self._engine
 
     @property
@@ -41,9 +87,10 @@ class DatabaseConnection:
             async_url = self.config.url.replace("postgresql://", "postgresql+asyncpg://")
             self._async_engine = create_async_engine(
                 async_url,
-                echo=self.config.echo,
-                pool_pre_ping=True,
+                poolclass=TimedAsyncQueuePool,
+                **self.config.engine_options,
             )
+            instrument_engine(self._async_engine.sync_engine, self.config.slow_query_ms / 1000)
         return self._async_engine
 
     @property
@@ -77,3 +124,37 @@ class DatabaseConnection:
         """Create all tables asynchronously."""
         async with self.async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+
+    async def warm_up(self, connections: int):
+        """Open pooled connections concurrently so first requests skip the connect."""
+        async def ping():
+            async with self.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        pool_size, _ = self.config.worker_pool_limits
+        await asyncio.gather(*(ping() for _ in range(min(connections, pool_size))))
+
+    def pool_stats(self) -> Optional[PoolStats]:
+        """Get async pool statistics, or None before the engine is created."""
+        if self._async_engine is None:
+            return None
+        pool = self._async_engine.pool
+        return PoolStats(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            checkouts=getattr(pool, "checkouts", 0),
+            wait_seconds=getattr(pool, "wait_seconds", 0.0),
+            timeouts=getattr(pool, "timeouts", 0),
+        )
+
+    async def dispose(self):
+        """Close all pooled connections."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+            self._async_engine = None
+            self._async_session_factory = None
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+            self._session_factory = None
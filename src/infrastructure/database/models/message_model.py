@@ -0,0 +1,35 @@
+"""Chat message database model."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..connection import Base
+
+
+class MessageModel(Base):
+    """Chat message database model."""
+
+    __tablename__ = "messages"
+    __table_args__ = (
+        # History is read per participant on (created_at DESC, id DESC)
+        Index("ix_messages_recipient_id_created_at_id", "recipient_id", "created_at", "id"),
+        Index("ix_messages_sender_id_created_at_id", "sender_id", "created_at", "id"),
+        # Reconnect delivery only ever scans the small undelivered remainder
+        Index(
+            "ix_messages_undelivered",
+            "recipient_id",
+            "created_at",
+            postgresql_where=text("delivered_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    sender_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), nullable=True)
+    recipient_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
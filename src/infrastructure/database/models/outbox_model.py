@@ -0,0 +1,25 @@
+"""Outbox event database model."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..connection import Base
+
+
+class OutboxEventModel(Base):
+    """Domain event waiting to be published; written in the transaction that raised it."""
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # The relay claims the oldest events first
+        Index("ix_outbox_events_occurred_at_id", "occurred_at", "id"),
+    )
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    aggregate_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,96 @@
+"""Per-request query accounting through engine cursor events."""
+
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.configs.loggers import logger
+
+_START_TIMES_KEY = "query_start_times"
+MAX_LOGGED_STATEMENT_LENGTH = 2000
+
+
+@dataclass
+class QueryStats:
+    """Number of statements executed and time spent in them."""
+
+    count: int = 0
+    duration: float = 0.0
+
+    @property
+    def duration_ms(self) -> float:
+        """Time spent in statements, in milliseconds."""
+        return self.duration * 1000
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def begin_query_stats() -> Token:
+    """Start accounting queries executed in the current context.
+
+    SQLAlchemy runs cursor events in greenlets that share the calling task's
+    context, so queries issued while handling a request land in its stats.
+    """
+    return _current_stats.set(QueryStats())
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Get the stats of the current context, if accounting was started."""
+    return _current_stats.get()
+
+
+def end_query_stats(token: Token) -> None:
+    """Stop accounting started by ``begin_query_stats``."""
+    _current_stats.reset(token)
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bound values by their type names, keeping the shape."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: the first row is representative
+            return {"rows": len(parameters), "first": redact_parameters(parameters[0])}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def instrument_engine(engine: Engine, slow_query_threshold: float = 0.0) -> None:
+    """Time every statement on ``engine``.
+
+    Durations are added to the current ``QueryStats``; statements taking at
+    least ``slow_query_threshold`` seconds (0 disables) are logged with their
+    parameters redacted.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info[_START_TIMES_KEY].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+        if slow_query_threshold and elapsed >= slow_query_threshold:
+            logger.warn(
+                "Slow query",
+                duration_ms=round(elapsed * 1000, 2),
+                statement=statement[:MAX_LOGGED_STATEMENT_LENGTH],
+                parameters=redact_parameters(parameters),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # Failed statements never reach after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(_START_TIMES_KEY):
+            connection.info[_START_TIMES_KEY].pop()
@@ -0,0 +1,133 @@
+"""Write-behind buffer that turns many small writes into batched ones."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+
+from src.infrastructure.configs.loggers import logger
+
+T = TypeVar("T")
+
+RETRY_MAX_DELAY = 5.0
+
+
+@dataclass
+class WriteBehindStats:
+    """Counters of a write-behind buffer."""
+
+    flushed: int = 0
+    batches: int = 0
+    failures: int = 0
+    dropped: int = 0
+
+
+class WriteBehindBuffer(Generic[T]):
+    """Collects items in memory and hands them to ``flush`` in batches.
+
+    ``add`` never waits on storage. A background task flushes as soon as
+    ``max_batch`` items are waiting, or ``max_delay`` seconds after the first
+    of a smaller batch arrived. A failed batch is retried with backoff, ahead
+    of newer items; past ``max_pending`` items the oldest are dropped, so an
+    outage costs bounded memory. Items keep their order across batches.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[None]],
+        max_batch: int = 500,
+        max_delay: float = 0.05,
+        max_pending: int = 50_000,
+    ):
+        """Initialize buffer limits."""
+        self._flush = flush
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max(max_pending, max_batch)
+        self._pending: List[T] = []
+        self._in_flight: List[T] = []
+        self._has_items = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = WriteBehindStats()
+
+    def __len__(self) -> int:
+        """Number of items not yet written."""
+        return len(self._in_flight) + len(self._pending)
+
+    def unwritten(self) -> List[T]:
+        """Items not yet written, oldest first, including the batch being flushed."""
+        return self._in_flight + self._pending
+
+    def add(self, item: T) -> None:
+        """Queue an item for the next flush."""
+        self._pending.append(item)
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.stats.dropped += overflow
+        self._has_items.set()
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the flusher and write everything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # A batch interrupted mid-flush goes back in front of the rest
+        self._pending[:0] = self._in_flight
+        self._in_flight = []
+        while self._pending:
+            if not await self._flush_batch():
+                logger.error("[write-behind] dropping unwritten items at shutdown", dropped=len(self._pending))
+                self.stats.dropped += len(self._pending)
+                self._pending.clear()
+
+    async def _run(self) -> None:
+        delay = 0.1
+        while True:
+            await self._has_items.wait()
+            if len(self._pending) < self.max_batch:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+            while self._pending:
+                if await self._flush_batch():
+                    delay = 0.1
+                    continue
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RETRY_MAX_DELAY)
+            self._has_items.clear()
+            self._full.clear()
+
+    async def _flush_batch(self) -> bool:
+        batch = self._in_flight = self._pending[:self.max_batch]
+        del self._pending[:len(batch)]
+        if len(self._pending) < self.max_batch:
+            self._full.clear()
+        try:
+            await self._flush(batch)
+        except Exception as e:
+            self.stats.failures += 1
+            logger.error("[write-behind] flush failed", items=len(batch), error=str(e))
+            self._in_flight = []
+            self._pending[:0] = batch
+            overflow = len(self._pending) - self.max_pending
+            if overflow > 0:
+                del self._pending[:overflow]
+                self.stats.dropped += overflow
+            return False
+        self._in_flight = []
+        self.stats.flushed += len(batch)
+        self.stats.batches += 1
+        return True
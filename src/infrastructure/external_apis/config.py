@@ -0,0 +1,40 @@
+"""Email delivery configuration."""
+
+from typing import Optional
+
+from pydantic import Field
+from src.infrastructure.configs.config_init import ConfigInit
+
+
+class EmailConfig(ConfigInit):
+
+    # Email delivery is disabled while no SMTP host is configured
+    smtp_host: Optional[str] = Field(default=None, alias="SMTP_HOST")
+    smtp_port: int = Field(default=587, alias="SMTP_PORT")
+    smtp_username: str = Field(default="", alias="SMTP_USERNAME")
+    smtp_password: str = Field(default="", alias="SMTP_PASSWORD")
+    from_email: str = Field(default="no-reply@example.com", alias="SMTP_FROM_EMAIL")
+    smtp_starttls: bool = Field(default=True, alias="SMTP_STARTTLS")
+    smtp_timeout: float = Field(default=30.0, gt=0, alias="SMTP_TIMEOUT")
+    # Persistent connections per worker; each sends on its own thread
+    smtp_pool_size: int = Field(default=4, ge=1, alias="SMTP_POOL_SIZE")
+    # Reconnect after this many messages (servers cap messages per session)
+    smtp_max_messages_per_connection: int = Field(default=100, ge=1, alias="SMTP_MAX_MESSAGES_PER_CONNECTION")
+    # Idle connections are checked with NOOP before reuse after this long
+    smtp_keepalive_seconds: float = Field(default=30.0, ge=0, alias="SMTP_KEEPALIVE_SECONDS")
+    # Email outbox worker: emails claimed per round and sent over this many connections at once
+    outbox_batch_size: int = Field(default=100, ge=1, alias="EMAIL_OUTBOX_BATCH_SIZE")
+    outbox_concurrency: int = Field(default=4, ge=1, alias="EMAIL_OUTBOX_CONCURRENCY")
+    # Retries back off exponentially from the base delay; the email is dead after max attempts
+    outbox_max_attempts: int = Field(default=8, ge=1, alias="EMAIL_OUTBOX_MAX_ATTEMPTS")
+    outbox_retry_base_seconds: float = Field(default=30.0, gt=0, alias="EMAIL_OUTBOX_RETRY_BASE_SECONDS")
+    outbox_retry_max_seconds: float = Field(default=3600.0, gt=0, alias="EMAIL_OUTBOX_RETRY_MAX_SECONDS")
+    # A claimed email is retried after this long if its worker never reported back
+    outbox_lease_seconds: float = Field(default=300.0, gt=0, alias="EMAIL_OUTBOX_LEASE_SECONDS")
+    # Pause after a round that found nothing due
+    outbox_poll_interval_ms: float = Field(default=1000.0, gt=0, alias="EMAIL_OUTBOX_POLL_INTERVAL_MS")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether email is delivered (and therefore queued) at all."""
+        return bool(self.smtp_host)
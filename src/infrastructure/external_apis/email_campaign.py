@@ -0,0 +1,153 @@
+"""Bulk personalized email campaigns queued through the email outbox."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncContextManager, Callable, Dict, List, Mapping, Optional
+
+from src.domain.entities.outbound_email import OutboundEmail
+from src.domain.entities.user import User
+from src.domain.repositories.unit_of_work import UnitOfWork
+from src.domain.value_objects.page_cursor import PageCursor
+from src.infrastructure.configs.loggers import logger
+
+from .email_templates import EmailTemplate
+
+
+@dataclass
+class CampaignResult:
+    """Outcome of a campaign run."""
+
+    queued: int = 0
+    already_queued: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def user_template_values(user: User) -> Dict[str, str]:
+    """Template values describing a user."""
+    full_name = user.full_name
+    return {
+        "email": str(user.email),
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "full_name": full_name,
+        "user_name": full_name,
+    }
+
+
+class EmailCampaign:
+    """Queues one template, personalized, for every user in the email outbox.
+
+    Users are read one keyset page (``find_page``) at a time. Each page is
+    rendered and queued in its own short transaction, so no transaction
+    spans the campaign and memory stays bounded by ``page_size``. Every
+    email carries the dedup key ``campaign:<campaign_id>:<user_id>``, so a
+    run resumed after a crash (same ``campaign_id``) only queues the users
+    the previous run did not reach. ``EmailOutboxWorker`` delivers the
+    emails in batches over pooled connections, with retries.
+    """
+
+    def __init__(self, unit_of_work_factory: Callable[[], AsyncContextManager[UnitOfWork]], page_size: int = 500):
+        """Initialize with a factory of units of work (one per page) and the page size."""
+        self._unit_of_work_factory = unit_of_work_factory
+        self.page_size = page_size
+
+    async def send(
+        self,
+        campaign_id: str,
+        template: EmailTemplate,
+        values: Callable[[User], Mapping[str, object]] = user_template_values,
+        active_only: bool = True,
+    ) -> CampaignResult:
+        """Queue ``template`` for every (active) user not yet queued by ``campaign_id``."""
+        result = CampaignResult()
+        cursor: Optional[PageCursor] = None
+        while True:
+            async with self._unit_of_work_factory() as unit_of_work:
+                async with unit_of_work:
+                    users = await unit_of_work.users.find_page(limit=self.page_size, cursor=cursor)
+                    emails = self._render(campaign_id, template, users, values, active_only, result)
+                    queued = await unit_of_work.emails.add_many(emails)
+            result.queued += len(queued)
+            result.already_queued += len(emails) - len(queued)
+            if len(users) < self.page_size:
+                return result
+            cursor = PageCursor.after(users[-1].created_at, users[-1].id)
+
+    @staticmethod
+    def _render(
+        campaign_id: str,
+        template: EmailTemplate,
+        users: List[User],
+        values: Callable[[User], Mapping[str, object]],
+        active_only: bool,
+        result: CampaignResult,
+    ) -> List[OutboundEmail]:
+        emails = []
+        for user in users:
+            if active_only and not user.is_active:
+                result.skipped += 1
+                continue
+            try:
+                subject, body = template.render(values(user))
+                emails.append(OutboundEmail(
+                    to=str(user.email), subject=subject, body=body, dedup_key=f"campaign:{campaign_id}:{user.id}"
+                ))
+            except ValueError as e:
+                logger.error("[email] cannot render campaign email", user_id=str(user.id), error=str(e))
+                result.failed += 1
+        return emails
+
+
+async def main() -> None:
+    """Queue a template for every active user, from the command line."""
+    import argparse
+    from contextlib import asynccontextmanager
+
+    from src.infrastructure.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+    from src.infrastructure.database.config import DatabaseConfig
+    from src.infrastructure.database.connection import DatabaseConnection
+
+    from .config import EmailConfig
+    from .email_templates import TEMPLATES
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--campaign-id", required=True, help="run again with the same id to resume")
+    parser.add_argument("--template", choices=sorted(TEMPLATES), help="built-in template")
+    parser.add_argument("--subject", help="subject of a custom template ($first_name etc. allowed)")
+    parser.add_argument("--body-file", help="HTML file of a custom template")
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+    if args.template:
+        template = TEMPLATES[args.template]
+    elif args.subject and args.body_file:
+        with open(args.body_file, encoding="utf-8") as body_file:
+            template = EmailTemplate(args.subject, body_file.read())
+    else:
+        parser.error("give --template, or --subject with --body-file")
+
+    if not EmailConfig().enabled:
+        parser.error("SMTP_HOST is not configured, so nothing would deliver the queued emails")
+    db_connection = DatabaseConnection(DatabaseConfig())
+
+    @asynccontextmanager
+    async def unit_of_work():
+        async with db_connection.async_session_factory() as session:
+            yield SqlAlchemyUnitOfWork(session)
+
+    try:
+        result = await EmailCampaign(unit_of_work, page_size=args.page_size).send(args.campaign_id, template)
+        logger.info(
+            "[email] campaign queued",
+            campaign_id=args.campaign_id,
+            queued=result.queued,
+            already_queued=result.already_queued,
+            failed=result.failed,
+            skipped=result.skipped,
+        )
+    finally:
+        await db_connection.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,141 @@
+"""Background delivery of the email outbox."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.outbound_email import EmailStatus, OutboundEmail
+from src.infrastructure.adapters.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+from src.infrastructure.configs.loggers import logger
+
+from .pooled_smtp_email_service import PooledSMTPEmailService
+from .smtp_email_service import PreparedMessage
+
+RETRY_MAX_DELAY = 30.0
+
+
+@dataclass
+class EmailOutboxStats:
+    """Counters of an email outbox worker."""
+
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+
+
+class EmailOutboxWorker:
+    """Delivers queued emails in batches over pooled SMTP connections.
+
+    Each round claims up to ``batch_size`` due emails, splits them across
+    ``concurrency`` connections (each chunk is sent back to back on one
+    connection) and stores every outcome with one statement. Failed emails
+    are retried with exponential backoff and marked dead after
+    ``max_attempts``; one that cannot be serialized is marked dead at once. Rounds follow each other immediately while batches
+    come back full and every ``poll_interval`` seconds otherwise.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        sender: PooledSMTPEmailService,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        max_attempts: int = 8,
+        retry_base_delay: float = 30.0,
+        retry_max_delay: float = 3600.0,
+        lease_seconds: float = 300.0,
+        poll_interval: float = 1.0,
+    ):
+        """Initialize with a session factory, the SMTP sender and delivery limits."""
+        self._session_factory = session_factory
+        self._sender = sender
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.stats = EmailOutboxStats()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start delivering in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop delivering; claimed emails are retried once their lease expires."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def process_once(self) -> int:
+        """Deliver one batch of due emails; return how many were attempted."""
+        async with self._session_factory() as session:
+            emails = await EmailOutboxRepositoryImpl(session).claim_due(
+                self.batch_size, datetime.now(timezone.utc), self.lease_seconds
+            )
+        if not emails:
+            return 0
+
+        # Prepared one by one: an email that cannot be serialized (e.g. a line
+        # break in its subject) fails alone and is not retried
+        prepared = []
+        for email in emails:
+            try:
+                prepared.append((email, self._sender.prepare_message(email.to, email.subject, email.body)))
+            except ValueError as e:
+                email.record_rejected(str(e))
+                self.stats.dead += 1
+                logger.error("[email] rejected", email_id=email.id, error=str(e))
+
+        chunks = [prepared[i::self.concurrency] for i in range(min(self.concurrency, len(prepared)))]
+        chunk_results = await asyncio.gather(*(self._send(chunk) for chunk in chunks))
+
+        finished_at = datetime.now(timezone.utc)
+        for chunk, results in zip(chunks, chunk_results):
+            for (email, _), delivered in zip(chunk, results):
+                if delivered:
+                    email.record_sent(finished_at)
+                    self.stats.sent += 1
+                    continue
+                email.record_failure(
+                    "SMTP delivery failed", finished_at, self.max_attempts, self.retry_base_delay, self.retry_max_delay
+                )
+                if email.status is EmailStatus.DEAD:
+                    self.stats.dead += 1
+                    logger.error("[email] giving up", email_id=email.id, to=email.to, attempts=email.attempts)
+                else:
+                    self.stats.retried += 1
+
+        async with self._session_factory() as session:
+            await EmailOutboxRepositoryImpl(session).save_results(emails)
+        return len(emails)
+
+    async def _send(self, chunk: List[Tuple[OutboundEmail, PreparedMessage]]) -> List[bool]:
+        try:
+            return await self._sender.send_messages([message for _, message in chunk])
+        except Exception as e:
+            logger.error("[email] batch delivery failed", emails=len(chunk), error=str(e))
+            return [False] * len(chunk)
+
+    async def _run(self) -> None:
+        delay = self.poll_interval
+        while True:
+            try:
+                processed = await self.process_once()
+                delay = self.poll_interval
+            except Exception as e:
+                logger.error("[email] outbox round failed", error=str(e))
+                processed = 0
+                delay = min(max(delay, self.poll_interval) * 2, RETRY_MAX_DELAY)
+            if processed < self.batch_size:
+                await asyncio.sleep(delay)
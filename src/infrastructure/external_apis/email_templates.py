@@ -0,0 +1,116 @@
+"""Email templates, compiled once and rendered per recipient."""
+
+import html
+import re
+from string import Template
+from typing import Dict, FrozenSet, Mapping, Tuple
+
+# ``$name`` / ``${name}`` placeholders and ``$$`` escapes, as in ``string.Template``
+_PLACEHOLDER: re.Pattern = Template.pattern
+
+
+def _compile(source: str) -> Tuple[str, FrozenSet[str]]:
+    """Translate ``$name`` placeholders into a ``str.format`` string and its field names."""
+    fields = set()
+
+    def replace(match: re.Match) -> str:
+        if match.group("escaped") is not None:
+            return "$"
+        name = match.group("named") or match.group("braced")
+        if name is None:
+            raise ValueError(f"Invalid placeholder in email template at index {match.start()}")
+        fields.add(name)
+        return "{" + name + "}"
+
+    parts = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(source):
+        parts.append(source[position:match.start()].replace("{", "{{").replace("}", "}}"))
+        parts.append(replace(match))
+        position = match.end()
+    parts.append(source[position:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts), frozenset(fields)
+
+
+def _has_line_break(value: str) -> bool:
+    return "\r" in value or "\n" in value
+
+
+class EmailTemplate:
+    """Subject and HTML body with ``$name`` placeholders.
+
+    Both are compiled once into ``str.format`` strings, so rendering a
+    message is one C-level ``format_map`` per part. Values are HTML-escaped
+    in the body; in the subject, a header, they must not contain line breaks.
+    """
+
+    __slots__ = ("_subject", "_subject_fields", "_body", "fields")
+
+    def __init__(self, subject: str, body: str):
+        """Compile the subject and body."""
+        if _has_line_break(subject):
+            raise ValueError("Email subject must not contain line breaks")
+        self._subject, self._subject_fields = _compile(subject)
+        self._body, body_fields = _compile(body)
+        self.fields = self._subject_fields | body_fields
+
+    def render(self, values: Mapping[str, object]) -> Tuple[str, str]:
+        """Subject and HTML body for one recipient."""
+        missing = self.fields.difference(values)
+        if missing:
+            raise ValueError(f"Missing email template values: {', '.join(sorted(missing))}")
+        escaped = {name: html.escape(str(values[name])) for name in self.fields}
+        subject_values = {name: str(values[name]) for name in self._subject_fields}
+        for name, value in subject_values.items():
+            if _has_line_break(value):
+                raise ValueError(f"Email subject value {name} must not contain line breaks")
+        return self._subject.format_map(subject_values), self._body.format_map(escaped)
+
+
+WELCOME = EmailTemplate(
+    "Welcome to our platform!",
+    """
+        <html>
+        <body>
+            <h2>Welcome $user_name!</h2>
+            <p>Thank you for joining our platform. We're excited to have you on board!</p>
+            <p>If you have any questions, feel free to reach out to our support team.</p>
+            <br>
+            <p>Best regards,<br>The Team</p>
+        </body>
+        </html>
+        """,
+)
+
+PASSWORD_RESET = EmailTemplate(
+    "Password Reset Request",
+    """
+        <html>
+        <body>
+            <h2>Password Reset Request</h2>
+            <p>You have requested to reset your password.</p>
+            <p>Click the link below to reset your password:</p>
+            <a href="https://yourapp.com/reset-password?token=$reset_token">Reset Password</a>
+            <p>This link will expire in 1 hour.</p>
+            <p>If you didn't request this, please ignore this email.</p>
+            <br>
+            <p>Best regards,<br>The Team</p>
+        </body>
+        </html>
+        """,
+)
+
+TEMPLATES: Dict[str, EmailTemplate] = {
+    "welcome": WELCOME,
+    "password_reset": PASSWORD_RESET,
+}
+
+
+def welcome_email(user_name: str) -> Tuple[str, str]:
+    """Subject and HTML body of the welcome email."""
+    return WELCOME.render({"user_name": user_name})
+
+
+def password_reset_email(reset_token: str) -> Tuple[str, str]:
+    """Subject and HTML body of the password reset email."""
+    return PASSWORD_RESET.render({"reset_token": reset_token})
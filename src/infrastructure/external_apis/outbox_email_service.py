@@ -0,0 +1,42 @@
+"""Email service that queues messages in the email outbox."""
+
+from typing import Any
+
+from src.domain.entities.outbound_email import OutboundEmail
+from src.domain.repositories.email_outbox_repository import EmailOutboxRepository
+
+from .email_service import EmailService
+from .email_templates import password_reset_email, welcome_email
+
+
+class OutboxEmailService(EmailService):
+    """Email service that stores messages for the outbox worker to deliver.
+
+    Sending is one INSERT, in the caller's transaction when the repository
+    comes from a unit of work, so an email is queued if and only if the
+    change that triggered it commits. Storage errors propagate instead of
+    returning False, so that transaction rolls back.
+    """
+
+    def __init__(self, email_outbox_repository: EmailOutboxRepository):
+        """Initialize with the outbox repository."""
+        self._email_outbox_repository = email_outbox_repository
+
+    async def queue_email(self, to: str, subject: str, body: str) -> OutboundEmail:
+        """Queue an email and return it, with the ID its status is tracked under."""
+        return await self._email_outbox_repository.add(OutboundEmail(to=to, subject=subject, body=body))
+
+    async def send_email(self, to: str, subject: str, body: str, **kwargs: Any) -> bool:
+        """Queue an email for delivery."""
+        await self.queue_email(to, subject, body)
+        return True
+
+    async def send_welcome_email(self, user_email: str, user_name: str) -> bool:
+        """Queue the welcome email of a new user."""
+        subject, body = welcome_email(user_name)
+        return await self.send_email(user_email, subject, body)
+
+    async def send_password_reset_email(self, user_email: str, reset_token: str) -> bool:
+        """Queue a password reset email."""
+        subject, body = password_reset_email(reset_token)
+        return await self.send_email(user_email, subject, body)
@@ -0,0 +1,174 @@
+"""SMTP email service over a pool of persistent connections."""
+
+import asyncio
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import Any, List, Optional, Tuple, Union
+
+from src.infrastructure.configs.loggers import logger
+
+from .smtp_email_service import PreparedMessage, SMTPEmailService
+
+OutgoingMessage = Union[Message, PreparedMessage]
+
+
+def _recipient(msg: OutgoingMessage) -> str:
+    return msg.to if isinstance(msg, PreparedMessage) else msg["To"]
+
+
+class _PooledConnection:
+    __slots__ = ("smtp", "sent", "last_used")
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.sent = 0
+        self.last_used = time.monotonic()
+
+
+class PooledSMTPEmailService(SMTPEmailService):
+    """SMTP email service that keeps authenticated connections open.
+
+    Up to ``pool_size`` connections are opened on demand and reused, so the
+    connect, STARTTLS and login round trips are paid once per connection
+    instead of once per message. All socket work runs on a thread pool of
+    the same size; the event loop only waits for a free connection. A
+    connection idle longer than ``keepalive`` is checked with NOOP before
+    reuse, one that served ``max_messages_per_connection`` messages is
+    replaced, and a message whose connection dropped is retried once on a
+    new one.
+    """
+
+    def __init__(
+        self,
+        smtp_host: str,
+        smtp_port: int,
+        username: str,
+        password: str,
+        from_email: str,
+        starttls: bool = True,
+        timeout: float = 30.0,
+        pool_size: int = 4,
+        max_messages_per_connection: int = 100,
+        keepalive: float = 30.0,
+    ):
+        """Initialize SMTP settings and pool limits."""
+        super().__init__(smtp_host, smtp_port, username, password, from_email, starttls, timeout)
+        self.pool_size = pool_size
+        self.max_messages_per_connection = max_messages_per_connection
+        self.keepalive = keepalive
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="smtp")
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: List[_PooledConnection] = []
+        self.connections_opened = 0
+
+    async def send_email(self, to: str, subject: str, body: str, **kwargs: Any) -> bool:
+        """Send an email on a pooled connection."""
+        try:
+            msg = self.prepare_message(to, subject, body)
+        except Exception as e:
+            logger.error("Failed to send email", to=to, error=str(e))
+            return False
+        results = await self.send_messages([msg])
+        return results[0]
+
+    async def send_messages(self, messages: List[OutgoingMessage]) -> List[bool]:
+        """Send messages one after another on a single pooled connection.
+
+        Messages come from ``build_message`` or, cheaper, ``prepare_message``.
+        Returns whether each message was accepted by the server.
+        """
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else None
+            loop = asyncio.get_running_loop()
+            try:
+                connection, results = await loop.run_in_executor(
+                    self._executor, self._deliver, connection, messages
+                )
+            except BaseException:
+                connection = None
+                raise
+            finally:
+                if connection is not None:
+                    self._idle.append(connection)
+        return results
+
+    async def close(self) -> None:
+        """Close idle connections and stop the worker threads."""
+        idle, self._idle = self._idle, []
+        loop = asyncio.get_running_loop()
+        for connection in idle:
+            await loop.run_in_executor(self._executor, self._quit, connection)
+        self._executor.shutdown(wait=False)
+
+    def _deliver(
+        self, connection: Optional[_PooledConnection], messages: List[OutgoingMessage]
+    ) -> Tuple[Optional[_PooledConnection], List[bool]]:
+        # Runs on a pool thread; owns ``connection`` until it returns
+        results = []
+        for index, msg in enumerate(messages):
+            for attempt in (1, 2):
+                try:
+                    connection = self._usable(connection)
+                except (smtplib.SMTPException, OSError) as e:
+                    # Cannot connect or log in: the rest of the batch would fail the same way
+                    logger.error("Failed to connect to SMTP server", error=str(e))
+                    results.extend([False] * (len(messages) - index))
+                    return None, results
+                try:
+                    if isinstance(msg, PreparedMessage):
+                        connection.smtp.sendmail(self.from_email, [msg.to], msg.data)
+                    else:
+                        connection.smtp.send_message(msg)
+                    connection.sent += 1
+                    connection.last_used = time.monotonic()
+                    results.append(True)
+                    break
+                except smtplib.SMTPException as e:
+                    if not isinstance(e, smtplib.SMTPServerDisconnected):
+                        # Refused by the server (e.g. a 5xx for the recipient): the
+                        # connection is fine and sending again would be refused too
+                        logger.error("Failed to send email", to=_recipient(msg), error=str(e))
+                        results.append(False)
+                        break
+                    error = e
+                except OSError as e:
+                    # Checked after SMTPException, which subclasses OSError
+                    error = e
+                # Dropped connection or socket error: retry once on a fresh connection
+                self._discard(connection)
+                connection = None
+                if attempt == 2:
+                    logger.error("Failed to send email", to=_recipient(msg), error=str(error))
+                    results.append(False)
+        return connection, results
+
+    def _usable(self, connection: Optional[_PooledConnection]) -> _PooledConnection:
+        if connection is not None and connection.sent >= self.max_messages_per_connection:
+            self._quit(connection)
+            connection = None
+        if connection is not None and time.monotonic() - connection.last_used > self.keepalive:
+            try:
+                alive = connection.smtp.noop()[0] == 250
+            except (smtplib.SMTPException, OSError):
+                alive = False
+            if not alive:
+                self._discard(connection)
+                connection = None
+        if connection is None:
+            connection = _PooledConnection(self._connect())
+            self.connections_opened += 1
+        return connection
+
+    @staticmethod
+    def _quit(connection: _PooledConnection) -> None:
+        try:
+            connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.smtp.close()
+
+    @staticmethod
+    def _discard(connection: Optional[_PooledConnection]) -> None:
+        if connection is not None:
+            connection.smtp.close()
@@ -1,11 +1,26 @@
 """SMTP email service implementation."""
 
+import asyncio
+import base64
 import smtplib
+from dataclasses import dataclass
+from email.header import Header
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Any
 
+from src.infrastructure.configs.loggers import logger
+
 from .email_service import EmailService
+from .email_templates import password_reset_email, welcome_email
+
+
+@dataclass(frozen=True)
+class PreparedMessage:
+    """Message already serialized for the SMTP ``DATA`` command."""
+
+    to: str
+    data: bytes
 
 
 class SMTPEmailService(EmailService):
@@ -18,6 +33,8 @@ class SMTPEmailService(EmailService):
         username: str,
         password: str,
         from_email: str,
+        starttls: bool = True,
+        timeout: float = 30.0,
     ):
         """Initialize SMTP email service."""
         self.smtp_host = smtp_host
@@ -25,58 +42,69 @@ class SMTPEmailService(EmailService):
         self.username = username
         self.password = password
         self.from_email = from_email
+        self.starttls = starttls
+        self.timeout = timeout
 
     async def send_email(self, to: str, subject: str, body: str, **kwargs: Any) -> bool:
-        """Send an email via SMTP."""
+        """Send an email via SMTP on a new connection, off the event loop."""
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.from_email
-            msg['To'] = to
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'html'))
-            
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
-            
+            msg = self.prepare_message(to, subject, body)
+            await asyncio.to_thread(self._send_on_new_connection, msg)
             return True
         except Exception as e:
-            print(f"Failed to send email: {e}")
+            logger.error("Failed to send email", to=to, error=str(e))
             return False
 
+    def build_message(self, to: str, subject: str, body: str) -> MIMEMultipart:
+        """Build an HTML message."""
+        msg = MIMEMultipart()
+        msg['From'] = self.from_email
+        msg['To'] = to
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'html'))
+        return msg
+
+    def prepare_message(self, to: str, subject: str, body: str) -> PreparedMessage:
+        """Serialize a single-part HTML message directly, without building a MIME tree.
+
+        Much cheaper than ``build_message`` for bulk sends; the headers and
+        the base64 body are what the ``email`` package would generate.
+        """
+        if any(c in value for value in (to, subject) for c in "\r\n"):
+            raise ValueError("Email headers must not contain line breaks")
+        if not subject.isascii():
+            subject = Header(subject, "utf-8").encode()
+        head = (
+            f"From: {self.from_email}\r\nTo: {to}\r\nSubject: {subject}\r\n"
+            "MIME-Version: 1.0\r\nContent-Type: text/html; charset=\"utf-8\"\r\n"
+            "Content-Transfer-Encoding: base64\r\n\r\n"
+        )
+        encoded = base64.encodebytes(body.encode()).replace(b"\n", b"\r\n")
+        return PreparedMessage(to, head.encode() + encoded)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection, upgraded to TLS and logged in as configured (blocking)."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def _send_on_new_connection(self, msg: PreparedMessage) -> None:
+        with self._connect() as server:
+            server.sendmail(self.from_email, [msg.to], msg.data)
+
     async def send_welcome_email(self, user_email: str, user_name: str) -> bool:
         """Send welcome email to new user."""
-        subject = "Welcome to our platform!"
-        body = f"""
-        <html>
-        <body>
-            <h2>Welcome {user_name}!</h2>
-            <p>Thank you for joining our platform. We're excited to have you on board!</p>
-            <p>If you have any questions, feel free to reach out to our support team.</p>
-            <br>
-            <p>Best regards,<br>The Team</p>
-        </body>
-        </html>
-        """
+        subject, body = welcome_email(user_name)
         return await self.send_email(user_email, subject, body)
 
     async def send_password_reset_email(self, user_email: str, reset_token: str) -> bool:
         """Send password reset email."""
-        subject = "Password Reset Request"
-        body = f"""
-        <html>
-        <body>
-            <h2>Password Reset Request</h2>
-            <p>You have requested to reset your password.</p>
-            <p>Click the link below to reset your password:</p>
-            <a href="https://yourapp.com/reset-password?token={reset_token}">Reset Password</a>
-            <p>This link will expire in 1 hour.</p>
-            <p>If you didn't request this, please ignore this email.</p>
-            <br>
-            <p>Best regards,<br>The Team</p>
-        </body>
-        </html>
-        """
+        subject, body = password_reset_email(reset_token)
         return await self.send_email(user_email, subject, body)
@@ -0,0 +1,175 @@
+"""Local SMTP stand-in for development, tests and benchmarks."""
+
+import base64
+import socketserver
+import threading
+import time
+from dataclasses import dataclass
+from typing import Collection, List, Optional
+
+
+@dataclass
+class ReceivedMessage:
+    """A message accepted by the local SMTP server."""
+
+    mail_from: str
+    recipients: List[str]
+    data: str
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    server: "_ThreadingServer"
+
+    def handle(self) -> None:
+        sink = self.server.sink
+        sink._connected()
+        time.sleep(sink.connect_latency)
+        self._reply("220 localhost ESMTP stand-in")
+        mail_from, recipients, received = None, [], 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").rstrip("\r\n")
+            verb = command.split(" ", 1)[0].upper()
+            time.sleep(sink.latency)
+            if verb in ("EHLO", "HELO"):
+                self._reply("250-localhost", "250-AUTH PLAIN", "250 8BITMIME" if verb == "EHLO" else "250 OK")
+            elif verb == "AUTH":
+                self._reply("235 Authentication successful" if self._authenticate(command) else "535 Bad credentials")
+            elif verb == "MAIL":
+                mail_from, recipients = command.split(":", 1)[1].strip(), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipient = command.split(":", 1)[1].strip()
+                if recipient.strip("<>") in sink.reject_recipients:
+                    self._reply("550 No such user")
+                    continue
+                recipients.append(recipient)
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                sink._received(ReceivedMessage(mail_from or "", recipients, self._read_data()))
+                mail_from, recipients, received = None, [], received + 1
+                self._reply("250 OK: queued")
+                if sink.drop_after is not None and received >= sink.drop_after:
+                    return
+            elif verb == "RSET":
+                mail_from, recipients = None, []
+                self._reply("250 OK")
+            elif verb == "NOOP":
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _authenticate(self, command: str) -> bool:
+        sink = self.server.sink
+        if sink.username is None:
+            return True
+        parts = command.split()
+        if len(parts) < 3:
+            return False
+        _, username, password = base64.b64decode(parts[2]).decode().split("\0")
+        return username == sink.username and password == sink.password
+
+    def _read_data(self) -> str:
+        lines = []
+        while True:
+            raw = self.rfile.readline()
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            if line == "." or not raw:
+                return "\n".join(lines)
+            lines.append(line[1:] if line.startswith("..") else line)
+
+    def _reply(self, *lines: str) -> None:
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    sink: "LocalSMTPServer"
+
+
+class LocalSMTPServer:
+    """In-process SMTP server that accepts every message and keeps it in memory.
+
+    Plain SMTP only (no STARTTLS). ``latency`` delays every reply and
+    ``connect_latency`` the greeting, to stand in for network round trips
+    and the TLS and login handshakes of a real server. With ``drop_after``
+    the server hangs up after that many messages on a connection, and
+    addresses in ``reject_recipients`` are refused with a 550.
+
+    Run ``python -m src.infrastructure.external_apis.smtp_sink`` to serve on
+    port 1025 for local development.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        connect_latency: float = 0.0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        drop_after: Optional[int] = None,
+        reject_recipients: Collection[str] = (),
+    ):
+        """Initialize server settings; ``port=0`` picks a free port."""
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.username = username
+        self.password = password
+        self.drop_after = drop_after
+        self.reject_recipients = frozenset(reject_recipients)
+        self.messages: List[ReceivedMessage] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server: Optional[_ThreadingServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LocalSMTPServer":
+        """Start serving on a background thread."""
+        self._server = _ThreadingServer((self.host, self.port), _SMTPHandler)
+        self._server.sink = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "LocalSMTPServer":
+        """Start on entering a ``with`` block."""
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop on leaving a ``with`` block."""
+        self.stop()
+
+    def _connected(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def _received(self, message: ReceivedMessage) -> None:
+        with self._lock:
+            self.messages.append(message)
+
+
+if __name__ == "__main__":
+    server = LocalSMTPServer(port=1025).start()
+    print(f"SMTP stand-in listening on {server.host}:{server.port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
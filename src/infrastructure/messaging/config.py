@@ -0,0 +1,65 @@
+"""Messaging configuration."""
+
+from typing import Optional
+
+from pydantic import Field
+from src.infrastructure.configs.config_init import ConfigInit
+
+
+class SocketIOConfig(ConfigInit):
+
+    # redis://... routes emits across workers and pods; memory:// across servers
+    # in one process; unset keeps the in-process manager (single worker only)
+    message_queue: Optional[str] = Field(default=None, alias="SOCKETIO_MESSAGE_QUEUE")
+    channel: str = Field(default="socketio", alias="SOCKETIO_CHANNEL")
+    # Outbound packets buffered per connection before the slow-client policy applies
+    outbound_queue_size: int = Field(default=256, ge=1, alias="SOCKETIO_OUTBOUND_QUEUE_SIZE")
+    # drop_oldest, drop_newest or disconnect
+    slow_client_policy: str = Field(default="drop_oldest", alias="SOCKETIO_SLOW_CLIENT_POLICY")
+    # Merge queued receive_message events into receive_message_batch
+    coalesce: bool = Field(default=True, alias="SOCKETIO_COALESCE")
+    # Inbound send_message rate per connection (token bucket)
+    message_rate: float = Field(default=10.0, gt=0, alias="SOCKETIO_MESSAGE_RATE")
+    message_burst: float = Field(default=20.0, gt=0, alias="SOCKETIO_MESSAGE_BURST")
+    # Chat messages to users are stored through a write-behind buffer, flushed
+    # every SOCKETIO_HISTORY_FLUSH_SIZE items or SOCKETIO_HISTORY_FLUSH_INTERVAL_MS
+    history_enabled: bool = Field(default=True, alias="SOCKETIO_HISTORY_ENABLED")
+    history_flush_size: int = Field(default=500, ge=1, alias="SOCKETIO_HISTORY_FLUSH_SIZE")
+    history_flush_interval_ms: float = Field(default=50.0, gt=0, alias="SOCKETIO_HISTORY_FLUSH_INTERVAL_MS")
+    # Unwritten messages kept while the database is unavailable; older ones are dropped
+    history_max_pending: int = Field(default=50_000, ge=1, alias="SOCKETIO_HISTORY_MAX_PENDING")
+    # Missed messages delivered when a user connects
+    history_replay_limit: int = Field(default=500, ge=1, alias="SOCKETIO_HISTORY_REPLAY_LIMIT")
+
+
+class OutboxConfig(ConfigInit):
+
+    # Relay outbox events to Socket.IO from this process (needs Socket.IO enabled
+    # and SOCKETIO_MESSAGE_QUEUE; memory:// suits a single process without Redis)
+    relay_enabled: bool = Field(default=True, alias="OUTBOX_RELAY_ENABLED")
+    # Write domain events to the outbox; defaults to whether this process relays
+    # them (set true when other processes, e.g. Socket.IO pods, relay them)
+    record_events: Optional[bool] = Field(default=None, alias="OUTBOX_RECORD_EVENTS")
+    # Events published per round; full rounds are followed by the next one at once
+    batch_size: int = Field(default=500, ge=1, alias="OUTBOX_BATCH_SIZE")
+    # Pause after a round that emptied the outbox
+    poll_interval_ms: float = Field(default=200.0, gt=0, alias="OUTBOX_POLL_INTERVAL_MS")
+
+    @property
+    def emits_reach_all_clients(self) -> bool:
+        """Whether an emit from this process reaches clients of every worker."""
+        # Only a message queue guarantees it: the process count is unknown here
+        # (e.g. ``uvicorn main:app --workers N`` bypasses main())
+        return bool(self.socketio_message_queue)
+
+    @property
+    def relay_active(self) -> bool:
+        """Whether this process runs the relay."""
+        # The relay deletes what it publishes; with the in-process manager a
+        # relay in another worker would delete events its clients never see
+        return self.relay_enabled and self.app_socketio_enabled and self.emits_reach_all_clients
+
+    @property
+    def records_events(self) -> bool:
+        """Whether domain events are written to the outbox."""
+        return self.relay_active if self.record_events is None else self.record_events
@@ -0,0 +1,122 @@
+"""Transactional outbox: domain events stored with the write, relayed afterwards."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.configs.loggers import logger
+from src.infrastructure.database.models.outbox_model import OutboxEventModel
+
+outbox_table = OutboxEventModel.__table__
+
+RETRY_MAX_DELAY = 5.0
+
+
+@dataclass
+class OutboxMessage:
+    """An outbox event as read back by the relay."""
+
+    id: str
+    aggregate_id: str
+    event_type: str
+    payload: Dict[str, Any]
+    occurred_at: datetime
+
+
+def outbox_row(event: DomainEvent) -> dict:
+    """Convert a domain event to an outbox_events row."""
+    return {
+        "id": event.event_id,
+        "aggregate_id": event.aggregate_id,
+        "event_type": event.name,
+        "payload": event.payload(),
+        "occurred_at": event.occurred_at,
+    }
+
+
+class OutboxRelay:
+    """Publishes outbox events in batches and deletes them once published.
+
+    Each round claims up to ``batch_size`` of the oldest events with
+    ``DELETE ... RETURNING`` over rows locked ``FOR UPDATE SKIP LOCKED``, so
+    relays in several workers share the work without publishing an event
+    twice. The deletion commits only after ``publish`` returned; if it fails
+    the events stay for the next round (delivery is at least once). Rounds
+    follow each other immediately while batches come back full and every
+    ``poll_interval`` seconds otherwise.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        publish: Callable[[List[OutboxMessage]], Awaitable[None]],
+        batch_size: int = 500,
+        poll_interval: float = 0.2,
+    ):
+        """Initialize with a session factory and the publish callback."""
+        self._session_factory = session_factory
+        self._publish = publish
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+        self.published = 0
+
+    def start(self) -> None:
+        """Start relaying in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop relaying; unpublished events stay in the outbox."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def relay_once(self) -> int:
+        """Publish one batch of events; return how many were published."""
+        claimed = (
+            select(outbox_table.c.id)
+            .order_by(outbox_table.c.occurred_at, outbox_table.c.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(outbox_table).where(outbox_table.c.id.in_(claimed.scalar_subquery())).returning(*outbox_table.c)
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            messages = sorted(
+                (OutboxMessage(**row._mapping) for row in result),
+                key=lambda message: (message.occurred_at, message.id),
+            )
+            if not messages:
+                await session.rollback()
+                return 0
+            try:
+                await self._publish(messages)
+            except Exception:
+                await session.rollback()
+                raise
+            await session.commit()
+        self.published += len(messages)
+        return len(messages)
+
+    async def _run(self) -> None:
+        delay = self.poll_interval
+        while True:
+            try:
+                published = await self.relay_once()
+                delay = self.poll_interval
+            except Exception as e:
+                logger.error("[outbox] relay failed", error=str(e))
+                published = 0
+                delay = min(max(delay, self.poll_interval) * 2, RETRY_MAX_DELAY)
+            if published < self.batch_size:
+                await asyncio.sleep(delay)
@@ -0,0 +1,52 @@
+"""Socket.IO client managers backed by a message queue."""
+
+import asyncio
+import json
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Optional, Set
+
+from socketio import AsyncManager, AsyncRedisManager
+from socketio.async_pubsub_manager import AsyncPubSubManager
+
+from src.infrastructure.messaging.config import SocketIOConfig
+
+# channel -> subscriber queues of the managers listening in this process
+_channels: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+
+class InMemoryPubSubManager(AsyncPubSubManager):
+    """Process-local stand-in for the Redis manager, for tests and benchmarks.
+
+    Servers sharing a channel in one process behave like workers sharing a
+    Redis channel: messages are JSON round-tripped and delivered to every
+    subscribed manager, the sender included (it skips its own host id).
+    """
+
+    name = "inmemorypubsub"
+
+    async def _publish(self, data: dict) -> None:
+        message = json.dumps(data)
+        for subscriber in list(_channels[self.channel]):
+            subscriber.put_nowait(message)
+
+    async def _listen(self) -> AsyncIterator[str]:
+        subscriber: asyncio.Queue = asyncio.Queue()
+        _channels[self.channel].add(subscriber)
+        try:
+            while True:
+                yield await subscriber.get()
+        finally:
+            _channels[self.channel].discard(subscriber)
+
+
+def create_client_manager(config: Optional[SocketIOConfig] = None) -> AsyncManager:
+    """Build the client manager selected by ``SOCKETIO_MESSAGE_QUEUE``."""
+    config = config or SocketIOConfig()
+    url = config.message_queue
+    if not url:
+        return AsyncManager()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return AsyncRedisManager(url, channel=config.channel)
+    if url.startswith("memory://"):
+        return InMemoryPubSubManager(channel=config.channel)
+    raise ValueError(f"Unsupported Socket.IO message queue: {url}")
@@ -0,0 +1,81 @@
+"""Scrape-time metrics read from application components."""
+
+from typing import Any, Callable, Optional
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+def register_state_metrics(registry: MetricsRegistry, state: Any) -> None:
+    """Register pool and cache metrics read from ``app.state`` when scraped.
+
+    Components are looked up on every scrape, so they may be created after
+    registration (e.g. in the lifespan) or be absent (cache disabled).
+    """
+
+    def pool_stats():
+        db_connection = getattr(state, "db_connection", None)
+        return db_connection.pool_stats() if db_connection is not None else None
+
+    def cache_stats():
+        cache = getattr(state, "user_cache", None)
+        return cache.stats if cache is not None else None
+
+    def from_pool(attribute: str) -> Callable[[], Any]:
+        def read():
+            stats = pool_stats()
+            return getattr(stats, attribute) if stats is not None else None
+        return read
+
+    pool_metrics = (
+        ("gauge", "db_pool_size", "Configured number of persistent pool connections.", "size"),
+        ("gauge", "db_pool_checked_out", "Connections currently checked out of the pool.", "checked_out"),
+        ("gauge", "db_pool_overflow", "Overflow connections currently open beyond the pool size.", "overflow"),
+        ("counter", "db_pool_checkouts_total", "Connections checked out of the pool.", "checkouts"),
+        ("counter", "db_pool_wait_seconds_total", "Time spent obtaining pooled connections.", "wait_seconds"),
+        ("counter", "db_pool_timeouts_total", "Checkouts that timed out waiting for a connection.", "timeouts"),
+    )
+    for kind, name, documentation, attribute in pool_metrics:
+        factory = registry.gauge if kind == "gauge" else registry.counter
+        factory(name, documentation).set_function(from_pool(attribute))
+
+    def cache_hits():
+        stats = cache_stats()
+        if stats is None:
+            return {}
+        return {("local",): stats.local_hits, ("remote",): stats.remote_hits}
+
+    def cache_misses():
+        stats = cache_stats()
+        return stats.misses if stats is not None else None
+
+    def cache_hit_ratio():
+        stats = cache_stats()
+        return stats.hit_ratio if stats is not None else None
+
+    registry.counter("cache_hits_total", "User cache hits by tier.", ("tier",)).set_function(cache_hits)
+    registry.counter("cache_misses_total", "User cache lookups that missed every tier.").set_function(cache_misses)
+    registry.gauge("cache_hit_ratio", "Share of user cache lookups served by a cache tier.").set_function(
+        cache_hit_ratio
+    )
+
+
+def register_socketio_metrics(
+    registry: MetricsRegistry,
+    connection_count: Callable[[], int],
+    outbound_stats: Optional[Callable[[], Any]] = None,
+) -> None:
+    """Register the Socket.IO connection gauge and outbound queue counters."""
+    registry.gauge("socketio_connections", "Socket.IO clients connected to this process.").set_function(
+        connection_count
+    )
+    if outbound_stats is None:
+        return
+    outbound_metrics = (
+        ("socketio_outbound_dropped_total", "Outbound packets dropped or refused by full queues.", "dropped"),
+        ("socketio_slow_client_disconnects_total", "Clients disconnected for a full outbound queue.", "slow_disconnects"),
+        ("socketio_outbound_coalesced_total", "Outbound messages merged into batch events.", "coalesced"),
+    )
+    for name, documentation, attribute in outbound_metrics:
+        registry.counter(name, documentation).set_function(
+            lambda attribute=attribute: getattr(outbound_stats(), attribute)
+        )
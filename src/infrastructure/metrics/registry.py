@@ -0,0 +1,244 @@
+"""In-process metrics with Prometheus text exposition."""
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, LabelValues, Tuple[str, ...], float]
+CallbackResult = Union[float, Dict[LabelValues, float]]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    return repr(float(value))
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase by ``amount``."""
+        self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease by ``amount``."""
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """Set to ``value``."""
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        # One slot per bucket plus +Inf; made cumulative only at render time
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+
+
+class Metric(ABC):
+    """Base class of a metric family with optional labels.
+
+    Updates are plain attribute arithmetic without locks: metrics are meant to
+    be updated from the event loop thread, like the rest of the app state.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialize metric family."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._function: Optional[Callable[[], CallbackResult]] = None
+
+    def labels(self, *values: str):
+        """Get the child for the given label values, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def set_function(self, function: Callable[[], CallbackResult]) -> None:
+        """Read the value(s) from ``function`` at scrape time.
+
+        The function returns a number, or a dict of label values to numbers
+        for labelled metrics.
+        """
+        self._function = function
+
+    @abstractmethod
+    def _new_child(self) -> object:
+        """Create the value holder of one label combination."""
+        pass
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield ``(suffix, label names, label values, value)`` samples."""
+        if self._function is not None:
+            result = self._function()
+            if isinstance(result, dict):
+                for values, value in result.items():
+                    yield "", self.labelnames, values, value
+            elif result is not None:
+                yield "", (), (), result
+            return
+        for values, child in list(self._children.items()):
+            yield "", self.labelnames, values, child.value
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled gauge."""
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the unlabelled gauge."""
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize histogram with sorted bucket upper bounds."""
+        if "le" in labelnames:
+            raise ValueError("Histogram label names cannot include 'le'")
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if b != math.inf))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield bucket, sum and count samples per child."""
+        names = self.labelnames + ("le",)
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                yield "_bucket", names, values + (_format_value(upper_bound),), cumulative
+            yield "_sum", self.labelnames, values, child.sum
+            yield "_count", self.labelnames, values, cumulative
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, const_labels: Optional[Dict[str, str]] = None):
+        """Initialize empty registry; ``const_labels`` are added to every sample."""
+        self._metrics: Dict[str, Metric] = {}
+        self._const_names = tuple(const_labels or ())
+        self._const_values = tuple((const_labels or {}).values())
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric family; names must be unique."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Get a registered metric family by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, names, values, value in metric.samples():
+                names, values = self._const_names + tuple(names), self._const_values + tuple(values)
+                if names:
+                    labels = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+                    lines.append(f"{metric.name}{suffix}{{{labels}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{metric.name}{suffix} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,26 @@
+"""Rate limiting configuration."""
+
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import Field
+from src.infrastructure.configs.config_init import ConfigInit
+
+
+class RateLimitConfig(ConfigInit):
+
+    # HTTP requests are limited per client IP address and route; a request with
+    # an API key also takes a token from that key's bucket
+    enabled: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
+    # Sustained requests per second and burst size of each bucket
+    rate: float = Field(default=20.0, gt=0, alias="RATE_LIMIT_RATE")
+    burst: float = Field(default=40.0, gt=0, alias="RATE_LIMIT_BURST")
+    # Per-route overrides as JSON, e.g. {"GET /users/": [2, 10]} for (rate, burst)
+    routes: Dict[str, Tuple[float, float]] = Field(default_factory=dict, alias="RATE_LIMIT_ROUTES")
+    api_key_header: str = Field(default="X-API-Key", alias="RATE_LIMIT_API_KEY_HEADER")
+    # Key by the first X-Forwarded-For address; only safe behind a trusted proxy
+    trust_forwarded_for: bool = Field(default=False, alias="RATE_LIMIT_TRUST_FORWARDED_FOR")
+    exempt_paths: List[str] = Field(default=["/health", "/ready", "/metrics"], alias="RATE_LIMIT_EXEMPT_PATHS")
+    # Buckets shared by all workers through Redis; unset keeps them per worker
+    redis_url: Optional[str] = Field(default=None, alias="RATE_LIMIT_REDIS_URL")
+    # Buckets kept per worker by the in-process backend
+    max_keys: int = Field(default=100_000, ge=1, alias="RATE_LIMIT_MAX_KEYS")
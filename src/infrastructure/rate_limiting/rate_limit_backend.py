@@ -0,0 +1,82 @@
+"""Rate limit backend interface and implementations."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Sequence, Tuple
+
+from .token_bucket import TokenBucketLimiter
+
+# Token buckets in one atomic step, taken from in order until one is short.
+# Each state is a hash of the token count and the time it was computed at
+# (Redis server time, so workers' clocks do not matter); it expires once the
+# bucket would be full again. Returns the retry delay in seconds as a string,
+# since Lua numbers come back as integers.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+for _, key in ipairs(KEYS) do
+  local state = redis.call('HMGET', key, 'tokens', 'ts')
+  local tokens = tonumber(state[1]) or capacity
+  local ts = tonumber(state[2]) or now
+  if now > ts then
+    tokens = math.min(capacity, tokens + (now - ts) * rate)
+  end
+  if tokens < requested then
+    return tostring((requested - tokens) / rate)
+  end
+  tokens = tokens - requested
+  redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+  redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+end
+return '0'
+"""
+
+
+class RateLimitBackend(ABC):
+    """Abstract store of token buckets."""
+
+    @abstractmethod
+    async def acquire(self, keys: Sequence[str], rate: float, capacity: float, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from each key's bucket in order; 0.0 if allowed, else the retry delay in seconds.
+
+        Stops at the first bucket without enough tokens, leaving the later ones untouched.
+        """
+        pass
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """In-process buckets; each worker process limits on its own."""
+
+    def __init__(self, max_keys: int = 100_000):
+        """Initialize with the number of buckets kept per (rate, capacity)."""
+        self.max_keys = max_keys
+        self._limiters: Dict[Tuple[float, float], TokenBucketLimiter] = {}
+
+    async def acquire(self, keys: Sequence[str], rate: float, capacity: float, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from each key's bucket in order; 0.0 if allowed, else the retry delay."""
+        limiter = self._limiters.get((rate, capacity))
+        if limiter is None:
+            limiter = self._limiters[(rate, capacity)] = TokenBucketLimiter(rate, capacity, self.max_keys)
+        for key in keys:
+            retry_after = limiter.acquire(key, tokens)
+            if retry_after:
+                return retry_after
+        return 0.0
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets in Redis shared by all workers, all keys of a request updated by one Lua script call."""
+
+    def __init__(self, client: Any, prefix: str = "ratelimit:"):
+        """Initialize with a ``redis.asyncio`` client."""
+        self._client = client
+        self._prefix = prefix
+        # Runs by EVALSHA, loading the script on first use or after a restart
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def acquire(self, keys: Sequence[str], rate: float, capacity: float, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from each key's bucket in order; 0.0 if allowed, else the retry delay."""
+        retry_after = await self._script(keys=[self._prefix + key for key in keys], args=[rate, capacity, tokens])
+        return float(retry_after)
@@ -0,0 +1,78 @@
+"""Token bucket rate limiting."""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+
+class TokenBucket:
+    """Bucket refilled at ``rate`` tokens per second up to ``capacity``."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def take(self, now: float, tokens: float = 1.0) -> float:
+        """Take ``tokens`` if available.
+
+        Returns 0.0 when granted, otherwise the seconds until enough tokens
+        will have accumulated (nothing is taken in that case).
+        """
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+
+class TokenBucketLimiter:
+    """Independent token buckets per key (connection, client, route...).
+
+    At most ``max_keys`` buckets are kept; the least recently used one is
+    evicted beyond that, which only ever makes the limiter more lenient.
+    Not thread-safe: it is meant to be used from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize limiter parameters."""
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[Hashable, TokenBucket]" = OrderedDict()
+
+    def acquire(self, key: Hashable, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the key's bucket; 0.0 if allowed, else the retry delay."""
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.take(now, tokens)
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a key (e.g. when its connection closes)."""
+        self._buckets.pop(key, None)
+
+    def __len__(self) -> int:
+        """Number of tracked keys."""
+        return len(self._buckets)
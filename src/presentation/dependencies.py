@@ -1,17 +1,105 @@
 """Dependency injection for FastAPI."""
 
+import hmac
+from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.services.chat_service import ChatService
+from src.application.services.email_outbox_service import EmailOutboxService
 from src.application.services.user_service import UserService
+from src.domain.repositories.unit_of_work import UnitOfWork
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.services.user_domain_service import UserDomainService
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.adapters.cached_user_repository import CachedUserRepository
+from src.infrastructure.adapters.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+from src.infrastructure.adapters.message_repository_impl import MessageRepositoryImpl
+from src.infrastructure.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 from src.infrastructure.adapters.user_repository_impl import UserRepositoryImpl
+from src.infrastructure.auth.config import AuthConfig
+from src.infrastructure.auth.user_tokens import UserTokenSigner
+from src.infrastructure.configs.config_init import ConfigInit
 from src.infrastructure.database.connection import DatabaseConnection
 from src.infrastructure.database.config import DatabaseConfig
+from src.infrastructure.external_apis.config import EmailConfig
+from src.infrastructure.external_apis.email_service import EmailService
+from src.infrastructure.external_apis.outbox_email_service import OutboxEmailService
+from src.infrastructure.messaging.config import OutboxConfig
+
+
+@lru_cache
+def get_app_config() -> ConfigInit:
+    """Get application configuration (read once per process)."""
+    return ConfigInit()
+
+
+@lru_cache
+def get_email_config() -> EmailConfig:
+    """Get email configuration (read once per process)."""
+    return EmailConfig()
+
+
+@lru_cache
+def get_outbox_config() -> OutboxConfig:
+    """Get outbox configuration (read once per process)."""
+    return OutboxConfig()
+
+
+@lru_cache
+def get_token_signer() -> Optional[UserTokenSigner]:
+    """Get the user token signer, if ``AUTH_TOKEN_SECRET`` is configured."""
+    auth_config = AuthConfig()
+    return UserTokenSigner(auth_config.token_secret) if auth_config.token_secret else None
+
+
+def get_authenticated_user_id(
+    authorization: Optional[str] = Header(default=None),
+    token_signer: Optional[UserTokenSigner] = Depends(get_token_signer),
+) -> UserId:
+    """Get the user proven by the ``Authorization: Bearer <user token>`` header."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if token_signer is None or scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        return token_signer.verify(token.strip())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@lru_cache
+def get_operator_token() -> Optional[str]:
+    """Get the operator token, if ``AUTH_OPERATOR_TOKEN`` is configured."""
+    return AuthConfig().operator_token
+
+
+def require_operator(
+    authorization: Optional[str] = Header(default=None),
+    operator_token: Optional[str] = Depends(get_operator_token),
+) -> None:
+    """Refuse requests without the ``Authorization: Bearer <operator token>`` header."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if (
+        operator_token is None
+        or scheme.lower() != "bearer"
+        or not hmac.compare_digest(token.strip().encode(), operator_token.encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 
 def get_database_config() -> DatabaseConfig:
@@ -19,9 +107,18 @@ def get_database_config() -> DatabaseConfig:
     return DatabaseConfig()
 
 
-def get_database_connection(config: DatabaseConfig = Depends(get_database_config)) -> DatabaseConnection:
-    """Get database connection."""
-    return DatabaseConnection(config)
+def get_database_connection(request: Request) -> DatabaseConnection:
+    """Get the application-scoped database connection.
+
+    The connection (and its engine pool) is created once in the application
+    lifespan and shared through ``app.state``; it is created lazily here only
+    when the app runs without its lifespan (e.g. in tests).
+    """
+    db_connection = getattr(request.app.state, "db_connection", None)
+    if db_connection is None:
+        db_connection = DatabaseConnection(get_database_config())
+        request.app.state.db_connection = db_connection
+    return db_connection
 
 
 async def get_db_session(
@@ -35,11 +132,29 @@ async def get_db_session(
             await session.close()
 
 
-def get_user_repository(
+def get_unit_of_work(
     session: AsyncSession = Depends(get_db_session),
+    outbox_config: OutboxConfig = Depends(get_outbox_config),
+) -> UnitOfWork:
+    """Get the request-scoped unit of work.
+
+    FastAPI caches it per request, so every service resolved for the request
+    shares one transaction; handlers can group several commands with
+    ``async with unit_of_work:`` to commit them together. Domain events are
+    only written to the outbox when a relay drains it (``OUTBOX_RECORD_EVENTS``).
+    """
+    return SqlAlchemyUnitOfWork(session, record_events=outbox_config.records_events)
+
+
+def get_user_repository(
+    request: Request,
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ) -> UserRepository:
-    """Get user repository."""
-    return UserRepositoryImpl(session)
+    """Get user repository, behind the app-scoped cache when one is configured."""
+    user_cache = getattr(request.app.state, "user_cache", None)
+    if user_cache is None:
+        return unit_of_work.users
+    return CachedUserRepository(unit_of_work.users, user_cache, unit_of_work)
 
 
 def get_user_domain_service(
@@ -49,12 +164,58 @@ def get_user_domain_service(
     return UserDomainService(user_repository)
 
 
+def get_email_service(
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    email_config: EmailConfig = Depends(get_email_config),
+) -> Optional[EmailService]:
+    """Get the email service queueing into the request's transaction, if email is enabled."""
+    if not email_config.enabled:
+        return None
+    return OutboxEmailService(unit_of_work.emails)
+
+
 def get_user_service(
     user_repository: UserRepository = Depends(get_user_repository),
     user_domain_service: UserDomainService = Depends(get_user_domain_service),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+    config: ConfigInit = Depends(get_app_config),
+    email_service: Optional[EmailService] = Depends(get_email_service),
 ) -> UserService:
     """Get user service."""
-    return UserService(user_repository, user_domain_service)
+    return UserService(
+        user_repository,
+        user_domain_service,
+        unit_of_work,
+        optimistic_create=config.app_optimistic_create,
+        email_service=email_service,
+    )
+
+
+def get_chat_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> ChatService:
+    """Get chat service reading history on the request session."""
+    return ChatService(MessageRepositoryImpl(session))
+
+
+def get_email_outbox_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> EmailOutboxService:
+    """Get email outbox service reading delivery state on the request session."""
+    return EmailOutboxService(EmailOutboxRepositoryImpl(session))
+
+
+@asynccontextmanager
+async def user_service_scope(db_connection: DatabaseConnection) -> AsyncIterator[UserService]:
+    """Open a user service on its own session.
+
+    Used by streaming responses, whose body is produced after request-scoped
+    dependencies may already have been closed.
+    """
+    async with db_connection.async_session_factory() as session:
+        user_repository = UserRepositoryImpl(session, record_events=get_outbox_config().records_events)
+        user_domain_service = UserDomainService(user_repository)
+        yield UserService(user_repository, user_domain_service)
 
 
 async def create_user_service() -> UserService:
@@ -1,9 +1,21 @@
 """FastAPI application setup."""
 
-from fastapi import FastAPI
+import os
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 
+from src.infrastructure.metrics.collectors import register_state_metrics
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.rate_limiting.config import RateLimitConfig
+from src.infrastructure.rate_limiting.rate_limit_backend import LocalRateLimitBackend
+from src.presentation.rest.handlers.email_handler import router as email_router
+from src.presentation.rest.handlers.message_handler import router as message_router
 from src.presentation.rest.handlers.user_handler import router as user_router
+from src.presentation.rest.middleware.metrics import MetricsMiddleware
+from src.presentation.rest.middleware.rate_limit import RateLimitMiddleware
+from src.presentation.rest.middleware.timing import ServerTimingMiddleware
 
 
 def create_app() -> FastAPI:
@@ -16,6 +28,23 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
     )
 
+    # Every worker process keeps its own metrics; the label tells their series apart
+    metrics = MetricsRegistry(const_labels={"worker": str(os.getpid())})
+    app.state.metrics = metrics
+
+    # Rate limiting (inside CORS, so 429 responses carry CORS headers); the
+    # lifespan may replace the in-process backend with Redis
+    rate_limit_config = RateLimitConfig()
+    if rate_limit_config.enabled:
+        app.state.rate_limit_backend = LocalRateLimitBackend(rate_limit_config.max_keys)
+        app.add_middleware(
+            RateLimitMiddleware,
+            config=rate_limit_config,
+            state=app.state,
+            routes=app.router.routes,
+            registry=metrics,
+        )
+
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -25,8 +54,16 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Instrumentation, added last so it wraps the middleware above; the last
+    # one added runs first (ServerTimingMiddleware, then MetricsMiddleware)
+    register_state_metrics(metrics, app.state)
+    app.add_middleware(MetricsMiddleware, registry=metrics)
+    app.add_middleware(ServerTimingMiddleware)
+
     # Include routers
     app.include_router(user_router)
+    app.include_router(message_router)
+    app.include_router(email_router)
 
     @app.get("/")
     async def root():
@@ -38,4 +75,16 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy"}
 
+    @app.get("/ready")
+    async def readiness_check(request: Request):
+        """Readiness endpoint; 503 until startup warm-up has finished."""
+        if not getattr(request.app.state, "ready", False):
+            return JSONResponse({"status": "starting"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return {"status": "ready"}
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint():
+        """Metrics in the Prometheus text exposition format."""
+        return Response(metrics.render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
     return app
@@ -0,0 +1,39 @@
+"""Email outbox HTTP handlers."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.application.dtos.email_dto import EmailQueueStatusResponse, EmailStatusResponse
+from src.application.services.email_outbox_service import EmailOutboxService
+from src.presentation.dependencies import get_email_outbox_service, require_operator
+
+# Recipients, subjects and SMTP errors are for operators only
+router = APIRouter(prefix="/emails", tags=["emails"], dependencies=[Depends(require_operator)])
+
+
+@router.get("/status", response_model=EmailQueueStatusResponse)
+async def get_queue_status(
+    email_outbox_service: EmailOutboxService = Depends(get_email_outbox_service),
+) -> EmailQueueStatusResponse:
+    """Get email counts per delivery status and the age of the backlog."""
+    return await email_outbox_service.get_queue_status()
+
+
+@router.get("/{email_id}", response_model=EmailStatusResponse)
+async def get_email(
+    email_id: str,
+    email_outbox_service: EmailOutboxService = Depends(get_email_outbox_service),
+) -> EmailStatusResponse:
+    """Get the delivery state of a queued email."""
+    try:
+        email = await email_outbox_service.get_email(email_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if email is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Email not found",
+        )
+    return email
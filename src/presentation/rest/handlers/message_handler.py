@@ -0,0 +1,47 @@
+"""Chat message HTTP handlers."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.application.dtos.message_dto import MessageListResponse
+from src.application.services.chat_service import ChatService
+from src.domain.value_objects.user_id import UserId
+from src.presentation.dependencies import get_authenticated_user_id, get_chat_service
+from src.presentation.rest.responses import FastJSONResponse
+
+router = APIRouter(prefix="/users", tags=["messages"])
+
+
+@router.get("/{user_id}/messages", response_model=MessageListResponse)
+async def get_messages(
+    user_id: str,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    chat_service: ChatService = Depends(get_chat_service),
+    current_user_id: UserId = Depends(get_authenticated_user_id),
+) -> MessageListResponse:
+    """Get the chat history of a user, newest first.
+
+    Only the user itself may read it (``Authorization: Bearer <user token>``).
+    Pass the ``next_cursor`` of a page as ``cursor`` to fetch older messages.
+    """
+    if user_id.lower() != str(current_user_id).lower():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed to read this user's messages",
+        )
+    if limit <= 0 or limit > 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination parameters",
+        )
+
+    try:
+        messages = await chat_service.get_history(user_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return FastJSONResponse(messages)
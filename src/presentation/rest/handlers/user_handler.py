@@ -2,15 +2,31 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
-
-from src.application.dtos.user_dto import CreateUserRequest, UpdateUserRequest, UserResponse, UserListResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.application.dtos.user_dto import (
+    BulkCreateUsersRequest,
+    BulkCreateUsersResponse,
+    CreateUserRequest,
+    ExportFormat,
+    TotalMode,
+    UpdateUserRequest,
+    UserResponse,
+    UserListResponse,
+)
 from src.application.services.user_service import UserService
-from src.presentation.dependencies import get_user_service
+from src.infrastructure.database.connection import DatabaseConnection
+from src.presentation.dependencies import get_database_connection, get_user_service, user_service_scope
+from src.presentation.rest.responses import FastJSONResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
@@ -20,7 +36,7 @@ async def create_user(
     """Create a new user."""
     try:
         user = await user_service.create_user(request)
-        return user
+        return FastJSONResponse(user, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -33,6 +49,39 @@ async def create_user(
         )
 
 
+@router.post("/bulk", response_model=BulkCreateUsersResponse)
+async def create_users_bulk(
+    request: BulkCreateUsersRequest,
+    user_service: UserService = Depends(get_user_service),
+) -> BulkCreateUsersResponse:
+    """Create many users in one request, reporting a result per item."""
+    try:
+        return FastJSONResponse(await user_service.create_users_bulk(request.users))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+
+@router.get("/export")
+async def export_users(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    db_connection: DatabaseConnection = Depends(get_database_connection),
+) -> StreamingResponse:
+    """Stream every user as NDJSON or CSV with constant memory."""
+    async def content():
+        async with user_service_scope(db_connection) as user_service:
+            async for chunk in user_service.export_users(export_format):
+                yield chunk
+
+    return StreamingResponse(
+        content(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="users.{export_format.value}"'},
+    )
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
@@ -45,24 +94,37 @@ async def get_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    return user
+    return FastJSONResponse(user)
 
 
 @router.get("/", response_model=UserListResponse)
 async def get_users(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.ESTIMATED,
     user_service: UserService = Depends(get_user_service),
 ) -> UserListResponse:
-    """Get list of users with pagination."""
-    if skip < 0 or limit <= 0 or limit > 1000:
+    """Get list of users with pagination.
+
+    Pass the ``next_cursor`` of a page as ``cursor`` to fetch the following
+    page at constant cost; ``skip`` is kept for offset-based clients.
+    ``total_mode=exact`` runs a full count, the default estimate does not.
+    """
+    if skip < 0 or limit <= 0 or limit > 1000 or (cursor is not None and skip > 0):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid pagination parameters",
         )
     
-    users = await user_service.get_users(skip=skip, limit=limit)
-    return users
+    try:
+        users = await user_service.get_users(skip=skip, limit=limit, cursor=cursor, total_mode=total_mode)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return FastJSONResponse(users)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -79,7 +141,7 @@ async def update_user(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
-        return user
+        return FastJSONResponse(user)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -120,7 +182,7 @@ async def activate_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    return user
+    return FastJSONResponse(user)
 
 
 @router.post("/{user_id}/deactivate", response_model=UserResponse)
@@ -135,4 +197,4 @@ async def deactivate_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    return user
+    return FastJSONResponse(user)
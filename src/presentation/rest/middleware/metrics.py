@@ -0,0 +1,59 @@
+"""Request metrics middleware."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+UNMATCHED_ROUTE = "unmatched"
+OTHER_METHOD = "other"
+STANDARD_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE"})
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request count, in-flight requests and latency.
+
+    Requests are labelled with the matched route template (``/users/{user_id}``)
+    rather than the raw path, and non-standard methods share one label value,
+    keeping label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        """Initialize middleware and its metrics."""
+        self.app = app
+        self.requests = registry.counter(
+            "http_requests_total", "HTTP requests by method, route and status.", ("method", "route", "status")
+        )
+        self.in_flight = registry.gauge("http_requests_in_flight", "HTTP requests currently being served.")
+        self.duration = registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency by method and route.", ("method", "route")
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = self.in_flight.labels()
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_flight.dec()
+            # The router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            method = scope["method"] if scope["method"] in STANDARD_METHODS else OTHER_METHOD
+            self.requests.labels(method, route, str(status_code)).inc()
+            self.duration.labels(method, route).observe(elapsed)
@@ -0,0 +1,140 @@
+"""Rate limiting middleware."""
+
+import hashlib
+import math
+import time
+from typing import Dict, List, Optional, Sequence
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.configs.loggers import logger
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.rate_limiting.config import RateLimitConfig
+
+UNMATCHED_ROUTE = "unmatched"
+# Minimum seconds between two "backend unavailable" log records
+BACKEND_ERROR_LOG_INTERVAL = 10.0
+# Paths whose route template is remembered (the cache is reset when full)
+ROUTE_CACHE_SIZE = 10_000
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware applying token buckets per client and route.
+
+    Every request takes a token from its client address's bucket. A request
+    with an API key also takes one from that key's bucket (hashed, so keys
+    are not stored in the backend). Keys are not verified here, so they only
+    add a limit and never replace the per-address one; made-up keys create
+    buckets no faster than the address limit allows. Buckets are per route
+    template (``GET /users/{user_id}``), with per-route overrides of the
+    default rate and burst. Rejected requests get 429 with ``Retry-After``
+    before any handler or database work runs. The backend is read from
+    ``state.rate_limit_backend`` on every request, so the lifespan can swap
+    the in-process backend for Redis. If the backend fails, requests are let
+    through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: RateLimitConfig,
+        state: object,
+        routes: Sequence[BaseRoute],
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        """Initialize middleware from its config and the app's state and routes."""
+        self.app = app
+        self.rate = config.rate
+        self.burst = config.burst
+        self.route_limits = config.routes
+        self.exempt_paths = frozenset(config.exempt_paths)
+        self.api_key_header = config.api_key_header.lower().encode("latin-1")
+        self.trust_forwarded_for = config.trust_forwarded_for
+        self._state = state
+        self._routes = routes
+        self._route_cache: Dict[str, str] = {}
+        self._last_error_logged = 0.0
+        self.rejected = None
+        if registry is not None:
+            self.rejected = registry.counter(
+                "http_requests_rate_limited_total", "HTTP requests rejected by rate limiting, by route.", ("route",)
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        route = f'{scope["method"]} {self._route_path(scope)}'
+        rate, burst = self.route_limits.get(route, (self.rate, self.burst))
+        try:
+            retry_after = await self._state.rate_limit_backend.acquire(
+                [f"{client_key}|{route}" for client_key in self._client_keys(scope)], rate, burst
+            )
+        except Exception as e:
+            self._log_backend_error(e)
+            retry_after = 0.0
+
+        if retry_after:
+            if self.rejected is not None:
+                self.rejected.labels(route).inc()
+            await self._reject(send, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+    def _route_path(self, scope: Scope) -> str:
+        # The router has not run yet; match the path against the route
+        # patterns (not the methods) to get the template
+        path = scope["path"]
+        template = self._route_cache.get(path)
+        if template is None:
+            template = UNMATCHED_ROUTE
+            for route in self._routes:
+                path_regex = getattr(route, "path_regex", None)
+                if path_regex is not None and path_regex.match(path):
+                    template = route.path
+                    break
+            if len(self._route_cache) >= ROUTE_CACHE_SIZE:
+                self._route_cache.clear()
+            self._route_cache[path] = template
+        return template
+
+    def _client_keys(self, scope: Scope) -> List[str]:
+        # The address bucket comes first, so it is checked before a key bucket is created
+        api_key = forwarded_for = None
+        for name, value in scope["headers"]:
+            if name == self.api_key_header and value:
+                api_key = value
+            elif name == b"x-forwarded-for" and self.trust_forwarded_for:
+                forwarded_for = value
+        if forwarded_for:
+            address = forwarded_for.split(b",", 1)[0].strip().decode("latin-1")
+        else:
+            client = scope.get("client")
+            address = client[0] if client else "unknown"
+        keys = ["ip:" + address]
+        if api_key is not None:
+            keys.append("key:" + hashlib.blake2b(api_key, digest_size=16).hexdigest())
+        return keys
+
+    def _log_backend_error(self, error: Exception) -> None:
+        now = time.monotonic()
+        if now - self._last_error_logged >= BACKEND_ERROR_LOG_INTERVAL:
+            self._last_error_logged = now
+            logger.warn("[rate-limit] backend unavailable, not limiting", error=str(error))
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: float) -> None:
+        body = b'{"detail":"Too many requests"}'
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(math.ceil(retry_after), 1)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
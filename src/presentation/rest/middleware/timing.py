@@ -0,0 +1,62 @@
+"""Server-Timing and access log middleware."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.configs.loggers import logger
+from src.infrastructure.database.query_stats import begin_query_stats, current_query_stats, end_query_stats
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware reporting where request time went.
+
+    Database time and query count are accumulated per request by the engine
+    events in ``query_stats``. They are sent in a ``Server-Timing`` header
+    (covering work done before the response starts) and logged in one
+    access log record once the response has finished.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_query_stats()
+        stats = current_query_stats()
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration_ms:.2f};desc="{stats.count} queries", '
+                    f"app;dur={total_ms - stats.duration_ms:.2f}, total;dur={total_ms:.2f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_query_stats(token)
+            logger.info(
+                "request",
+                method=scope["method"],
+                path=scope["path"],
+                route=getattr(scope.get("route"), "path", None),
+                status=status_code,
+                duration_ms=round((time.perf_counter() - started) * 1000, 2),
+                db_ms=round(stats.duration_ms, 2),
+                db_queries=stats.count,
+            )
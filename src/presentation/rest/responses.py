@@ -0,0 +1,19 @@
+"""HTTP response classes."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized directly by pydantic-core's Rust encoder.
+
+    Returning an instance from a handler bypasses FastAPI's ``response_model``
+    re-validation, so only use it for content that is already a validated DTO.
+    The route's ``response_model`` is still used for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode DTOs, dicts and lists without an intermediate dump."""
+        return to_json(content)
@@ -0,0 +1,151 @@
+"""Bounded per-connection outbound queues for Socket.IO."""
+
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+from engineio import packet as eio_packet
+from socketio import AsyncServer
+
+from src.infrastructure.configs.loggers import logger
+
+MAX_WRITE_BATCH = 64
+
+
+class SlowClientPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+@dataclass
+class OutboundStats:
+    """Counters of the outbound queues."""
+
+    dropped: int = 0
+    slow_disconnects: int = 0
+    coalesced: int = 0
+
+
+class _Outbound:
+    __slots__ = ("queue", "writer")
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.writer: Optional[asyncio.Task] = None
+
+
+class OutboundQueueServer(AsyncServer):
+    """``AsyncServer`` whose event emits go through bounded per-connection queues.
+
+    Emitting only enqueues, so a handler (or the message-queue listener
+    delivering another worker's emits) never waits on a slow client, and a
+    slow client holds at most ``outbound_queue_size`` packets. A writer task
+    per connection hands its queue to the Engine.IO socket one batch at a
+    time, once the client has taken the previous batch; consecutive packets
+    of a coalescible event waiting together are merged into one
+    ``<event>_batch`` event whose payload is the list of the individual
+    payloads.
+    """
+
+    def __init__(
+        self,
+        *args,
+        outbound_queue_size: int = 256,
+        slow_client_policy: SlowClientPolicy = SlowClientPolicy.DROP_OLDEST,
+        coalesce_events: Iterable[str] = (),
+        **kwargs,
+    ):
+        """Initialize server and queue settings."""
+        super().__init__(*args, **kwargs)
+        self.outbound_queue_size = outbound_queue_size
+        self.slow_client_policy = SlowClientPolicy(slow_client_policy)
+        # Packet prefixes of single-argument events on the default namespace
+        self._coalesce_prefixes = {f'2["{event}",': event for event in coalesce_events}
+        self._outbound: Dict[str, _Outbound] = {}
+        self.outbound_stats = OutboundStats()
+
+    async def _send_eio_packet(self, eio_sid, eio_pkt):
+        """Queue an event packet for the connection's writer."""
+        outbound = self._outbound.get(eio_sid)
+        if outbound is None:
+            outbound = self._outbound[eio_sid] = _Outbound(self.outbound_queue_size)
+            outbound.writer = asyncio.create_task(self._write(eio_sid, outbound.queue))
+        if outbound.queue.full():
+            self.outbound_stats.dropped += 1
+            if self.slow_client_policy is SlowClientPolicy.DROP_NEWEST:
+                return
+            if self.slow_client_policy is SlowClientPolicy.DISCONNECT:
+                self._disconnect_slow_client(eio_sid)
+                return
+            outbound.queue.get_nowait()
+        outbound.queue.put_nowait(eio_pkt)
+
+    async def _write(self, eio_sid: str, queue: asyncio.Queue) -> None:
+        send = super()._send_eio_packet
+        while True:
+            batch = [await queue.get()]
+            try:
+                socket = self.eio._get_socket(eio_sid)
+            except KeyError:
+                self._outbound.pop(eio_sid, None)
+                return
+            # Engine.IO's socket queue is unbounded and send_packet only adds
+            # to it, so hand it the next batch once the client has taken the
+            # previous one; a slow client's backlog then builds up in ``queue``
+            await socket.queue.join()
+            while not queue.empty() and len(batch) < MAX_WRITE_BATCH:
+                batch.append(queue.get_nowait())
+            for pkt in self._coalesce(batch):
+                await send(eio_sid, pkt)
+
+    def _coalesce(self, batch: List[eio_packet.Packet]) -> List[eio_packet.Packet]:
+        if len(batch) == 1 or not self._coalesce_prefixes:
+            return batch
+        result: List[eio_packet.Packet] = []
+        run_prefix, run_args = None, []
+
+        def flush_run():
+            if len(run_args) == 1:
+                result.append(eio_packet.Packet(eio_packet.MESSAGE, data=run_prefix + run_args[0] + "]"))
+            elif run_args:
+                event = self._coalesce_prefixes[run_prefix]
+                data = f'2["{event}_batch",[' + ",".join(run_args) + "]]"
+                result.append(eio_packet.Packet(eio_packet.MESSAGE, data=data))
+                self.outbound_stats.coalesced += len(run_args) - 1
+
+        for pkt in batch:
+            data = pkt.data
+            prefix = None
+            if isinstance(data, str):
+                prefix = next((p for p in self._coalesce_prefixes if data.startswith(p)), None)
+            if prefix is not None and prefix == run_prefix:
+                run_args.append(data[len(prefix):-1])
+                continue
+            flush_run()
+            run_prefix, run_args = None, []
+            if prefix is not None:
+                run_prefix, run_args = prefix, [data[len(prefix):-1]]
+            else:
+                result.append(pkt)
+        flush_run()
+        return result
+
+    def _disconnect_slow_client(self, eio_sid: str) -> None:
+        outbound = self._outbound.pop(eio_sid, None)
+        if outbound is None:
+            return
+        outbound.writer.cancel()
+        self.outbound_stats.slow_disconnects += 1
+        logger.warn("[socket] disconnecting slow client", eio_sid=eio_sid, queued=outbound.queue.qsize())
+        asyncio.create_task(self.eio.disconnect(eio_sid))
+
+    async def _handle_eio_disconnect(self, eio_sid, reason):
+        """Drop the connection's queue, then run the regular disconnect."""
+        outbound = self._outbound.pop(eio_sid, None)
+        if outbound is not None:
+            outbound.writer.cancel()
+        await super()._handle_eio_disconnect(eio_sid, reason)
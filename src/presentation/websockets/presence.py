@@ -0,0 +1,95 @@
+"""Presence registry of connected users."""
+
+from typing import Dict, FrozenSet, Optional, Set, Tuple, Union
+
+from src.domain.value_objects.user_id import UserId
+
+USER_ROOM_PREFIX = "user:"
+
+
+def user_room(user_id: UserId) -> str:
+    """Socket.IO room joined by every connection of a user."""
+    return USER_ROOM_PREFIX + str(user_id)
+
+
+class PresenceRegistry:
+    """Maps users to the sids of their live connections on this process.
+
+    Lookups and updates are O(1). Most users have a single device, so a lone
+    sid is stored as a plain string and only promoted to a set for the
+    second device; together with the reverse ``sid -> user`` index this keeps
+    the cost per connection to about two dict entries.
+
+    Fan-out across workers goes through the ``user:{id}`` rooms; the registry
+    answers local presence questions without touching the message queue.
+    """
+
+    __slots__ = ("_sids_by_user", "_user_by_sid")
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._sids_by_user: Dict[str, Union[str, Set[str]]] = {}
+        self._user_by_sid: Dict[str, str] = {}
+
+    def add(self, user_id: UserId, sid: str) -> bool:
+        """Register a connection; True if it is the user's first one."""
+        key = str(user_id)
+        self._user_by_sid[sid] = key
+        current = self._sids_by_user.get(key)
+        if current is None:
+            self._sids_by_user[key] = sid
+            return True
+        if isinstance(current, str):
+            if current != sid:
+                self._sids_by_user[key] = {current, sid}
+        else:
+            current.add(sid)
+        return False
+
+    def remove(self, sid: str) -> Tuple[Optional[UserId], bool]:
+        """Unregister a connection.
+
+        Returns the user it belonged to (None for anonymous connections) and
+        whether that was the user's last connection.
+        """
+        key = self._user_by_sid.pop(sid, None)
+        if key is None:
+            return None, False
+        current = self._sids_by_user.get(key)
+        went_offline = False
+        if isinstance(current, str):
+            if current == sid:
+                del self._sids_by_user[key]
+                went_offline = True
+        elif current is not None:
+            current.discard(sid)
+            if len(current) == 1:
+                self._sids_by_user[key] = next(iter(current))
+        return UserId.from_trusted(key), went_offline
+
+    def sids(self, user_id: UserId) -> FrozenSet[str]:
+        """Live sids of a user on this process."""
+        current = self._sids_by_user.get(str(user_id))
+        if current is None:
+            return frozenset()
+        if isinstance(current, str):
+            return frozenset((current,))
+        return frozenset(current)
+
+    def user_of(self, sid: str) -> Optional[UserId]:
+        """User a connection belongs to, if it identified itself."""
+        key = self._user_by_sid.get(sid)
+        return UserId.from_trusted(key) if key is not None else None
+
+    def is_online(self, user_id: UserId) -> bool:
+        """Whether the user has a connection on this process."""
+        return str(user_id) in self._sids_by_user
+
+    @property
+    def online_users(self) -> int:
+        """Number of users with at least one connection."""
+        return len(self._sids_by_user)
+
+    def __len__(self) -> int:
+        """Number of identified connections."""
+        return len(self._user_by_sid)
@@ -1,26 +1,127 @@
 # src/presentation/websockets/websocket_server.py
 
-from socketio import AsyncServer
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
 
-# Socket.IO server
-sio = AsyncServer(async_mode="asgi", cors_allowed_origins="*")
+from socketio.exceptions import ConnectionRefusedError
+
+from src.application.dtos.message_dto import MessageResponse
+from src.application.services.chat_service import ChatService
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.auth.config import AuthConfig
+from src.infrastructure.auth.user_tokens import UserTokenSigner
+from src.infrastructure.configs.loggers import logger
+from src.infrastructure.messaging.config import SocketIOConfig
+from src.infrastructure.messaging.outbox import OutboxMessage
+from src.infrastructure.messaging.socketio_managers import create_client_manager
+from src.infrastructure.rate_limiting.token_bucket import TokenBucketLimiter
+from src.presentation.websockets.outbound import OutboundQueueServer
+from src.presentation.websockets.presence import PresenceRegistry, user_room
+
+socketio_config = SocketIOConfig()
+auth_config = AuthConfig()
+# Without AUTH_TOKEN_SECRET every connection is anonymous
+token_signer = UserTokenSigner(auth_config.token_secret) if auth_config.token_secret else None
+
+# Socket.IO server; emits are routed through SOCKETIO_MESSAGE_QUEUE when set,
+# so a message reaches its sid on whichever worker holds the connection
+sio = OutboundQueueServer(
+    async_mode="asgi",
+    cors_allowed_origins="*",
+    client_manager=create_client_manager(socketio_config),
+    outbound_queue_size=socketio_config.outbound_queue_size,
+    slow_client_policy=socketio_config.slow_client_policy,
+    coalesce_events=("receive_message",) if socketio_config.coalesce else (),
+)
+presence = PresenceRegistry()
+message_limiter = TokenBucketLimiter(socketio_config.message_rate, socketio_config.message_burst)
+# Set by the application lifespan when chat history is enabled
+chat_service: Optional[ChatService] = None
+
+# Most ids a single ack_messages event may carry
+MAX_ACK_IDS = 1000
+# Shape of a Socket.IO sid (15 random bytes, URL-safe base64); "to" may only
+# name a connection, never a user room or any other room
+SID_PATTERN = re.compile(r"[A-Za-z0-9_-]{20}")
+
+
+def connection_count() -> int:
+    """Number of clients connected to this process across namespaces."""
+    return sum(len(rooms.get(None, ())) for rooms in sio.manager.rooms.values())
+
+
+async def publish_user_events(messages: List[OutboxMessage]) -> None:
+    """Push outbox events to the rooms of the users they concern.
+
+    A user's events of one batch go out as a single ``user_events`` emit,
+    oldest first.
+    """
+    by_user: Dict[str, List[dict]] = defaultdict(list)
+    for message in messages:
+        by_user[message.aggregate_id].append({
+            "id": message.id,
+            "type": message.event_type,
+            "user_id": message.aggregate_id,
+            "occurred_at": message.occurred_at.isoformat(),
+            **message.payload,
+        })
+    for user_id, events in by_user.items():
+        await sio.emit("user_events", events, room=user_room(user_id))
+
+
+def _stored_payload(message: MessageResponse) -> dict:
+    """Client payload of a stored message."""
+    return {
+        "id": message.id,
+        "from_user": message.sender_id,
+        "message": message.message,
+        "created_at": message.created_at.isoformat(),
+    }
 
 # 1-1 chat events
 @sio.event
-async def connect(sid, environ):
-    """Client connected."""
-    print(f"[socket] connected sid={sid}")
-    await sio.emit("connected", {"sid": sid}, room=sid)
+async def connect(sid, environ, auth=None):
+    """Client connected.
+
+    Clients identify themselves with ``auth = {"token": "<user token>"}``
+    (see ``UserTokenSigner``); the connection then joins the user's room so
+    messages reach all devices. Connections without a token stay anonymous
+    (sid addressing only). Messages the user has not acked yet follow in one
+    ``missed_messages`` event.
+    """
+    user_id = None
+    if isinstance(auth, dict) and (auth.get("token") is not None or auth.get("user_id") is not None):
+        if token_signer is None:
+            raise ConnectionRefusedError("Authentication is not configured")
+        try:
+            user_id = token_signer.verify(auth.get("token"))
+        except ValueError:
+            raise ConnectionRefusedError("Invalid token")
+        presence.add(user_id, sid)
+        await sio.enter_room(sid, user_room(user_id))
+    logger.debug("[socket] connected", sid=sid, user_id=user_id)
+    await sio.emit("connected", {"sid": sid, "user_id": str(user_id) if user_id else None}, room=sid)
+    if user_id is not None and chat_service is not None:
+        try:
+            missed = await chat_service.get_undelivered(user_id, socketio_config.history_replay_limit)
+        except Exception as e:
+            logger.error("[socket] missed message lookup failed", sid=sid, user_id=user_id, error=str(e))
+            return
+        if missed:
+            await sio.emit("missed_messages", {"messages": [_stored_payload(m) for m in missed]}, room=sid)
 
 @sio.event
 async def disconnect(sid):
     """Client disconnected."""
-    print(f"[socket] disconnect sid={sid}")
+    user_id, went_offline = presence.remove(sid)
+    message_limiter.discard(sid)
+    logger.debug("[socket] disconnect", sid=sid, user_id=user_id, offline=went_offline)
 
 @sio.on("ping")
 async def handle_ping(sid, data):
     """Optional ping/pong."""
-    print(f"[socket] ping received: {data}")
+    logger.debug("[socket] ping received", sid=sid)
     await sio.emit("pong", {"received": data}, room=sid)
 
 @sio.on("send_message")
@@ -28,12 +129,61 @@ async def send_message(sid, data: dict):
     """
     1-1 chat message.
     data = {
-        "to": "<receiver_sid>",
+        "to_user": "<receiver_user_id>",  # every device of the user
+        "to": "<receiver_sid>",           # or a single connection (sids only, not rooms)
         "message": "Hello!"
     }
+    Messages to a user are stored and carry an ``id``; the recipient gets
+    the ones it has not acked (``ack_messages``) on its next connect.
     """
-    receiver_sid = data.get("to")
     message = data.get("message")
-    if receiver_sid and message:
-        await sio.emit("receive_message", {"from": sid, "message": message}, room=receiver_sid)
-        print(f"[socket] message from {sid} -> {receiver_sid}: {message}")
\ No newline at end of file
+    if not message:
+        return
+    retry_after = message_limiter.acquire(sid)
+    if retry_after:
+        await sio.emit("error", {"message": "Rate limited", "retry_after": round(retry_after, 3)}, room=sid)
+        return
+    sender = presence.user_of(sid)
+    payload = {"from": sid, "from_user": str(sender) if sender else None, "message": message}
+    if data.get("to_user"):
+        try:
+            receiver = UserId.from_string(data["to_user"])
+        except ValueError:
+            await sio.emit("error", {"message": "Invalid to_user"}, room=sid)
+            return
+        if chat_service is not None:
+            try:
+                # Emitting only queues the message, so it counts as delivered
+                # once the recipient's client acks it
+                stored = await chat_service.record_message(sender, receiver, message)
+            except ValueError:
+                await sio.emit("error", {"message": "Invalid message"}, room=sid)
+                return
+            payload["id"] = stored.id
+            payload["created_at"] = stored.created_at.isoformat()
+        await sio.emit("receive_message", payload, room=user_room(receiver))
+        logger.debug("[socket] message", sid=sid, to_user=receiver)
+    elif data.get("to"):
+        if not isinstance(data["to"], str) or not SID_PATTERN.fullmatch(data["to"]):
+            await sio.emit("error", {"message": "Invalid to"}, room=sid)
+            return
+        await sio.emit("receive_message", payload, room=data["to"])
+        logger.debug("[socket] message", sid=sid, to=data["to"])
+
+@sio.on("ack_messages")
+async def ack_messages(sid, data: dict):
+    """
+    Confirm receipt of stored messages so they are not replayed on reconnect.
+    data = {"ids": ["<message_id>", ...]}
+    """
+    user_id = presence.user_of(sid)
+    if user_id is None or chat_service is None or not isinstance(data, dict):
+        return
+    ids = data.get("ids")
+    if not isinstance(ids, list) or len(ids) > MAX_ACK_IDS:
+        await sio.emit("error", {"message": "Invalid ids"}, room=sid)
+        return
+    try:
+        await chat_service.acknowledge(user_id, ids)
+    except ValueError as e:
+        await sio.emit("error", {"message": str(e)}, room=sid)
@@ -0,0 +1,88 @@
+"""Integration tests for the application's probe and metrics endpoints."""
+
+import os
+
+from fastapi.testclient import TestClient
+
+from src.presentation.rest.api.app import create_app
+
+WORKER = f'worker="{os.getpid()}"'
+
+
+class TestProbeEndpoints:
+    """Test cases for health and readiness endpoints."""
+
+    def test_health_is_served_before_ready(self):
+        """Test liveness passes while readiness reports 503 during warm-up."""
+        app = create_app()
+        client = TestClient(app)
+
+        assert client.get("/health").status_code == 200
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json() == {"status": "starting"}
+
+    def test_ready_after_warm_up(self):
+        """Test readiness flips once the app state is marked ready."""
+        app = create_app()
+        app.state.ready = True
+        client = TestClient(app)
+
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+
+
+class TestMetricsEndpoint:
+    """Test cases for /metrics and the metrics middleware."""
+
+    def test_requests_are_labelled_by_route_template(self):
+        """Test request metrics use the route template, not the raw path."""
+        app = create_app()
+        client = TestClient(app)
+
+        client.get("/users/not-a-user/activate")
+        client.get("/no-such-path")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert f'http_requests_total{{{WORKER},method="GET",route="unmatched",status="404"}} 1.0' in text
+        assert f'http_request_duration_seconds_count{{{WORKER},method="GET",route="unmatched"}} 1.0' in text
+        assert "not-a-user" not in text
+
+    def test_non_standard_methods_share_one_label(self):
+        """Test arbitrary method tokens cannot create new series."""
+        app = create_app()
+        client = TestClient(app)
+
+        client.request("FOO", "/no-such-path")
+        client.request("BAR", "/no-such-path")
+        text = client.get("/metrics").text
+
+        assert f'http_requests_total{{{WORKER},method="other",route="unmatched",status="404"}} 2.0' in text
+        assert "FOO" not in text and "BAR" not in text
+
+    def test_pool_and_cache_metrics_follow_app_state(self):
+        """Test pool and cache metrics appear once the components exist."""
+        from src.infrastructure.cache.lru_cache import LRUCache
+        from src.infrastructure.cache.tiered_cache import TieredCache
+        from src.infrastructure.database.config import DatabaseConfig
+        from src.infrastructure.database.connection import DatabaseConnection
+
+        app = create_app()
+        client = TestClient(app)
+        assert f"db_pool_size{{{WORKER}}}" not in client.get("/metrics").text
+
+        app.state.db_connection = DatabaseConnection(DatabaseConfig())
+        app.state.db_connection.async_engine
+        app.state.user_cache = TieredCache(LRUCache())
+        app.state.user_cache.stats.local_hits = 3
+        app.state.user_cache.stats.misses = 1
+        text = client.get("/metrics").text
+
+        assert f"db_pool_size{{{WORKER}}} 10.0" in text
+        assert f"db_pool_checked_out{{{WORKER}}} 0.0" in text
+        assert f'cache_hits_total{{{WORKER},tier="local"}} 3.0' in text
+        assert f"cache_hit_ratio{{{WORKER}}} 0.75" in text
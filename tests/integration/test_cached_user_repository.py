@@ -0,0 +1,219 @@
+"""Integration tests for the caching user repository."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+from src.domain.value_objects.email import Email
+from src.infrastructure.adapters.cached_user_repository import CachedUserRepository
+from src.infrastructure.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.cache.cache_backend import InMemoryCacheBackend
+from src.infrastructure.cache.lru_cache import LRUCache
+from src.infrastructure.cache.tiered_cache import TieredCache
+
+
+class TestCachedUserRepository:
+    """Integration tests for CachedUserRepository over the in-memory Redis stand-in."""
+
+    @pytest.fixture
+    def mock_user_repository(self):
+        """Mock wrapped repository."""
+        return AsyncMock(spec=UserRepository)
+
+    @pytest.fixture
+    def remote(self):
+        """Shared cache stand-in."""
+        return InMemoryCacheBackend()
+
+    @pytest.fixture
+    def cache(self, remote):
+        """Tiered cache over a fresh LRU and the shared stand-in."""
+        return TieredCache(LRUCache(maxsize=100), remote)
+
+    @pytest.fixture
+    def repository(self, mock_user_repository, cache):
+        """Caching repository under test."""
+        return CachedUserRepository(mock_user_repository, cache)
+
+    @pytest.fixture
+    def user(self):
+        """A persisted user."""
+        return User(
+            email=Email.from_string("test@example.com"),
+            first_name="John",
+            last_name="Doe",
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_reads_through(self, repository, mock_user_repository, cache, user):
+        """Test the second lookup is served from the local tier."""
+        mock_user_repository.find_by_id.return_value = user
+        
+        first = await repository.find_by_id(user.id)
+        second = await repository.find_by_id(user.id)
+        
+        assert first == user
+        assert second.id == user.id
+        assert second.email == user.email
+        assert second.created_at == user.created_at
+        mock_user_repository.find_by_id.assert_called_once()
+        assert cache.stats.misses == 1
+        assert cache.stats.local_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_remote_tier_shared_between_processes(self, mock_user_repository, remote, user):
+        """Test a second process with a cold LRU is served from the shared tier."""
+        mock_user_repository.find_by_id.return_value = user
+        first_process = CachedUserRepository(mock_user_repository, TieredCache(LRUCache(), remote))
+        second_cache = TieredCache(LRUCache(), remote)
+        second_process = CachedUserRepository(mock_user_repository, second_cache)
+        
+        await first_process.find_by_id(user.id)
+        cached = await second_process.find_by_id(user.id)
+        
+        assert cached.id == user.id
+        mock_user_repository.find_by_id.assert_called_once()
+        assert second_cache.stats.remote_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_find_by_email_reads_through(self, repository, mock_user_repository, user):
+        """Test email lookups are cached too, the user through its ID."""
+        mock_user_repository.find_by_email.return_value = user
+        mock_user_repository.find_by_id.return_value = user
+        
+        await repository.find_by_email(user.email)
+        await repository.find_by_email(user.email)
+        cached = await repository.find_by_email(user.email)
+        
+        assert cached.id == user.id
+        mock_user_repository.find_by_email.assert_called_once()
+        mock_user_repository.find_by_id.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates(self, repository, mock_user_repository, user):
+        """Test saving a user drops its cached copy, including stale email keys."""
+        mock_user_repository.find_by_id.return_value = user
+        mock_user_repository.find_by_email.return_value = None
+        await repository.find_by_id(user.id)
+        
+        updated = user.model_copy()
+        updated.update_email(Email.from_string("new@example.com"))
+        mock_user_repository.save.return_value = updated
+        await repository.save(updated)
+        
+        mock_user_repository.find_by_id.return_value = updated
+        assert (await repository.find_by_id(user.id)).email == updated.email
+        assert mock_user_repository.find_by_id.call_count == 2
+        assert await repository.find_by_email(Email.from_string("test@example.com")) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates(self, repository, mock_user_repository, user):
+        """Test deleting a user drops its cached copy."""
+        mock_user_repository.find_by_id.return_value = user
+        await repository.find_by_id(user.id)
+        mock_user_repository.delete.return_value = True
+        
+        await repository.delete(user.id)
+        mock_user_repository.find_by_id.return_value = None
+        
+        assert await repository.find_by_id(user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_remote_failure_degrades_to_miss(self, mock_user_repository, user):
+        """Test an unavailable shared tier falls back to the database."""
+        broken_remote = AsyncMock(spec=InMemoryCacheBackend)
+        broken_remote.get.side_effect = ConnectionError("redis down")
+        broken_remote.set.side_effect = ConnectionError("redis down")
+        repository = CachedUserRepository(mock_user_repository, TieredCache(LRUCache(), broken_remote))
+        mock_user_repository.find_by_id.return_value = user
+        
+        assert (await repository.find_by_id(user.id)) == user
+
+    @pytest.mark.asyncio
+    async def test_write_in_transaction_invalidates_after_commit(self, mock_user_repository, cache, user):
+        """Test a transactional write is invalidated on commit and never cached uncommitted."""
+        unit_of_work = SqlAlchemyUnitOfWork(AsyncMock(spec=AsyncSession))
+        repository = CachedUserRepository(mock_user_repository, cache, unit_of_work)
+        mock_user_repository.find_by_id.return_value = user
+        await repository.find_by_id(user.id)
+        updated = user.model_copy()
+        updated.update_name("Jane", "Smith")
+        mock_user_repository.save.return_value = updated
+        mock_user_repository.find_by_id.return_value = updated
+
+        async with unit_of_work:
+            await repository.save(updated)
+            # Other requests keep the committed row until the commit
+            assert await cache.get(f"user:id:{user.id}") is not None
+            assert (await repository.find_by_id(user.id)).first_name == "Jane"
+            assert mock_user_repository.find_by_id.call_count == 2
+
+        assert await cache.get(f"user:id:{user.id}") is None
+        assert (await repository.find_by_id(user.id)).first_name == "Jane"
+        assert (await repository.find_by_id(user.id)).first_name == "Jane"
+        assert mock_user_repository.find_by_id.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_write_leaves_cache_alone(self, mock_user_repository, cache, user):
+        """Test a rolled back write neither invalidates nor caches the uncommitted row."""
+        unit_of_work = SqlAlchemyUnitOfWork(AsyncMock(spec=AsyncSession))
+        repository = CachedUserRepository(mock_user_repository, cache, unit_of_work)
+        mock_user_repository.save.return_value = user
+        mock_user_repository.find_by_id.return_value = user
+
+        with pytest.raises(ValueError):
+            async with unit_of_work:
+                await repository.save(user)
+                await repository.find_by_id(user.id)
+                raise ValueError("boom")
+
+        assert await cache.get(f"user:id:{user.id}") is None
+        assert await cache.get(f"user:email:{user.email}") is None
+
+    @pytest.mark.asyncio
+    async def test_read_overtaken_by_invalidation_is_not_cached(self, mock_user_repository, remote, user):
+        """Test a row read before a concurrent commit is not written back after its invalidation."""
+        reader_cache, writer_cache = TieredCache(LRUCache(), remote), TieredCache(LRUCache(), remote)
+        reader = CachedUserRepository(mock_user_repository, reader_cache)
+        writer = CachedUserRepository(mock_user_repository, writer_cache)
+        row_read, commit_done = asyncio.Event(), asyncio.Event()
+
+        async def slow_find_by_id(user_id):
+            row_read.set()
+            await commit_done.wait()
+            return user
+
+        mock_user_repository.find_by_id.side_effect = slow_find_by_id
+        read = asyncio.create_task(reader.find_by_id(user.id))
+        await row_read.wait()
+        updated = user.model_copy()
+        updated.update_name("Jane", "Smith")
+        mock_user_repository.save.return_value = updated
+        await writer.save(updated)
+        commit_done.set()
+
+        assert (await read).first_name == "John"
+        assert await remote.get(f"user:id:{user.id}") is None
+        assert reader_cache.local.get(f"user:id:{user.id}") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_local_copies_in_other_processes(self, mock_user_repository, remote, user):
+        """Test an invalidation reaches the local tier of every started cache."""
+        first_cache, second_cache = TieredCache(LRUCache(), remote), TieredCache(LRUCache(), remote)
+        first_cache.start()
+        second_cache.start()
+        await asyncio.sleep(0)
+        mock_user_repository.find_by_id.return_value = user
+        second_process = CachedUserRepository(mock_user_repository, second_cache)
+        await second_process.find_by_id(user.id)
+
+        await CachedUserRepository(mock_user_repository, first_cache).delete(user.id)
+
+        assert second_cache.local.get(f"user:id:{user.id}") is None
+        await first_cache.close()
+        await second_cache.close()
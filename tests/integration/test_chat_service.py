@@ -0,0 +1,60 @@
+"""Integration tests for the chat service."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.services.chat_service import ChatService
+from src.domain.entities.message import Message
+from src.domain.repositories.message_repository import MessageRepository
+from src.domain.value_objects.page_cursor import PageCursor
+from src.domain.value_objects.user_id import UserId
+
+ALICE = "123e4567-e89b-12d3-a456-426614174000"
+BOB = "123e4567-e89b-12d3-a456-426614174001"
+
+
+@pytest.fixture
+def message_repository():
+    """Mock message repository."""
+    return AsyncMock(spec=MessageRepository)
+
+
+class TestChatService:
+    """Test cases for ChatService."""
+
+    @pytest.mark.asyncio
+    async def test_history_page_links_to_the_next_one(self, message_repository):
+        """Test a full page returns the cursor of its last message."""
+        messages = [
+            Message(sender_id=UserId.from_string(ALICE), recipient_id=UserId.from_string(BOB), body=str(i))
+            for i in range(3)
+        ]
+        message_repository.find_page.return_value = messages
+        chat_service = ChatService(message_repository)
+
+        page = await chat_service.get_history(BOB, limit=2)
+
+        assert [m.message for m in page.messages] == ["0", "1"]
+        assert PageCursor.from_string(page.next_cursor) == PageCursor.after(messages[1].created_at, messages[1].id)
+        user_id, = message_repository.find_page.call_args.args
+        assert str(user_id) == BOB
+        assert message_repository.find_page.call_args.kwargs["limit"] == 3
+
+    @pytest.mark.asyncio
+    async def test_history_rejects_invalid_cursor(self, message_repository):
+        """Test malformed cursors are reported as invalid input."""
+        chat_service = ChatService(message_repository)
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await chat_service.get_history(BOB, cursor="garbage")
+        message_repository.find_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_record_message_rejects_nul_characters(self, message_repository):
+        """Test bodies Postgres text cannot store never reach the write buffer."""
+        chat_service = ChatService(message_repository)
+
+        with pytest.raises(ValueError):
+            await chat_service.record_message(None, UserId.from_string(BOB), "bad\x00body")
+        message_repository.save_many.assert_not_called()
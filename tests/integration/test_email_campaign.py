@@ -0,0 +1,155 @@
+"""Integration tests for email campaigns and campaign message preparation."""
+
+import email
+import email.policy
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User
+from src.domain.repositories.email_outbox_repository import EmailOutboxRepository
+from src.domain.repositories.user_repository import UserRepository
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.external_apis.email_campaign import EmailCampaign
+from src.infrastructure.external_apis.email_templates import EmailTemplate
+from src.infrastructure.external_apis.pooled_smtp_email_service import PooledSMTPEmailService
+from src.infrastructure.external_apis.smtp_sink import LocalSMTPServer
+
+TEMPLATE = EmailTemplate("News for $first_name", "<p>Hello $full_name</p>")
+CREATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def smtp_server():
+    """Local SMTP server."""
+    with LocalSMTPServer() as server:
+        yield server
+
+
+def _sender(server):
+    return PooledSMTPEmailService(
+        "127.0.0.1", server.port, "", "", "no-reply@example.com", starttls=False, timeout=5, pool_size=2,
+    )
+
+
+class FakeStore:
+    """Users and an email outbox behind mock repositories, with the real paging and dedup rules."""
+
+    def __init__(self, count, inactive=()):
+        self.users = [
+            User.from_trusted(
+                id=UserId.generate(),
+                email=Email.from_string(f"u{i}@example.com"),
+                first_name=f"User{i}",
+                last_name="Doe",
+                is_active=i not in inactive,
+                created_at=CREATED_AT - timedelta(minutes=i),
+                updated_at=None,
+            )
+            for i in range(count)
+        ]
+        self.outbox = {}
+        self.pages = 0
+        self.fail_on_page = None
+
+    async def find_page(self, limit=100, cursor=None):
+        self.pages += 1
+        users = [u for u in self.users if cursor is None or (u.created_at, str(u.id)) < (cursor.created_at, cursor.id)]
+        return users[:limit]
+
+    async def add_many(self, emails):
+        if self.pages == self.fail_on_page:
+            raise ConnectionError("database went away")
+        queued = [e for e in emails if e.dedup_key not in self.outbox]
+        self.outbox.update((e.dedup_key, e) for e in queued)
+        return queued
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        unit_of_work = SqlAlchemyUnitOfWork(AsyncMock(spec=AsyncSession))
+        unit_of_work.users = AsyncMock(spec=UserRepository)
+        unit_of_work.users.find_page.side_effect = self.find_page
+        unit_of_work.emails = AsyncMock(spec=EmailOutboxRepository)
+        unit_of_work.emails.add_many.side_effect = self.add_many
+        yield unit_of_work
+
+
+class TestEmailCampaign:
+    """Test cases for EmailCampaign."""
+
+    @pytest.mark.asyncio
+    async def test_queues_personalized_email_for_active_users(self):
+        """Test every active user gets their own rendering, read page by page."""
+        store = FakeStore(10, inactive={4})
+
+        result = await EmailCampaign(store.unit_of_work, page_size=3).send("c1", TEMPLATE)
+
+        assert (result.queued, result.already_queued, result.failed, result.skipped) == (9, 0, 0, 1)
+        assert store.pages == 4
+        queued = {e.to: e for e in store.outbox.values()}
+        assert queued["u7@example.com"].subject == "News for User7"
+        assert queued["u7@example.com"].body == "<p>Hello User7 Doe</p>"
+        assert queued["u7@example.com"].dedup_key == f"campaign:c1:{store.users[7].id}"
+        assert "u4@example.com" not in queued
+
+    @pytest.mark.asyncio
+    async def test_rerun_after_crash_only_queues_the_rest(self):
+        """Test a resumed campaign never queues a user twice."""
+        store = FakeStore(10)
+        store.fail_on_page = 3
+
+        with pytest.raises(ConnectionError):
+            await EmailCampaign(store.unit_of_work, page_size=3).send("c1", TEMPLATE)
+        assert len(store.outbox) == 6
+
+        store.fail_on_page = None
+        result = await EmailCampaign(store.unit_of_work, page_size=3).send("c1", TEMPLATE)
+
+        assert (result.queued, result.already_queued) == (4, 6)
+        assert sorted(e.to for e in store.outbox.values()) == sorted(str(u.email) for u in store.users)
+
+    @pytest.mark.asyncio
+    async def test_unrenderable_emails_are_counted(self):
+        """Test a user missing template values is reported, not raised."""
+        store = FakeStore(2)
+
+        result = await EmailCampaign(store.unit_of_work).send(
+            "c1", EmailTemplate("Hi $nickname", "x"), values=lambda user: {}
+        )
+
+        assert (result.queued, result.failed) == (0, 2)
+
+    @pytest.mark.asyncio
+    async def test_line_break_in_subject_value_fails_that_user(self):
+        """Test a name that would break the subject header fails while queueing, not in the worker."""
+        store = FakeStore(3)
+        store.users[1].first_name = "Eve\r\nBcc: x@example.com"
+
+        result = await EmailCampaign(store.unit_of_work).send("c1", TEMPLATE)
+
+        assert (result.queued, result.failed) == (2, 1)
+        assert "u1@example.com" not in {e.to for e in store.outbox.values()}
+
+    @pytest.mark.asyncio
+    async def test_prepared_message_encodes_non_ascii_subject(self, smtp_server):
+        """Test a prepared message carries an RFC 2047 subject and UTF-8 body."""
+        sender = _sender(smtp_server)
+
+        assert await sender.send_messages([sender.prepare_message("u@example.com", "Grüße", "<p>Ünïcode</p>")]) == [True]
+
+        message = email.message_from_string(smtp_server.messages[0].data, policy=email.policy.default)
+        assert message["Subject"] == "Grüße"
+        assert message.get_content() == "<p>Ünïcode</p>"
+        await sender.close()
+
+    def test_prepared_message_rejects_header_injection(self, smtp_server):
+        """Test line breaks in headers are refused."""
+        sender = _sender(smtp_server)
+
+        with pytest.raises(ValueError):
+            sender.prepare_message("u@example.com\r\nBcc: x@example.com", "Hi", "x")
@@ -0,0 +1,57 @@
+"""Integration tests for the email outbox endpoints."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dtos.email_dto import EmailQueueStatusResponse
+from src.application.services.email_outbox_service import EmailOutboxService
+from src.presentation.dependencies import get_email_outbox_service, get_operator_token
+from src.presentation.rest.api.app import create_app
+
+EMAIL_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+class TestEmailHandler:
+    """Test cases for the /emails endpoints."""
+
+    @pytest.fixture
+    def email_outbox_service(self):
+        """Mock email outbox service."""
+        email_outbox_service = AsyncMock(spec=EmailOutboxService)
+        email_outbox_service.get_queue_status.return_value = EmailQueueStatusResponse(counts={"pending": 0})
+        email_outbox_service.get_email.return_value = None
+        return email_outbox_service
+
+    @pytest.fixture
+    def client(self, email_outbox_service):
+        """Client of an app using the mock service and the operator token ``op-secret``."""
+        app = create_app()
+        app.dependency_overrides[get_email_outbox_service] = lambda: email_outbox_service
+        app.dependency_overrides[get_operator_token] = lambda: "op-secret"
+        return TestClient(app)
+
+    def test_operator_reads_queue_status(self, client):
+        """Test the operator token opens the endpoints."""
+        headers = {"Authorization": "Bearer op-secret"}
+
+        assert client.get("/emails/status", headers=headers).status_code == 200
+        assert client.get(f"/emails/{EMAIL_ID}", headers=headers).status_code == 404
+
+    @pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer wrong"}, {"Authorization": "op-secret"}])
+    def test_missing_or_wrong_token_is_unauthorized(self, client, email_outbox_service, headers):
+        """Test recipients and SMTP errors are not shown without the operator token."""
+        for path in ("/emails/status", f"/emails/{EMAIL_ID}"):
+            response = client.get(path, headers=headers)
+
+            assert response.status_code == 401
+            assert response.headers["www-authenticate"] == "Bearer"
+        email_outbox_service.get_email.assert_not_called()
+        email_outbox_service.get_queue_status.assert_not_called()
+
+    def test_unconfigured_operator_token_refuses_everyone(self, client):
+        """Test the endpoints are closed when AUTH_OPERATOR_TOKEN is not set."""
+        client.app.dependency_overrides[get_operator_token] = lambda: None
+
+        assert client.get("/emails/status", headers={"Authorization": "Bearer "}).status_code == 401
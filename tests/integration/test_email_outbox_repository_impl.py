@@ -0,0 +1,78 @@
+"""Integration tests for the email outbox repository implementation."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.outbound_email import EmailStatus, OutboundEmail
+from src.infrastructure.adapters.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestEmailOutboxRepositoryImpl:
+    """Test cases for EmailOutboxRepositoryImpl."""
+
+    @pytest.mark.asyncio
+    async def test_claim_due_is_one_update_over_skip_locked_rows(self):
+        """Test claiming marks due rows sending in one statement and commits."""
+        session = AsyncMock(spec=AsyncSession)
+        session.execute.return_value = []
+        repository = EmailOutboxRepositoryImpl(session)
+
+        assert await repository.claim_due(50, NOW, lease_seconds=300) == []
+
+        compiled = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert compiled.startswith("UPDATE email_outbox SET")
+        assert "FOR UPDATE SKIP LOCKED" in compiled and "RETURNING" in compiled
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_save_results_is_one_executemany(self):
+        """Test outcomes of a batch are written with one statement."""
+        session = AsyncMock(spec=AsyncSession)
+        repository = EmailOutboxRepositoryImpl(session)
+        sent = OutboundEmail(to="a@example.com", subject="Hi", body="x")
+        sent.record_sent(NOW)
+        failed = OutboundEmail(to="b@example.com", subject="Hi", body="x", attempts=1)
+        failed.record_failure("timeout", NOW, max_attempts=3, base_delay=30, max_delay=3600)
+
+        await repository.save_results([sent, failed])
+
+        session.execute.assert_called_once()
+        params = session.execute.call_args.args[1]
+        assert [param["new_status"] for param in params] == [EmailStatus.SENT.value, EmailStatus.PENDING.value]
+
+    @pytest.mark.asyncio
+    async def test_add_inside_unit_of_work_does_not_commit(self):
+        """Test queueing leaves the commit to the unit of work."""
+        session = AsyncMock(spec=AsyncSession)
+        repository = EmailOutboxRepositoryImpl(session, autocommit=False)
+
+        await repository.add(OutboundEmail(to="a@example.com", subject="Hi", body="x"))
+
+        session.execute.assert_called_once()
+        session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_many_skips_queued_dedup_keys(self):
+        """Test bulk queueing is one INSERT that ignores dedup key conflicts."""
+        session = AsyncMock(spec=AsyncSession)
+        emails = [
+            OutboundEmail(to=f"u{i}@example.com", subject="Hi", body="x", dedup_key=f"campaign:c1:{i}")
+            for i in range(3)
+        ]
+        session.execute.return_value = MagicMock(scalars=lambda: [emails[0].id, emails[2].id])
+        repository = EmailOutboxRepositoryImpl(session)
+
+        queued = await repository.add_many(emails)
+
+        assert queued == [emails[0], emails[2]]
+        compiled = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (dedup_key) DO NOTHING" in compiled
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
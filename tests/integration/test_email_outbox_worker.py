@@ -0,0 +1,117 @@
+"""Integration tests for the email outbox worker against the local SMTP stand-in."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.external_apis.email_outbox_worker import EmailOutboxWorker
+from src.infrastructure.external_apis.pooled_smtp_email_service import PooledSMTPEmailService
+from src.infrastructure.external_apis.smtp_sink import LocalSMTPServer
+
+
+def _row(index, attempts=1):
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=f"00000000-0000-0000-0000-00000000000{index}",
+        to=f"u{index}@example.com",
+        subject=f"Hi {index}",
+        body="Hello",
+        status="sending",
+        attempts=attempts,
+        created_at=now,
+        next_attempt_at=now,
+        sent_at=None,
+        last_error=None,
+        dedup_key=None,
+    )
+
+
+@pytest.fixture
+def smtp_server():
+    """Local SMTP server requiring a login."""
+    with LocalSMTPServer(username="mailer", password="secret") as server:
+        yield server
+
+
+def _worker(server, session, password="secret", **kwargs):
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    sender = PooledSMTPEmailService(
+        "127.0.0.1", server.port, "mailer", password, "no-reply@example.com",
+        starttls=False, timeout=5, pool_size=2,
+    )
+    return EmailOutboxWorker(factory, sender, concurrency=2, **kwargs), sender
+
+
+class TestEmailOutboxWorker:
+    """Test cases for EmailOutboxWorker."""
+
+    @pytest.mark.asyncio
+    async def test_claimed_emails_are_sent_and_marked_sent(self, smtp_server):
+        """Test a claimed batch is delivered over the pool and stored with one UPDATE."""
+        session = AsyncMock(spec=AsyncSession)
+        session.execute.side_effect = [[_row(i) for i in range(5)], None]
+        worker, sender = _worker(smtp_server, session)
+
+        assert await worker.process_once() == 5
+
+        assert sorted(message.recipients[0] for message in smtp_server.messages) == [f"<u{i}@example.com>" for i in range(5)]
+        assert smtp_server.connections <= 2
+        params = session.execute.call_args.args[1]
+        assert [param["new_status"] for param in params] == ["sent"] * 5
+        assert worker.stats.sent == 5
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_emails_are_rescheduled_or_dead(self, smtp_server):
+        """Test failures back off until the last attempt, which marks the email dead."""
+        session = AsyncMock(spec=AsyncSession)
+        session.execute.side_effect = [[_row(1, attempts=1), _row(2, attempts=3)], None]
+        worker, sender = _worker(smtp_server, session, password="wrong", max_attempts=3)
+
+        await worker.process_once()
+
+        params = {param["email_id"]: param for param in session.execute.call_args.args[1]}
+        retried, dead = params[_row(1).id], params[_row(2).id]
+        assert retried["new_status"] == "pending" and retried["new_next_attempt_at"] > datetime.now(timezone.utc)
+        assert dead["new_status"] == "dead"
+        assert worker.stats.retried == 1 and worker.stats.dead == 1
+        assert smtp_server.messages == []
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_unserializable_email_fails_alone(self, smtp_server):
+        """Test a bad header kills only its own email; the rest of the chunk is sent."""
+        bad = _row(3)
+        bad.subject = "Hi\r\nBcc: x@example.com"
+        session = AsyncMock(spec=AsyncSession)
+        session.execute.side_effect = [[_row(1), _row(2), bad, _row(4)], None]
+        worker, sender = _worker(smtp_server, session)
+
+        assert await worker.process_once() == 4
+
+        params = {param["email_id"]: param for param in session.execute.call_args.args[1]}
+        assert params[bad.id]["new_status"] == "dead"
+        assert [params[_row(i).id]["new_status"] for i in (1, 2, 4)] == ["sent"] * 3
+        assert len(smtp_server.messages) == 3
+        assert worker.stats.sent == 3 and worker.stats.dead == 1 and worker.stats.retried == 0
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_skips_smtp(self, smtp_server):
+        """Test an empty claim neither connects nor writes results."""
+        session = AsyncMock(spec=AsyncSession)
+        session.execute.return_value = []
+        worker, sender = _worker(smtp_server, session)
+
+        assert await worker.process_once() == 0
+
+        assert session.execute.call_count == 1
+        assert smtp_server.connections == 0
+        await sender.close()
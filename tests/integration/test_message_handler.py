@@ -0,0 +1,75 @@
+"""Integration tests for the chat history endpoint."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.dtos.message_dto import MessageListResponse
+from src.application.services.chat_service import ChatService
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.auth.user_tokens import UserTokenSigner
+from src.presentation.dependencies import get_chat_service, get_token_signer
+from src.presentation.rest.api.app import create_app
+
+ALICE = "123e4567-e89b-12d3-a456-426614174000"
+BOB = "123e4567-e89b-12d3-a456-426614174001"
+
+
+class TestMessageHandler:
+    """Test cases for GET /users/{user_id}/messages."""
+
+    @pytest.fixture
+    def signer(self):
+        """Token signer shared by the test and the app."""
+        return UserTokenSigner("secret")
+
+    @pytest.fixture
+    def chat_service(self):
+        """Mock chat service."""
+        chat_service = AsyncMock(spec=ChatService)
+        chat_service.get_history.return_value = MessageListResponse(messages=[], limit=50, next_cursor=None)
+        return chat_service
+
+    @pytest.fixture
+    def client(self, signer, chat_service):
+        """Client of an app using the mock chat service and the test signer."""
+        app = create_app()
+        app.dependency_overrides[get_chat_service] = lambda: chat_service
+        app.dependency_overrides[get_token_signer] = lambda: signer
+        return TestClient(app)
+
+    def _auth(self, signer, user_id):
+        return {"Authorization": f"Bearer {signer.issue(UserId.from_string(user_id), 60)}"}
+
+    def test_user_reads_own_history(self, client, signer, chat_service):
+        """Test a user holding a token for itself gets its history."""
+        response = client.get(f"/users/{ALICE}/messages", headers=self._auth(signer, ALICE))
+
+        assert response.status_code == 200
+        assert chat_service.get_history.call_args.args[0] == ALICE
+
+    def test_other_users_history_is_forbidden(self, client, signer, chat_service):
+        """Test a valid token does not open another user's history."""
+        response = client.get(f"/users/{BOB}/messages", headers=self._auth(signer, ALICE))
+
+        assert response.status_code == 403
+        chat_service.get_history.assert_not_called()
+
+    @pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer forged"}, {"Authorization": ALICE}])
+    def test_missing_or_invalid_token_is_unauthorized(self, client, chat_service, headers):
+        """Test requests without a valid bearer token are refused."""
+        response = client.get(f"/users/{ALICE}/messages", headers=headers)
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+        chat_service.get_history.assert_not_called()
+
+    def test_unconfigured_authentication_refuses_everyone(self, client, signer):
+        """Test history is closed when AUTH_TOKEN_SECRET is not set."""
+        client.app.dependency_overrides[get_token_signer] = lambda: None
+
+        response = client.get(f"/users/{ALICE}/messages", headers=self._auth(signer, ALICE))
+
+        assert response.status_code == 401
@@ -0,0 +1,123 @@
+"""Integration tests for Socket.IO outbound queues."""
+
+import asyncio
+import json
+
+import pytest
+from engineio.async_socket import AsyncSocket
+
+from src.presentation.websockets.outbound import OutboundQueueServer, SlowClientPolicy
+
+
+async def _server(**kwargs):
+    """Server with one connected Engine.IO socket that nothing drains yet."""
+    kwargs.setdefault("outbound_queue_size", 3)
+    server = OutboundQueueServer(async_mode="asgi", **kwargs)
+    server.manager.initialize()
+    server.manager_initialized = True
+    socket = AsyncSocket(server.eio, "eio-1")
+    socket.connected = True
+    server.eio.sockets["eio-1"] = socket
+    sid = await server.manager.connect("eio-1", "/")
+    return server, socket, sid
+
+
+async def _receive(socket):
+    """Take what the client would get from its next poll."""
+    return [json.loads(pkt.data[1:]) for pkt in await socket.poll()]
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestOutboundQueues:
+    """Test cases for OutboundQueueServer."""
+
+    @pytest.mark.asyncio
+    async def test_emit_does_not_wait_for_slow_client(self):
+        """Test emits return while the client is stalled, keeping the newest packets."""
+        server, socket, sid = await _server()
+
+        await server.emit("tick", 0, to=sid)
+        await _settle()
+        for i in range(1, 6):
+            await asyncio.wait_for(server.emit("tick", i, to=sid), timeout=1)
+            await _settle()
+
+        # Only the batch handed over before the client stalled is in Engine.IO's queue
+        assert socket.queue.qsize() == 1
+        assert await _receive(socket) == [["tick", 0]]
+        await _settle()
+        # tick 1 waited in the writer; of the 3 queued behind it the oldest was dropped
+        assert await _receive(socket) == [["tick", 1], ["tick", 3], ["tick", 4], ["tick", 5]]
+        assert server.outbound_stats.dropped == 1
+        await server._handle_eio_disconnect("eio-1", None)
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_policy(self):
+        """Test drop_newest keeps the queued packets and refuses new ones."""
+        server, socket, sid = await _server(slow_client_policy=SlowClientPolicy.DROP_NEWEST)
+
+        await server.emit("tick", 0, to=sid)
+        await _settle()
+        for i in range(1, 6):
+            await server.emit("tick", i, to=sid)
+            await _settle()
+
+        assert await _receive(socket) == [["tick", 0]]
+        await _settle()
+        assert await _receive(socket) == [["tick", 1], ["tick", 2], ["tick", 3], ["tick", 4]]
+        assert server.outbound_stats.dropped == 1
+        await server._handle_eio_disconnect("eio-1", None)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy(self):
+        """Test a client that stops reading is disconnected once its queue overflows."""
+        server, socket, sid = await _server(slow_client_policy="disconnect")
+
+        for i in range(6):
+            await server.emit("tick", i, to=sid)
+            await _settle()
+
+        assert socket.closed
+        assert server.outbound_stats.slow_disconnects == 1
+
+    @pytest.mark.asyncio
+    async def test_reading_client_is_never_dropped(self):
+        """Test a client that keeps up receives everything, however many packets are sent."""
+        server, socket, sid = await _server()
+        received = []
+
+        for i in range(20):
+            await server.emit("tick", i, to=sid)
+            await _settle()
+            received.extend(await _receive(socket))
+
+        assert received == [["tick", i] for i in range(20)]
+        assert server.outbound_stats.dropped == 0
+        await server._handle_eio_disconnect("eio-1", None)
+
+    @pytest.mark.asyncio
+    async def test_consecutive_messages_are_coalesced(self):
+        """Test queued runs of a coalescible event become one batch event, in order."""
+        server, socket, sid = await _server(outbound_queue_size=10, coalesce_events=("receive_message",))
+
+        await server.emit("pong", {}, to=sid)
+        await _settle()
+        for message in ({"m": 1}, {"m": 2}):
+            await server.emit("receive_message", message, to=sid)
+        await server.emit("pong", {"n": 2}, to=sid)
+        await server.emit("receive_message", {"m": 3}, to=sid)
+        await _settle()
+
+        assert await _receive(socket) == [["pong", {}]]
+        await _settle()
+        assert await _receive(socket) == [
+            ["receive_message_batch", [{"m": 1}, {"m": 2}]],
+            ["pong", {"n": 2}],
+            ["receive_message", {"m": 3}],
+        ]
+        assert server.outbound_stats.coalesced == 1
+        await server._handle_eio_disconnect("eio-1", None)
@@ -0,0 +1,73 @@
+"""Integration tests for the outbox relay."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.messaging.outbox import OutboxRelay
+
+USER_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def _row(event_id, seconds):
+    return MagicMock(_mapping={
+        "id": event_id,
+        "aggregate_id": USER_ID,
+        "event_type": "user.activated",
+        "payload": {},
+        "occurred_at": datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds),
+    })
+
+
+@pytest.fixture
+def session():
+    """Mock session whose claim returns two events, newest first."""
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = [_row("e2", 2), _row("e1", 1)]
+    return session
+
+
+@pytest.fixture
+def session_factory(session):
+    """Factory handing out the mock session."""
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+class TestOutboxRelay:
+    """Test cases for OutboxRelay."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_claimed_batch_in_order_then_commits(self, session, session_factory):
+        """Test a batch is published oldest first and its deletion committed."""
+        publish = AsyncMock()
+        relay = OutboxRelay(session_factory, publish, batch_size=10)
+
+        assert await relay.relay_once() == 2
+
+        messages, = publish.call_args.args
+        assert [message.id for message in messages] == ["e1", "e2"]
+        compiled = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert compiled.startswith("DELETE FROM outbox_events") and "SKIP LOCKED" in compiled
+        session.commit.assert_called_once()
+        assert relay.published == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_keeps_events(self, session, session_factory):
+        """Test a publish error rolls the claim back instead of losing events."""
+        publish = AsyncMock(side_effect=RuntimeError("broker down"))
+        relay = OutboxRelay(session_factory, publish)
+
+        with pytest.raises(RuntimeError):
+            await relay.relay_once()
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+        assert relay.published == 0
@@ -0,0 +1,102 @@
+"""Integration tests for the pooled SMTP email service against the local SMTP stand-in."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.external_apis.pooled_smtp_email_service import PooledSMTPEmailService
+from src.infrastructure.external_apis.smtp_sink import LocalSMTPServer
+
+
+@pytest.fixture
+def smtp_server():
+    """Local SMTP server requiring a login."""
+    with LocalSMTPServer(username="mailer", password="secret") as server:
+        yield server
+
+
+def _service(server, **kwargs):
+    return PooledSMTPEmailService(
+        "127.0.0.1", server.port, "mailer", kwargs.pop("password", "secret"), "no-reply@example.com",
+        starttls=False, timeout=5, **kwargs,
+    )
+
+
+class TestPooledSMTPEmailService:
+    """Test cases for PooledSMTPEmailService."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, smtp_server):
+        """Test concurrent sends share at most pool_size connections."""
+        service = _service(smtp_server, pool_size=2)
+
+        results = await asyncio.gather(*(service.send_email(f"u{i}@example.com", "Hi", "<p>x</p>") for i in range(10)))
+
+        assert results == [True] * 10
+        assert len(smtp_server.messages) == 10
+        assert smtp_server.connections <= 2
+        assert smtp_server.messages[0].data.count("Subject: Hi") == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_is_replaced_after_max_messages(self, smtp_server):
+        """Test a connection is retired once it has sent its quota."""
+        service = _service(smtp_server, pool_size=1, max_messages_per_connection=3)
+
+        for i in range(7):
+            assert await service.send_email(f"u{i}@example.com", "Hi", "x")
+
+        assert smtp_server.connections == 3
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_is_reopened(self):
+        """Test a message is retried on a new connection after the server hangs up."""
+        with LocalSMTPServer(drop_after=2) as server:
+            service = PooledSMTPEmailService(
+                "127.0.0.1", server.port, "", "", "no-reply@example.com", starttls=False, pool_size=1
+            )
+
+            results = [await service.send_email(f"u{i}@example.com", "Hi", "x") for i in range(5)]
+
+            assert results == [True] * 5
+            assert len(server.messages) == 5
+            assert server.connections == 3
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_not_raised(self, smtp_server):
+        """Test a rejected login makes the send return False."""
+        service = _service(smtp_server, password="wrong")
+
+        assert await service.send_email("u@example.com", "Hi", "x") is False
+        assert smtp_server.messages == []
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_refused_recipient_keeps_the_connection(self):
+        """Test a 5xx rejection fails only that message, without reconnecting or retrying."""
+        with LocalSMTPServer(reject_recipients={"bad@example.com"}) as server:
+            service = PooledSMTPEmailService(
+                "127.0.0.1", server.port, "", "", "no-reply@example.com", starttls=False, timeout=5, pool_size=1,
+            )
+            messages = [
+                service.prepare_message(to, "Hi", "x")
+                for to in ("a@example.com", "bad@example.com", "b@example.com")
+            ]
+
+            assert await service.send_messages(messages) == [True, False, True]
+            assert service.connections_opened == 1
+            assert server.connections == 1
+            assert len(server.messages) == 2
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_login_fails_the_batch_once(self, smtp_server):
+        """Test a connection that cannot be opened fails the batch without a login per message."""
+        service = _service(smtp_server, password="wrong")
+        messages = [service.prepare_message(f"u{i}@example.com", "Hi", "x") for i in range(5)]
+
+        assert await service.send_messages(messages) == [False] * 5
+        assert smtp_server.connections == 1
+        await service.close()
@@ -0,0 +1,104 @@
+"""Integration tests for per-request query timing."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.configs.loggers import Logger
+from src.infrastructure.database.query_stats import (
+    begin_query_stats,
+    current_query_stats,
+    end_query_stats,
+    instrument_engine,
+    redact_parameters,
+)
+from src.presentation.rest.middleware.timing import ServerTimingMiddleware
+
+
+@pytest.fixture
+def captured_logger():
+    """Logger writing to a buffer, patched into the instrumented modules."""
+    stream = io.StringIO()
+    logger = Logger(level="debug", stream=stream)
+    with patch("src.infrastructure.database.query_stats.logger", logger), \
+            patch("src.presentation.rest.middleware.timing.logger", logger):
+        yield logger, stream
+    logger.close()
+
+
+def _records(logger, stream):
+    logger.flush()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestQueryTiming:
+    """Test cases for engine instrumentation and ServerTimingMiddleware."""
+
+    def test_stats_are_scoped_per_context(self):
+        """Test queries are counted in the context that started accounting."""
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            assert current_query_stats() is None
+
+            token = begin_query_stats()
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+            stats = current_query_stats()
+            end_query_stats(token)
+
+        assert stats.count == 2
+        assert stats.duration > 0
+
+    def test_slow_queries_are_logged_redacted(self, captured_logger):
+        """Test statements over the threshold are logged without bound values."""
+        logger, stream = captured_logger
+        engine = create_engine("sqlite://")
+        instrument_engine(engine, slow_query_threshold=1e-9)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :email"), {"email": "secret@example.com"})
+
+        [record] = [r for r in _records(logger, stream) if r["msg"] == "Slow query"]
+        assert record["statement"] == "SELECT ?"
+        assert record["parameters"] == ["str"]
+        assert "secret@example.com" not in stream.getvalue()
+
+    def test_server_timing_header_and_access_log(self, captured_logger):
+        """Test DB time reaches the response header and the access log."""
+        logger, stream = captured_logger
+        app = FastAPI()
+        app.add_middleware(ServerTimingMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def read_item(item_id: str):
+            engine = create_engine("sqlite://")
+            instrument_engine(engine)
+            with engine.connect() as conn:
+                for _ in range(3):
+                    conn.execute(text("SELECT 1"))
+            return {"id": item_id}
+
+        response = TestClient(app).get("/items/42")
+
+        assert response.status_code == 200
+        timing = response.headers["server-timing"]
+        assert 'desc="3 queries"' in timing
+        assert "total;dur=" in timing
+        [record] = [r for r in _records(logger, stream) if r["msg"] == "request"]
+        assert record["route"] == "/items/{item_id}"
+        assert record["status"] == 200
+        assert record["db_queries"] == 3
+
+    def test_redact_parameters_keeps_shape(self):
+        """Test redaction for dict, positional and executemany parameters."""
+        assert redact_parameters({"id": "abc", "n": 1}) == {"id": "str", "n": "int"}
+        assert redact_parameters(("abc", None)) == ["str", "NoneType"]
+        assert redact_parameters([{"id": "a"}, {"id": "b"}]) == {"rows": 2, "first": {"id": "str"}}
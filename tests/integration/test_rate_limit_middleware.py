@@ -0,0 +1,139 @@
+"""Integration tests for the rate limiting middleware and its backends."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.rate_limiting.rate_limit_backend import LocalRateLimitBackend, RedisRateLimitBackend
+from src.presentation.rest.api.app import create_app
+
+
+@pytest.fixture
+def limited_env(monkeypatch):
+    """Tiny buckets: a burst of two requests, refilled once a second."""
+    monkeypatch.setenv("RATE_LIMIT_RATE", "1")
+    monkeypatch.setenv("RATE_LIMIT_BURST", "2")
+
+
+class TestRateLimitMiddleware:
+    """Test cases for RateLimitMiddleware."""
+
+    def test_requests_beyond_burst_get_429_with_retry_after(self, limited_env):
+        """Test the bucket allows the burst, then rejects with Retry-After."""
+        client = TestClient(create_app())
+
+        statuses = [client.get("/").status_code for _ in range(3)]
+        response = client.get("/")
+
+        assert statuses == [200, 200, 429]
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert response.json() == {"detail": "Too many requests"}
+
+    def test_routes_have_their_own_buckets(self, limited_env):
+        """Test an exhausted bucket on one route does not limit another route."""
+        client = TestClient(create_app())
+        for _ in range(3):
+            client.get("/")
+
+        assert client.get("/").status_code == 429
+        assert client.get("/docs").status_code == 200
+
+    def test_made_up_api_keys_do_not_bypass_the_address_limit(self, limited_env):
+        """Test a new API key per request is still limited by the client address."""
+        client = TestClient(create_app())
+
+        statuses = [client.get("/", headers={"X-API-Key": f"key-{i}"}).status_code for i in range(5)]
+
+        assert statuses == [200, 200, 429, 429, 429]
+
+    def test_api_key_is_limited_across_addresses(self, limited_env, monkeypatch):
+        """Test one API key used from several addresses shares its bucket."""
+        monkeypatch.setenv("RATE_LIMIT_TRUST_FORWARDED_FOR", "true")
+        client = TestClient(create_app())
+
+        statuses = [
+            client.get("/", headers={"X-API-Key": "tenant-a", "X-Forwarded-For": f"10.0.0.{i}"}).status_code
+            for i in range(3)
+        ]
+
+        assert statuses == [200, 200, 429]
+        assert client.get("/", headers={"X-API-Key": "tenant-b", "X-Forwarded-For": "10.0.0.9"}).status_code == 200
+
+    def test_exempt_paths_are_not_limited(self, limited_env):
+        """Test probes are never rate limited."""
+        client = TestClient(create_app())
+
+        assert {client.get("/health").status_code for _ in range(5)} == {200}
+
+    def test_route_override(self, limited_env, monkeypatch):
+        """Test a per-route limit replaces the default one."""
+        monkeypatch.setenv("RATE_LIMIT_ROUTES", '{"GET /": [1, 5]}')
+        client = TestClient(create_app())
+
+        assert [client.get("/").status_code for _ in range(6)] == [200] * 5 + [429]
+
+    def test_rejections_are_counted_by_route(self, limited_env, monkeypatch):
+        """Test rejected requests show up in the metrics by route template."""
+        monkeypatch.setenv("RATE_LIMIT_EXEMPT_PATHS", '["/metrics"]')
+        client = TestClient(create_app(), raise_server_exceptions=False)
+        for _ in range(4):
+            client.get("/users/not-a-user")
+
+        metrics = client.get("/metrics").text
+
+        assert f'http_requests_rate_limited_total{{worker="{os.getpid()}",route="GET /users/{{user_id}}"}} 2' in metrics
+
+    def test_backend_failure_lets_requests_through(self, limited_env):
+        """Test an unavailable backend does not take the API down."""
+        app = create_app()
+        app.state.rate_limit_backend = AsyncMock(acquire=AsyncMock(side_effect=ConnectionError("down")))
+        client = TestClient(app)
+
+        assert {client.get("/").status_code for _ in range(5)} == {200}
+
+    def test_disabled(self, limited_env, monkeypatch):
+        """Test no limit applies when rate limiting is disabled."""
+        monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
+        client = TestClient(create_app())
+
+        assert {client.get("/").status_code for _ in range(5)} == {200}
+
+
+class TestRateLimitBackends:
+    """Test cases for the rate limit backends."""
+
+    @pytest.mark.asyncio
+    async def test_local_backend_keeps_buckets_per_key_and_limit(self):
+        """Test keys and (rate, capacity) pairs are limited independently."""
+        backend = LocalRateLimitBackend()
+
+        assert await backend.acquire(["a"], 1, 1) == 0.0
+        assert await backend.acquire(["a"], 1, 1) > 0
+        assert await backend.acquire(["b"], 1, 1) == 0.0
+        assert await backend.acquire(["a"], 1, 2) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_local_backend_stops_at_the_first_short_bucket(self):
+        """Test later buckets are not touched once an earlier one rejects."""
+        backend = LocalRateLimitBackend()
+        await backend.acquire(["ip"], 1, 1)
+
+        assert await backend.acquire(["ip", "key"], 1, 1) > 0
+        assert await backend.acquire(["key"], 1, 1) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_is_one_script_call(self):
+        """Test a request costs one call of the registered token bucket script."""
+        script = AsyncMock(return_value=b"0.25")
+        client = MagicMock(register_script=MagicMock(return_value=script))
+        backend = RedisRateLimitBackend(client)
+
+        assert await backend.acquire(["ip:1.2.3.4|GET /", "key:ab|GET /"], 20, 40) == 0.25
+
+        assert "redis.call('TIME')" in client.register_script.call_args.args[0]
+        script.assert_awaited_once_with(
+            keys=["ratelimit:ip:1.2.3.4|GET /", "ratelimit:key:ab|GET /"], args=[20, 40, 1.0]
+        )
@@ -0,0 +1,74 @@
+"""Integration tests for Socket.IO client managers."""
+
+import asyncio
+
+import pytest
+import socketio
+from socketio import AsyncManager, AsyncRedisManager
+
+from src.infrastructure.messaging.config import SocketIOConfig
+from src.infrastructure.messaging.socketio_managers import InMemoryPubSubManager, create_client_manager
+
+
+async def _start_server(manager: AsyncManager, sent: list) -> socketio.AsyncServer:
+    server = socketio.AsyncServer(async_mode="asgi", client_manager=manager)
+
+    async def send_eio_packet(eio_sid, eio_packet):
+        sent.append((eio_sid, eio_packet.data))
+
+    server._send_eio_packet = send_eio_packet
+    server.manager.initialize()
+    server.manager_initialized = True
+    return server
+
+
+class TestSocketIOManagers:
+    """Test cases for message-queue-backed Socket.IO managers."""
+
+    @pytest.mark.asyncio
+    async def test_emit_reaches_sid_on_another_server(self):
+        """Test an emit to a sid is delivered by the server holding it."""
+        sent_a, sent_b = [], []
+        server_a = await _start_server(InMemoryPubSubManager(channel="test-emit"), sent_a)
+        server_b = await _start_server(InMemoryPubSubManager(channel="test-emit"), sent_b)
+        try:
+            receiver_sid = await server_b.manager.connect("eio-b", "/")
+            await asyncio.sleep(0.01)
+
+            await server_a.emit("receive_message", {"from": "x", "message": "hi"}, to=receiver_sid)
+            await asyncio.sleep(0.01)
+
+            assert sent_a == []
+            assert sent_b == [("eio-b", '2["receive_message",{"from":"x","message":"hi"}]')]
+        finally:
+            server_a.manager.thread.cancel()
+            server_b.manager.thread.cancel()
+
+    @pytest.mark.asyncio
+    async def test_channels_are_isolated(self):
+        """Test servers on different channels do not see each other's emits."""
+        sent_b = []
+        server_a = await _start_server(InMemoryPubSubManager(channel="test-one"), [])
+        server_b = await _start_server(InMemoryPubSubManager(channel="test-two"), sent_b)
+        try:
+            receiver_sid = await server_b.manager.connect("eio-b", "/")
+            await asyncio.sleep(0.01)
+
+            await server_a.emit("receive_message", {}, to=receiver_sid)
+            await asyncio.sleep(0.01)
+
+            assert sent_b == []
+        finally:
+            server_a.manager.thread.cancel()
+            server_b.manager.thread.cancel()
+
+    def test_create_client_manager_from_config(self):
+        """Test the manager is chosen by the message queue URL."""
+        def manager_for(url):
+            return create_client_manager(SocketIOConfig(SOCKETIO_MESSAGE_QUEUE=url))
+
+        assert type(manager_for(None)) is AsyncManager
+        assert isinstance(manager_for("memory://"), InMemoryPubSubManager)
+        assert isinstance(manager_for("redis://localhost:6379/0"), AsyncRedisManager)
+        with pytest.raises(ValueError):
+            manager_for("amqp://localhost")
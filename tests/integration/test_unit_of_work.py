@@ -0,0 +1,86 @@
+"""Integration tests for the SQLAlchemy unit of work."""
+
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.user_dto import CreateUserRequest
+from src.application.services.user_service import UserService
+from src.domain.services.user_domain_service import UserDomainService
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+
+
+class TestSqlAlchemyUnitOfWork:
+    """Integration tests for SqlAlchemyUnitOfWork."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Mock database session."""
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture
+    def unit_of_work(self, mock_session):
+        """Unit of work over the mocked session."""
+        return SqlAlchemyUnitOfWork(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_commits_once_at_outermost_boundary(self, unit_of_work, mock_session):
+        """Test nested blocks share one transaction and one commit."""
+        async with unit_of_work:
+            async with unit_of_work:
+                assert unit_of_work.in_transaction
+            mock_session.commit.assert_not_called()
+        
+        assert not unit_of_work.in_transaction
+        mock_session.commit.assert_called_once()
+        mock_session.rollback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(self, unit_of_work, mock_session):
+        """Test an exception rolls back instead of committing."""
+        with pytest.raises(ValueError):
+            async with unit_of_work:
+                raise ValueError("boom")
+        
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_repository_does_not_commit_on_its_own(self, unit_of_work, mock_session):
+        """Test repositories from the unit of work leave commits to it."""
+        mock_session.execute.return_value = MagicMock()
+        
+        await unit_of_work.users.delete(UserId.generate())
+        
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_use_case_runs_in_one_transaction(self, unit_of_work, mock_session):
+        """Test a user service write use case commits exactly once."""
+        # Arrange
+        domain_service = AsyncMock(spec=UserDomainService)
+        service = UserService(unit_of_work.users, domain_service, unit_of_work)
+        saved_row = SimpleNamespace(
+            id="123e4567-e89b-12d3-a456-426614174000",
+            email="test@example.com",
+            first_name="John",
+            last_name="Doe",
+            is_active=True,
+            created_at=datetime.now(timezone.utc),
+            updated_at=None,
+        )
+        mock_session.execute.return_value = MagicMock()
+        mock_session.execute.return_value.one.return_value = saved_row
+        
+        # Act
+        await service.create_user(
+            CreateUserRequest(email="test@example.com", first_name="John", last_name="Doe")
+        )
+        
+        # Assert
+        mock_session.commit.assert_called_once()
@@ -0,0 +1,135 @@
+"""Integration tests for the SQLAlchemy user repository."""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User
+from src.domain.exceptions import EmailAlreadyExistsError
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.adapters.user_repository_impl import UserRepositoryImpl
+
+
+class UniqueViolation(Exception):
+    """Driver error carrying the violated constraint, like asyncpg's."""
+
+    def __init__(self, constraint_name):
+        super().__init__(f'duplicate key value violates unique constraint "{constraint_name}"')
+        self.constraint_name = constraint_name
+
+
+class TestUserRepositoryImpl:
+    """Integration tests for UserRepositoryImpl with a mocked session."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Mock database session."""
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture
+    def user(self):
+        """A new user."""
+        return User(
+            email=Email.from_string("test@example.com"),
+            first_name="John",
+            last_name="Doe",
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_translates_email_conflict(self, mock_session, user):
+        """Test a unique email violation becomes the domain error."""
+        mock_session.execute.side_effect = IntegrityError(
+            "INSERT INTO users ...", {}, UniqueViolation("ix_users_email")
+        )
+        repository = UserRepositoryImpl(mock_session)
+        
+        with pytest.raises(EmailAlreadyExistsError, match="Email already exists"):
+            await repository.save(user)
+        
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_reraises_other_integrity_errors(self, mock_session, user):
+        """Test unrelated constraint violations are not mistaken for email conflicts."""
+        mock_session.execute.side_effect = IntegrityError(
+            "INSERT INTO users ...", {}, UniqueViolation("users_pkey")
+        )
+        repository = UserRepositoryImpl(mock_session, autocommit=False)
+        
+        with pytest.raises(IntegrityError):
+            await repository.save(user)
+        
+        # Inside a unit of work the rollback is left to it
+        mock_session.rollback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_writes_recorded_events_to_outbox(self, mock_session, user):
+        """Test recorded events are inserted into the outbox before the commit."""
+        saved_row = MagicMock(**UserRepositoryImpl(mock_session)._to_row(user))
+        mock_session.execute.return_value = MagicMock(one=lambda: saved_row)
+        user.update_name("Jane", "Smith")
+        repository = UserRepositoryImpl(mock_session)
+
+        await repository.save(user)
+
+        statements = [call.args[0] for call in mock_session.execute.call_args_list]
+        assert [stmt.table.name for stmt in statements] == ["users", "outbox_events"]
+        assert statements[1].compile().params["event_type_m0"] == "user.name_changed"
+        mock_session.commit.assert_called_once()
+        assert user.pull_events() == []
+
+    @pytest.mark.asyncio
+    async def test_update_status_records_event_in_the_same_statement(self, mock_session):
+        """Test the status change and its outbox event are one round trip."""
+        mock_session.execute.return_value = MagicMock(one_or_none=lambda: None)
+        repository = UserRepositoryImpl(mock_session)
+
+        await repository.update_status(
+            UserId.from_string("123e4567-e89b-12d3-a456-426614174000"), False, datetime.now(timezone.utc)
+        )
+
+        mock_session.execute.assert_called_once()
+        compiled = mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert "INSERT INTO outbox_events" in str(compiled)
+        assert "user.deactivated" in compiled.params.values()
+
+    @pytest.mark.asyncio
+    async def test_events_are_dropped_when_not_recorded(self, mock_session, user):
+        """Test no outbox rows are written when no relay drains the outbox."""
+        saved_row = MagicMock(**UserRepositoryImpl(mock_session)._to_row(user))
+        mock_session.execute.return_value = MagicMock(one=lambda: saved_row, one_or_none=lambda: None)
+        user.update_name("Jane", "Smith")
+        repository = UserRepositoryImpl(mock_session, record_events=False)
+
+        await repository.save(user)
+        await repository.update_status(user.id, False, datetime.now(timezone.utc))
+
+        statements = [call.args[0] for call in mock_session.execute.call_args_list]
+        assert len(statements) == 2
+        assert all("outbox_events" not in str(stmt.compile(dialect=postgresql.dialect())) for stmt in statements)
+        assert user.pull_events() == []
+
+    @pytest.mark.asyncio
+    async def test_estimate_count_of_large_table(self, mock_session):
+        """Test large tables report the planner estimate as estimated."""
+        mock_session.execute.return_value = MagicMock(scalar_one_or_none=lambda: 2_000_000)
+        repository = UserRepositoryImpl(mock_session)
+
+        assert await repository.estimate_count() == (2_000_000, True)
+
+    @pytest.mark.asyncio
+    async def test_estimate_count_of_small_table_is_exact(self, mock_session):
+        """Test small tables fall back to an exact count and say so."""
+        mock_session.execute.side_effect = [
+            MagicMock(scalar_one_or_none=lambda: 120),
+            MagicMock(scalar_one=lambda: 118),
+        ]
+        repository = UserRepositoryImpl(mock_session)
+
+        assert await repository.estimate_count() == (118, False)
@@ -1,15 +1,22 @@
 """Integration tests for User service."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, Mock
 
-from src.application.dtos.user_dto import CreateUserRequest, UpdateUserRequest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.user_dto import CreateUserRequest, ExportFormat, TotalMode, UpdateUserRequest
 from src.application.services.user_service import UserService
 from src.domain.entities.user import User
+from src.domain.exceptions import EmailAlreadyExistsError
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.services.user_domain_service import UserDomainService
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.user_id import UserId
+from src.infrastructure.adapters.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.external_apis.email_service import EmailService
 
 
 class TestUserService:
@@ -18,7 +25,9 @@ class TestUserService:
     @pytest.fixture
     def mock_user_repository(self):
         """Mock user repository."""
-        return AsyncMock(spec=UserRepository)
+        repository = AsyncMock(spec=UserRepository)
+        repository.estimate_count.return_value = (0, False)
+        return repository
 
     @pytest.fixture
     def mock_user_domain_service(self):
@@ -165,3 +174,263 @@ class TestUserService:
         assert result is True
         mock_user_domain_service.can_user_be_deleted.assert_called_once()
         mock_user_repository.delete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_users_returns_next_cursor_when_more_rows(self, user_service, mock_user_repository):
+        """Test offset listing hands out a cursor for the following page."""
+        # Arrange
+        users = [
+            User(
+                email=Email.from_string(f"user{i}@example.com"),
+                first_name="John",
+                last_name="Doe",
+            )
+            for i in range(3)
+        ]
+        mock_user_repository.find_all.return_value = users
+        
+        # Act
+        result = await user_service.get_users(skip=0, limit=2)
+        
+        # Assert
+        assert len(result.users) == 2
+        assert result.next_cursor is not None
+        mock_user_repository.find_all.assert_called_once_with(skip=0, limit=3)
+
+    @pytest.mark.asyncio
+    async def test_get_users_with_cursor_uses_keyset_page(self, user_service, mock_user_repository):
+        """Test cursor listing resumes after the last user of the previous page."""
+        # Arrange
+        first_page_user = User(
+            email=Email.from_string("first@example.com"),
+            first_name="John",
+            last_name="Doe",
+        )
+        mock_user_repository.find_all.return_value = [first_page_user, first_page_user]
+        first_page = await user_service.get_users(limit=1)
+        mock_user_repository.find_page.return_value = []
+        
+        # Act
+        result = await user_service.get_users(limit=1, cursor=first_page.next_cursor)
+        
+        # Assert
+        assert result.users == []
+        assert result.next_cursor is None
+        cursor = mock_user_repository.find_page.call_args.kwargs["cursor"]
+        assert cursor.id == str(first_page_user.id)
+        assert cursor.created_at == first_page_user.created_at
+
+    @pytest.mark.asyncio
+    async def test_get_users_with_invalid_cursor(self, user_service):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await user_service.get_users(cursor="garbage")
+
+    @pytest.mark.asyncio
+    async def test_get_users_estimated_total_by_default(self, user_service, mock_user_repository):
+        """Test list totals come from the cheap estimate unless asked otherwise."""
+        # Arrange
+        mock_user_repository.find_all.return_value = []
+        mock_user_repository.estimate_count.return_value = (1_250_000, True)
+        
+        # Act
+        result = await user_service.get_users()
+        
+        # Assert
+        assert result.total == 1_250_000
+        assert result.total_estimated is True
+        mock_user_repository.count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_users_small_table_total_is_exact(self, user_service, mock_user_repository):
+        """Test a total the repository counted exactly is not reported as estimated."""
+        # Arrange
+        mock_user_repository.find_all.return_value = []
+        mock_user_repository.estimate_count.return_value = (42, False)
+        
+        # Act
+        result = await user_service.get_users()
+        
+        # Assert
+        assert result.total == 42
+        assert result.total_estimated is False
+
+    @pytest.mark.asyncio
+    async def test_get_users_exact_total(self, user_service, mock_user_repository):
+        """Test exact totals run a full count."""
+        # Arrange
+        mock_user_repository.find_all.return_value = []
+        mock_user_repository.count.return_value = 42
+        
+        # Act
+        result = await user_service.get_users(total_mode=TotalMode.EXACT)
+        
+        # Assert
+        assert result.total == 42
+        assert result.total_estimated is False
+        mock_user_repository.estimate_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_users_bulk(self, user_service, mock_user_repository):
+        """Test bulk creation reports a result for every item."""
+        # Arrange
+        requests = [
+            CreateUserRequest(email="new@example.com", first_name="John", last_name="Doe"),
+            CreateUserRequest(email="taken@example.com", first_name="Jane", last_name="Doe"),
+            CreateUserRequest(email="invalid-email", first_name="Jim", last_name="Doe"),
+            CreateUserRequest(email="NEW@example.com", first_name="Jack", last_name="Doe"),
+            CreateUserRequest(email="raced@example.com", first_name="Jill", last_name="Doe"),
+        ]
+        mock_user_repository.find_existing_emails.return_value = {Email.from_string("taken@example.com")}
+        # The insert skips raced@example.com as if a concurrent request won
+        mock_user_repository.save_many.side_effect = lambda users: [
+            user for user in users if str(user.email) != "raced@example.com"
+        ]
+        
+        # Act
+        result = await user_service.create_users_bulk(requests)
+        
+        # Assert
+        statuses = [item.status.value for item in result.results]
+        assert statuses == ["created", "conflict", "invalid", "conflict", "conflict"]
+        assert result.created == 1
+        assert result.failed == 4
+        assert result.results[0].user.email == "new@example.com"
+        assert result.results[3].error == "Duplicate email in request"
+        mock_user_repository.find_existing_emails.assert_called_once()
+        mock_user_repository.save_many.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("export_format", [ExportFormat.NDJSON, ExportFormat.CSV])
+    async def test_export_users_streams_in_batches(self, user_service, mock_user_repository, export_format):
+        """Test exports are produced chunk by chunk from the repository stream."""
+        # Arrange
+        users = [
+            User(
+                email=Email.from_string(f"user{i}@example.com"),
+                first_name="John",
+                last_name="Doe",
+            )
+            for i in range(5)
+        ]
+        
+        async def stream_all(batch_size):
+            for user in users:
+                yield user
+        
+        mock_user_repository.stream_all = stream_all
+        
+        # Act
+        chunks = [chunk async for chunk in user_service.export_users(export_format, batch_size=2)]
+        
+        # Assert
+        assert len(chunks) == 3
+        lines = "".join(chunks).splitlines()
+        if export_format == ExportFormat.CSV:
+            assert lines[0].startswith("id,email,first_name")
+            lines = lines[1:]
+            assert lines[0].split(",")[1] == "user0@example.com"
+        else:
+            assert json.loads(lines[0])["email"] == "user0@example.com"
+        assert len(lines) == 5
+
+    @pytest.mark.asyncio
+    async def test_activate_user_is_single_repository_call(self, user_service, mock_user_repository):
+        """Test activation updates the status without loading the user first."""
+        # Arrange
+        user_id = "123e4567-e89b-12d3-a456-426614174000"
+        mock_user_repository.update_status.return_value = User(
+            id=UserId.from_string(user_id),
+            email=Email.from_string("test@example.com"),
+            first_name="John",
+            last_name="Doe",
+        )
+        
+        # Act
+        result = await user_service.activate_user(user_id)
+        
+        # Assert
+        assert result is not None
+        assert result.is_active is True
+        mock_user_repository.find_by_id.assert_not_called()
+        mock_user_repository.save.assert_not_called()
+        args = mock_user_repository.update_status.call_args.args
+        assert args[0] == UserId.from_string(user_id)
+        assert args[1] is True
+
+    @pytest.mark.asyncio
+    async def test_deactivate_missing_user(self, user_service, mock_user_repository):
+        """Test deactivating an unknown user returns None."""
+        # Arrange
+        mock_user_repository.update_status.return_value = None
+        
+        # Act
+        result = await user_service.deactivate_user("123e4567-e89b-12d3-a456-426614174000")
+        
+        # Assert
+        assert result is None
+        assert mock_user_repository.update_status.call_args.args[1] is False
+
+    @pytest.mark.asyncio
+    async def test_optimistic_create_skips_email_lookup(self, mock_user_repository, mock_user_domain_service):
+        """Test optimistic creation leaves email uniqueness to the insert."""
+        # Arrange
+        user_service = UserService(mock_user_repository, mock_user_domain_service, optimistic_create=True)
+        request = CreateUserRequest(email="test@example.com", first_name="John", last_name="Doe")
+        mock_user_repository.save.side_effect = EmailAlreadyExistsError()
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="Email already exists"):
+            await user_service.create_user(request)
+        
+        kwargs = mock_user_domain_service.validate_user_creation.call_args.kwargs
+        assert kwargs["check_email_unique"] is False
+        mock_user_domain_service.is_email_unique.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_user_sends_welcome_email(self, mock_user_repository, mock_user_domain_service):
+        """Test a created user gets a welcome email through the email service."""
+        # Arrange
+        email_service = AsyncMock(spec=EmailService)
+        user_service = UserService(mock_user_repository, mock_user_domain_service, email_service=email_service)
+        request = CreateUserRequest(email="test@example.com", first_name="John", last_name="Doe")
+        mock_user_repository.save.side_effect = lambda user: user
+        
+        # Act
+        await user_service.create_user(request)
+        
+        # Assert
+        email_service.send_welcome_email.assert_called_once_with("test@example.com", "John Doe")
+
+    @pytest.mark.asyncio
+    async def test_failed_create_sends_no_welcome_email(self, mock_user_repository, mock_user_domain_service):
+        """Test no welcome email is sent when the user is not saved."""
+        # Arrange
+        email_service = AsyncMock(spec=EmailService)
+        user_service = UserService(mock_user_repository, mock_user_domain_service, email_service=email_service)
+        request = CreateUserRequest(email="test@example.com", first_name="John", last_name="Doe")
+        mock_user_repository.save.side_effect = EmailAlreadyExistsError()
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await user_service.create_user(request)
+        email_service.send_welcome_email.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_user_reads_past_the_cache(self, mock_user_repository, mock_user_domain_service):
+        """Test the read-modify-write of an update reads the unit of work's repository."""
+        # Arrange
+        unit_of_work = SqlAlchemyUnitOfWork(AsyncMock(spec=AsyncSession))
+        unit_of_work.users = AsyncMock(spec=UserRepository)
+        user = User(email=Email.from_string("test@example.com"), first_name="John", last_name="Doe")
+        unit_of_work.users.find_by_id.return_value = user
+        mock_user_repository.save.side_effect = lambda saved: saved
+        user_service = UserService(mock_user_repository, mock_user_domain_service, unit_of_work)
+
+        # Act
+        result = await user_service.update_user(str(user.id), UpdateUserRequest(first_name="Jane"))
+
+        # Assert
+        assert result.first_name == "Jane"
+        mock_user_repository.find_by_id.assert_not_called()
+        mock_user_repository.save.assert_called_once()
@@ -0,0 +1,235 @@
+"""Integration tests for Socket.IO chat handlers."""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from socketio.exceptions import ConnectionRefusedError
+
+from src.application.services.chat_service import ChatService
+from src.domain.entities.message import Message
+from src.domain.repositories.message_repository import MessageRepository
+from src.infrastructure.auth.user_tokens import UserTokenSigner
+from src.infrastructure.messaging.outbox import OutboxMessage
+from src.infrastructure.rate_limiting.token_bucket import TokenBucketLimiter
+from src.presentation.websockets import websocket_server as ws
+from src.presentation.websockets.presence import PresenceRegistry
+
+ALICE = "123e4567-e89b-12d3-a456-426614174000"
+BOB = "123e4567-e89b-12d3-a456-426614174001"
+SIGNER = UserTokenSigner("secret")
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """The module's server with transports stubbed and a fresh registry."""
+    sent = []
+
+    async def send_eio_packet(eio_sid, eio_packet):
+        event, payload = json.loads(eio_packet.data[1:])
+        sent.append((eio_sid, event, payload))
+
+    monkeypatch.setattr(ws.sio, "_send_eio_packet", send_eio_packet)
+    monkeypatch.setattr(ws, "presence", PresenceRegistry())
+    monkeypatch.setattr(ws, "token_signer", SIGNER)
+    yield sent
+
+
+@pytest.fixture
+def message_repository(monkeypatch):
+    """Mock message store behind the chat service."""
+    repository = AsyncMock(spec=MessageRepository)
+    repository.find_undelivered.return_value = []
+    monkeypatch.setattr(ws, "chat_service", ChatService(repository))
+    return repository
+
+
+async def _connect(eio_sid, user_id=None):
+    sid = await ws.sio.manager.connect(eio_sid, "/")
+    auth = {"token": SIGNER.issue(ws.UserId.from_string(user_id), 60)} if user_id else None
+    await ws.connect(sid, {}, auth)
+    return sid
+
+
+async def _disconnect(sid):
+    await ws.disconnect(sid)
+    await ws.sio.manager.disconnect(sid, "/")
+
+
+class TestWebsocketChat:
+    """Test cases for presence-aware chat."""
+
+    @pytest.mark.asyncio
+    async def test_message_fans_out_to_every_device_of_user(self, server):
+        """Test a user-addressed message reaches all of the user's connections."""
+        sender = await _connect("eio-a", ALICE)
+        phone = await _connect("eio-b1", BOB)
+        laptop = await _connect("eio-b2", BOB)
+        server.clear()
+
+        await ws.send_message(sender, {"to_user": BOB, "message": "hi"})
+
+        received = {(eio_sid, event) for eio_sid, event, _ in server}
+        assert received == {("eio-b1", "receive_message"), ("eio-b2", "receive_message")}
+        assert server[0][2] == {"from": sender, "from_user": ALICE, "message": "hi"}
+        assert ws.presence.sids(ws.UserId.from_string(BOB)) == {phone, laptop}
+
+        for sid in (sender, phone, laptop):
+            await _disconnect(sid)
+        assert len(ws.presence) == 0
+
+    @pytest.mark.asyncio
+    async def test_sid_addressing_and_anonymous_connections(self, server):
+        """Test the legacy sid-addressed path still works for anonymous clients."""
+        sender = await _connect("eio-a")
+        receiver = await _connect("eio-b")
+        server.clear()
+
+        await ws.send_message(sender, {"to": receiver, "message": "hi"})
+
+        assert server == [("eio-b", "receive_message", {"from": sender, "from_user": None, "message": "hi"})]
+        for sid in (sender, receiver):
+            await _disconnect(sid)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("to", [f"user:{BOB}", "lobby", ["eio-b"]])
+    async def test_sid_addressing_cannot_target_rooms(self, server, to):
+        """Test "to" only names a connection, so user rooms are reached through to_user alone."""
+        sender = await _connect("eio-a", ALICE)
+        bob = await _connect("eio-b", BOB)
+        server.clear()
+
+        await ws.send_message(sender, {"to": to, "message": "hi"})
+
+        assert server == [("eio-a", "error", {"message": "Invalid to"})]
+        for sid in (sender, bob):
+            await _disconnect(sid)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("auth", [
+        {"user_id": ALICE},
+        {"token": "forged"},
+        {"token": UserTokenSigner("other").issue(ws.UserId.from_string(ALICE), 60)},
+    ])
+    async def test_unverified_identity_is_refused(self, server, message_repository, auth):
+        """Test a connection cannot claim a user without a valid token for it."""
+        sid = await ws.sio.manager.connect("eio-x", "/")
+        with pytest.raises(ConnectionRefusedError):
+            await ws.connect(sid, {}, auth)
+        await ws.sio.manager.disconnect(sid, "/")
+        assert len(ws.presence) == 0
+        message_repository.find_undelivered.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_identity_is_refused_without_a_token_secret(self, server, monkeypatch):
+        """Test identities are refused altogether when AUTH_TOKEN_SECRET is unset."""
+        monkeypatch.setattr(ws, "token_signer", None)
+        sid = await ws.sio.manager.connect("eio-x", "/")
+        with pytest.raises(ConnectionRefusedError, match="not configured"):
+            await ws.connect(sid, {}, {"token": SIGNER.issue(ws.UserId.from_string(ALICE), 60)})
+        await ws.sio.manager.disconnect(sid, "/")
+
+    @pytest.mark.asyncio
+    async def test_send_message_is_rate_limited_per_connection(self, server, monkeypatch):
+        """Test a sender over its burst gets an error instead of delivering."""
+        monkeypatch.setattr(ws, "message_limiter", TokenBucketLimiter(rate=1, capacity=2))
+        sender = await _connect("eio-a", ALICE)
+        receiver = await _connect("eio-b", BOB)
+        server.clear()
+
+        for i in range(3):
+            await ws.send_message(sender, {"to_user": BOB, "message": str(i)})
+
+        assert [event for _, event, _ in server] == ["receive_message", "receive_message", "error"]
+        assert server[2][0] == "eio-a"
+        assert server[2][2]["message"] == "Rate limited"
+        for sid in (sender, receiver):
+            await _disconnect(sid)
+        assert len(ws.message_limiter) == 0
+
+    @pytest.mark.asyncio
+    async def test_messages_to_offline_user_are_stored_undelivered(self, server, message_repository):
+        """Test a message to an offline user is stored for later and carries its id."""
+        sender = await _connect("eio-a", ALICE)
+        server.clear()
+
+        await ws.send_message(sender, {"to_user": BOB, "message": "later"})
+
+        (stored,), = message_repository.save_many.call_args.args
+        assert str(stored.recipient_id) == BOB
+        assert stored.body == "later"
+        assert stored.delivered_at is None
+        await _disconnect(sender)
+
+    @pytest.mark.asyncio
+    async def test_messages_to_online_user_wait_for_ack(self, server, message_repository):
+        """Test a message emitted to a connected user stays undelivered until acked."""
+        sender = await _connect("eio-a", ALICE)
+        receiver = await _connect("eio-b", BOB)
+        server.clear()
+
+        await ws.send_message(sender, {"to_user": BOB, "message": "now"})
+
+        (stored,), = message_repository.save_many.call_args.args
+        assert stored.delivered_at is None
+        assert server[0][2]["id"] == stored.id
+        message_repository.mark_delivered.assert_not_called()
+        for sid in (sender, receiver):
+            await _disconnect(sid)
+
+    @pytest.mark.asyncio
+    async def test_missed_messages_are_replayed_on_connect(self, server, message_repository):
+        """Test a reconnecting user gets its missed messages in one event."""
+        missed = [
+            Message(sender_id=ws.UserId.from_string(ALICE), recipient_id=ws.UserId.from_string(BOB), body=body)
+            for body in ("one", "two")
+        ]
+        message_repository.find_undelivered.return_value = missed
+
+        sid = await _connect("eio-b", BOB)
+
+        assert [event for _, event, _ in server] == ["connected", "missed_messages"]
+        replayed = server[1][2]["messages"]
+        assert [(m["id"], m["from_user"], m["message"]) for m in replayed] == [
+            (missed[0].id, ALICE, "one"),
+            (missed[1].id, ALICE, "two"),
+        ]
+        # Replayed messages stay undelivered until the client acks them
+        message_repository.mark_delivered.assert_not_called()
+        await _disconnect(sid)
+
+    @pytest.mark.asyncio
+    async def test_ack_marks_messages_delivered(self, server, message_repository):
+        """Test acked ids are marked delivered for the acking user only."""
+        sid = await _connect("eio-b", BOB)
+        message_id = "123e4567-e89b-12d3-a456-426614174099"
+
+        await ws.ack_messages(sid, {"ids": [message_id]})
+        await ws.ack_messages(sid, {"ids": ["not-an-id"]})
+
+        recipient, ids, _ = message_repository.mark_delivered.call_args.args
+        assert str(recipient) == BOB and ids == [message_id]
+        assert message_repository.mark_delivered.call_count == 1
+        assert server[-1][1:] == ("error", {"message": "Invalid message id"})
+        await _disconnect(sid)
+
+    @pytest.mark.asyncio
+    async def test_user_events_are_pushed_to_the_users_room(self, server):
+        """Test outbox events reach every device of their user in one emit per batch."""
+        phone = await _connect("eio-b1", BOB)
+        other = await _connect("eio-a", ALICE)
+        server.clear()
+        occurred_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        await ws.publish_user_events([
+            OutboxMessage("e1", BOB, "user.deactivated", {}, occurred_at),
+            OutboxMessage("e2", BOB, "user.name_changed", {"first_name": "B", "last_name": "C"}, occurred_at),
+        ])
+
+        assert [(eio_sid, event) for eio_sid, event, _ in server] == [("eio-b1", "user_events")]
+        events = server[0][2]
+        assert [event["type"] for event in events] == ["user.deactivated", "user.name_changed"]
+        assert events[1]["first_name"] == "B" and events[1]["user_id"] == BOB
+        for sid in (phone, other):
+            await _disconnect(sid)
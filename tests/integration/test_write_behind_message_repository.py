@@ -0,0 +1,65 @@
+"""Integration tests for the write-behind message repository."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.message import Message
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.adapters.write_behind_message_repository import WriteBehindMessageRepository
+
+ALICE = UserId.from_string("123e4567-e89b-12d3-a456-426614174000")
+BOB = UserId.from_string("123e4567-e89b-12d3-a456-426614174001")
+
+
+@pytest.fixture
+def session():
+    """Mock database session returning no stored rows."""
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(__iter__=lambda self: iter(()))
+    return session
+
+
+@pytest.fixture
+def repository(session):
+    """Repository writing through the mock session."""
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    return WriteBehindMessageRepository(session_factory, max_batch=1000, max_delay=60)
+
+
+class TestWriteBehindMessageRepository:
+    """Integration tests for WriteBehindMessageRepository."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_one_insert_and_one_update_in_one_transaction(self, repository, session):
+        """Test buffered messages and acks are written with two statements."""
+        messages = [Message(sender_id=ALICE, recipient_id=BOB, body=f"m{i}") for i in range(50)]
+        await repository.save_many(messages)
+        await repository.mark_delivered(BOB, [m.id for m in messages[:10]], datetime.now(timezone.utc))
+        session.execute.assert_not_called()
+
+        await repository.close()
+
+        statements = [call.args[0] for call in session.execute.call_args_list]
+        assert [type(stmt).__name__ for stmt in statements] == ["Insert", "Update"]
+        assert len(statements[0].compile().params) >= 50 * 6
+        session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_undelivered_includes_buffered_messages(self, repository):
+        """Test messages not yet flushed are still replayed, minus acked ones."""
+        first = Message(sender_id=ALICE, recipient_id=BOB, body="first")
+        second = Message(sender_id=ALICE, recipient_id=BOB, body="second")
+        other = Message(sender_id=BOB, recipient_id=ALICE, body="other")
+        await repository.save_many([first, second, other])
+        await repository.mark_delivered(BOB, [first.id], datetime.now(timezone.utc))
+
+        undelivered = await repository.find_undelivered(BOB)
+
+        assert [message.id for message in undelivered] == [second.id]
@@ -0,0 +1,85 @@
+"""Unit tests for application configuration."""
+
+import os
+
+from src.infrastructure.configs.config_init import ConfigInit
+from src.infrastructure.messaging.config import OutboxConfig
+
+
+class TestConfigInit:
+    """Test cases for ConfigInit."""
+
+    def test_production_runner_defaults(self, monkeypatch):
+        """Test the runner defaults to CPU-count workers on uvloop/httptools."""
+        monkeypatch.delenv("APP_WORKERS", raising=False)
+        monkeypatch.delenv("APP_RELOAD", raising=False)
+        monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", "redis://localhost:6379/0")
+
+        options = ConfigInit().uvicorn_config
+
+        assert options["reload"] is False
+        assert options["workers"] == (os.cpu_count() or 1)
+        assert options["loop"] == "uvloop"
+        assert options["http"] == "httptools"
+        assert options["limit_max_requests"] is None
+
+    def test_reload_forces_single_worker(self, monkeypatch):
+        """Test reload mode never runs multiple workers."""
+        monkeypatch.setenv("APP_RELOAD", "true")
+        monkeypatch.setenv("APP_WORKERS", "8")
+
+        assert ConfigInit().uvicorn_config["workers"] == 1
+
+    def test_socketio_without_message_queue_forces_single_worker(self, monkeypatch):
+        """Test the in-process Socket.IO manager is never split across workers."""
+        monkeypatch.delenv("APP_RELOAD", raising=False)
+        monkeypatch.delenv("SOCKETIO_MESSAGE_QUEUE", raising=False)
+        monkeypatch.setenv("APP_WORKERS", "8")
+        monkeypatch.setenv("APP_SOCKETIO_ENABLED", "true")
+
+        assert ConfigInit().worker_count == 1
+
+        monkeypatch.setenv("APP_SOCKETIO_ENABLED", "false")
+        assert ConfigInit().worker_count == 8
+
+        monkeypatch.setenv("APP_SOCKETIO_ENABLED", "true")
+        monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", "redis://localhost:6379/0")
+        assert ConfigInit().worker_count == 8
+
+    def test_worker_recycling_and_production_mode(self, monkeypatch):
+        """Test max-requests recycling and APP_ENV parsing."""
+        monkeypatch.setenv("APP_MAX_REQUESTS", "10000")
+        monkeypatch.setenv("APP_ENV", "production")
+
+        config = ConfigInit()
+
+        assert config.uvicorn_config["limit_max_requests"] == 10000
+        assert config.is_production
+
+    def test_outbox_relay_only_runs_where_emits_reach_clients(self, monkeypatch):
+        """Test the relay needs Socket.IO and a message queue, whatever the worker count."""
+        monkeypatch.delenv("APP_RELOAD", raising=False)
+        monkeypatch.delenv("OUTBOX_RECORD_EVENTS", raising=False)
+        monkeypatch.delenv("SOCKETIO_MESSAGE_QUEUE", raising=False)
+        monkeypatch.setenv("APP_SOCKETIO_ENABLED", "true")
+        monkeypatch.setenv("APP_WORKERS", "1")
+        config = OutboxConfig()
+        assert not config.emits_reach_all_clients
+        assert not config.relay_active
+
+        monkeypatch.setenv("APP_WORKERS", "4")
+        monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", "redis://localhost:6379/0")
+        assert OutboxConfig().relay_active
+
+        monkeypatch.setenv("OUTBOX_RELAY_ENABLED", "false")
+        config = OutboxConfig()
+        assert not config.relay_active
+        assert not config.records_events
+
+        monkeypatch.setenv("OUTBOX_RECORD_EVENTS", "true")
+        assert OutboxConfig().records_events
+
+        monkeypatch.setenv("OUTBOX_RELAY_ENABLED", "true")
+        monkeypatch.setenv("APP_SOCKETIO_ENABLED", "false")
+        monkeypatch.delenv("OUTBOX_RECORD_EVENTS")
+        assert not OutboxConfig().records_events
@@ -0,0 +1,54 @@
+"""Unit tests for database configuration."""
+
+from src.infrastructure.database.config import DatabaseConfig
+
+
+class TestDatabaseConfig:
+    """Test cases for DatabaseConfig."""
+
+    def test_default_engine_options(self):
+        """Test default pool settings are passed to the engine."""
+        config = DatabaseConfig()
+        options = config.engine_options
+
+        assert options["pool_size"] == 10
+        assert options["max_overflow"] == 10
+        assert options["pool_recycle"] == 1800
+        assert options["pool_timeout"] == 30.0
+        assert options["pool_pre_ping"] is True
+        assert config.pool_warm_up == 2
+
+    def test_pool_settings_from_environment(self, monkeypatch):
+        """Test pool settings can be configured through the environment."""
+        monkeypatch.setenv("DB_POOL_SIZE", "25")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "5")
+        monkeypatch.setenv("DB_POOL_RECYCLE", "600")
+        monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+
+        options = DatabaseConfig().engine_options
+
+        assert options["pool_size"] == 25
+        assert options["max_overflow"] == 5
+        assert options["pool_recycle"] == 600
+        assert options["pool_timeout"] == 2.5
+        assert options["pool_pre_ping"] is False
+
+    def test_connection_budget_is_split_across_workers(self, monkeypatch):
+        """Test the global connection budget caps each worker's pool."""
+        monkeypatch.setenv("APP_WORKERS", "4")
+        monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", "redis://localhost:6379/0")
+        monkeypatch.setenv("DB_MAX_CONNECTIONS", "60")
+
+        options = DatabaseConfig().engine_options
+
+        assert options["pool_size"] == 10
+        assert options["max_overflow"] == 5
+
+    def test_small_budget_shrinks_pool(self, monkeypatch):
+        """Test a budget below the pool size shrinks the pool and removes overflow."""
+        monkeypatch.setenv("APP_WORKERS", "8")
+        monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", "redis://localhost:6379/0")
+        monkeypatch.setenv("DB_MAX_CONNECTIONS", "20")
+
+        assert DatabaseConfig().worker_pool_limits == (2, 0)
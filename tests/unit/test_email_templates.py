@@ -0,0 +1,67 @@
+"""Unit tests for compiled email templates."""
+
+import pytest
+
+from src.infrastructure.external_apis.email_templates import EmailTemplate, welcome_email
+
+
+class TestEmailTemplate:
+    """Test cases for EmailTemplate."""
+
+    def test_render_substitutes_subject_and_body(self):
+        """Test placeholders are filled in both parts."""
+        template = EmailTemplate("Hi $first_name", "<p>Hello ${full_name}!</p>")
+
+        assert template.fields == {"first_name", "full_name"}
+        assert template.render({"first_name": "John", "full_name": "John Doe"}) == ("Hi John", "<p>Hello John Doe!</p>")
+
+    def test_body_values_are_html_escaped(self):
+        """Test values cannot inject markup into the body."""
+        template = EmailTemplate("Hi $name", "<p>$name</p>")
+
+        subject, body = template.render({"name": "<b>Tom & Jerry</b>"})
+
+        assert subject == "Hi <b>Tom & Jerry</b>"
+        assert body == "<p>&lt;b&gt;Tom &amp; Jerry&lt;/b&gt;</p>"
+
+    def test_line_break_in_subject_value_is_rejected(self):
+        """Test a value cannot add header lines through the subject."""
+        template = EmailTemplate("Hi $name", "<p>$name</p>")
+
+        with pytest.raises(ValueError, match="line breaks"):
+            template.render({"name": "John\r\nBcc: x@example.com"})
+
+        # Body-only values may span lines
+        assert EmailTemplate("Hi", "<p>$name</p>").render({"name": "a\nb"}) == ("Hi", "<p>a\nb</p>")
+
+    def test_line_break_in_subject_is_rejected(self):
+        """Test a multi-line subject template is rejected at compile time."""
+        with pytest.raises(ValueError, match="line breaks"):
+            EmailTemplate("Hi\nthere", "<p>Hello</p>")
+
+    def test_literal_braces_and_dollar_escape(self):
+        """Test CSS braces survive and ``$$`` renders a dollar sign."""
+        template = EmailTemplate("Offer", '<style>p {color: red}</style><p>$$5 for $name {x}</p>')
+
+        _, body = template.render({"name": "you"})
+
+        assert body == "<style>p {color: red}</style><p>$5 for you {x}</p>"
+
+    def test_missing_value(self):
+        """Test rendering without every placeholder value fails."""
+        template = EmailTemplate("Hi $first_name", "<p>$last_name</p>")
+
+        with pytest.raises(ValueError, match="last_name"):
+            template.render({"first_name": "John"})
+
+    def test_invalid_placeholder(self):
+        """Test a ``$`` not followed by a name is rejected at compile time."""
+        with pytest.raises(ValueError, match="Invalid placeholder"):
+            EmailTemplate("Hi", "<p>costs $5</p>")
+
+    def test_welcome_email(self):
+        """Test the built-in welcome template."""
+        subject, body = welcome_email("John Doe")
+
+        assert subject == "Welcome to our platform!"
+        assert "<h2>Welcome John Doe!</h2>" in body
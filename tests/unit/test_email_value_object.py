@@ -1,5 +1,7 @@
 """Unit tests for Email value object."""
 
+import copy
+
 import pytest
 
 from src.domain.value_objects.email import Email
@@ -48,3 +50,28 @@ class TestEmailValueObject:
         """Test email string representation."""
         email = Email.from_string("test@example.com")
         assert str(email) == "test@example.com"
+
+    def test_email_too_long(self):
+        """Test emails over 255 characters are rejected."""
+        with pytest.raises(ValueError, match="longer than 255"):
+            Email.from_string("a" * 250 + "@example.com")
+
+    def test_email_is_immutable(self):
+        """Test email value cannot be reassigned."""
+        email = Email.from_string("test@example.com")
+        
+        with pytest.raises(AttributeError):
+            email.value = "other@example.com"
+
+    def test_email_from_trusted(self):
+        """Test trusted construction keeps the stored value as is."""
+        email = Email.from_trusted("test@example.com")
+        
+        assert email == Email.from_string("test@example.com")
+        assert hash(email) == hash(Email.from_string("test@example.com"))
+
+    def test_email_copy(self):
+        """Test emails survive copying."""
+        email = Email.from_string("test@example.com")
+        
+        assert copy.deepcopy(email) == email
@@ -0,0 +1,47 @@
+"""Unit tests for the fast user response path."""
+
+import json
+from datetime import datetime, timezone
+
+from src.application.dtos.user_dto import UserListResponse, UserResponse
+from src.presentation.rest.responses import FastJSONResponse
+
+
+def _response_kwargs():
+    return dict(
+        id="123e4567-e89b-12d3-a456-426614174000",
+        email="test@example.com",
+        first_name="John",
+        last_name="Doe",
+        full_name="John Doe",
+        is_active=True,
+        created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        updated_at=None,
+    )
+
+
+class TestFastJSONResponse:
+    """Test cases for UserResponse.from_trusted and FastJSONResponse."""
+
+    def test_from_trusted_matches_validated_response(self):
+        """Test the trusted constructor builds the same DTO as validation."""
+        trusted = UserResponse.from_trusted(**_response_kwargs())
+        validated = UserResponse(**_response_kwargs())
+
+        assert trusted == validated
+        assert trusted.model_dump() == validated.model_dump()
+
+    def test_renders_same_json_as_model_dump(self):
+        """Test the fast encoder produces the same document as pydantic."""
+        users = UserListResponse(
+            users=[UserResponse.from_trusted(**_response_kwargs())],
+            total=1,
+            skip=0,
+            limit=100,
+        )
+
+        response = FastJSONResponse(users, status_code=201)
+
+        assert response.status_code == 201
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.body) == json.loads(users.model_dump_json())
@@ -0,0 +1,76 @@
+"""Unit tests for the structured logger."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.configs.loggers import Logger
+
+
+def _records(stream: io.StringIO) -> list:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestLogger:
+    """Test cases for Logger."""
+
+    def test_writes_json_lines_with_caller_info(self):
+        """Test records carry level, message, fields and the caller location."""
+        stream = io.StringIO()
+        logger = Logger(level="debug", stream=stream)
+
+        logger.info("User", "created", user_id="abc")
+        logger.close()
+
+        [record] = _records(stream)
+        assert record["level"] == "INFO"
+        assert record["msg"] == "User created"
+        assert record["user_id"] == "abc"
+        assert record["file"] == "test_logger.py"
+        assert record["func"] == "test_writes_json_lines_with_caller_info"
+        assert record["ts"].endswith("+00:00")
+
+    def test_skips_disabled_levels_before_any_work(self):
+        """Test records below the threshold never touch the frame or the queue."""
+        stream = io.StringIO()
+        logger = Logger(level="warning", stream=stream)
+
+        with patch("src.infrastructure.configs.loggers.sys._getframe") as getframe:
+            logger.debug("hidden")
+            logger.info("hidden")
+        logger.warn("shown")
+        logger.close()
+
+        getframe.assert_not_called()
+        assert [record["msg"] for record in _records(stream)] == ["shown"]
+        assert not logger.is_enabled_for("info")
+        assert logger.is_enabled_for("ERROR")
+
+    def test_flush_waits_for_writer(self):
+        """Test flush returns only after queued records are written."""
+        stream = io.StringIO()
+        logger = Logger(level="debug", stream=stream)
+
+        for i in range(100):
+            logger.debug("message", index=i)
+        logger.flush()
+
+        assert [record["index"] for record in _records(stream)] == list(range(100))
+        logger.close()
+
+    def test_unserializable_fields_are_stringified(self):
+        """Test extra fields that are not JSON types fall back to str()."""
+        stream = io.StringIO()
+        logger = Logger(level="debug", stream=stream)
+
+        logger.error("failed", error=ValueError("boom"))
+        logger.close()
+
+        assert _records(stream)[0]["error"] == "boom"
+
+    def test_unknown_level_raises(self):
+        """Test an unknown level name is rejected."""
+        with pytest.raises(KeyError):
+            Logger(level="verbose")
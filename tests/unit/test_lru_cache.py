@@ -0,0 +1,58 @@
+"""Unit tests for the in-process LRU cache."""
+
+from src.infrastructure.cache.lru_cache import LRUCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_get_and_set(self):
+        """Test stored values are returned."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire(self):
+        """Test entries are dropped after their TTL."""
+        clock = FakeClock()
+        cache = LRUCache(maxsize=10, ttl=5, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=20)
+        
+        clock.now = 6
+        
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_delete(self):
+        """Test entries can be invalidated."""
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.delete("a", "missing")
+        
+        assert cache.get("a") is None
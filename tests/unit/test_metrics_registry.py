@@ -0,0 +1,84 @@
+"""Unit tests for the metrics registry."""
+
+import pytest
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry and metric types."""
+
+    def test_counter_and_gauge_render(self):
+        """Test labelled counters and gauges render in text format."""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests.", ("route",))
+        in_flight = registry.gauge("in_flight", "In flight.")
+
+        requests.labels("/users/").inc()
+        requests.labels("/users/").inc(2)
+        in_flight.inc()
+        in_flight.inc()
+        in_flight.dec()
+
+        text = registry.render()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/users/"} 3.0' in text
+        assert "in_flight 1.0" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram buckets, sum and count."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 2.0' in lines
+        assert 'latency_seconds_bucket{le="1.0"} 3.0' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4.0' in lines
+        assert "latency_seconds_sum 2.65" in lines
+        assert "latency_seconds_count 4.0" in lines
+
+    def test_callback_metrics_read_at_scrape_time(self):
+        """Test function-backed metrics, including absent values."""
+        registry = MetricsRegistry()
+        state = {"value": None}
+        registry.gauge("pool_checked_out", "Checked out.").set_function(lambda: state["value"])
+        registry.counter("hits_total", "Hits.", ("tier",)).set_function(lambda: {("local",): 5})
+
+        assert not [line for line in registry.render().splitlines() if line.startswith("pool_checked_out")]
+        state["value"] = 4
+        text = registry.render()
+        assert "pool_checked_out 4.0" in text
+        assert 'hits_total{tier="local"} 5.0' in text
+
+    def test_label_values_are_escaped(self):
+        """Test quotes, backslashes and newlines in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors.", ("message",)).labels('a "b"\\\n').inc()
+
+        assert 'errors_total{message="a \\"b\\"\\\\\\n"} 1.0' in registry.render()
+
+    def test_invalid_usage_raises(self):
+        """Test duplicate names and wrong label counts are rejected."""
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ("route",))
+
+        with pytest.raises(ValueError):
+            registry.counter("requests_total", "Again.")
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+
+    def test_const_labels_are_added_to_every_sample(self):
+        """Test constant labels come first on labelled, unlabelled and histogram samples."""
+        registry = MetricsRegistry(const_labels={"worker": "7"})
+        registry.counter("requests_total", "Requests.", ("route",)).labels("/users/").inc()
+        registry.gauge("in_flight", "In flight.").set(2)
+        registry.histogram("latency_seconds", "Latency.", buckets=(1.0,)).observe(0.5)
+
+        lines = registry.render().splitlines()
+        assert 'requests_total{worker="7",route="/users/"} 1.0' in lines
+        assert 'in_flight{worker="7"} 2.0' in lines
+        assert 'latency_seconds_bucket{worker="7",le="1.0"} 1.0' in lines
+        assert 'latency_seconds_count{worker="7"} 1.0' in lines
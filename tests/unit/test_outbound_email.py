@@ -0,0 +1,59 @@
+"""Unit tests for the OutboundEmail entity."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.domain.entities.outbound_email import EmailStatus, OutboundEmail
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestOutboundEmail:
+    """Test cases for OutboundEmail entity."""
+
+    def test_new_email_is_pending_and_due(self):
+        """Test a queued email is pending with no attempts."""
+        email = OutboundEmail(to="user@example.com", subject="Hi", body="Hello")
+
+        assert email.status is EmailStatus.PENDING
+        assert email.attempts == 0
+        assert email.next_attempt_at <= datetime.now(timezone.utc)
+
+    def test_record_sent(self):
+        """Test a delivered email is sent and keeps no error."""
+        email = OutboundEmail(to="user@example.com", subject="Hi", body="Hello", last_error="timeout")
+
+        email.record_sent(NOW)
+
+        assert email.status is EmailStatus.SENT
+        assert email.sent_at == NOW
+        assert email.last_error is None
+
+    def test_failure_backs_off_exponentially_with_jitter(self):
+        """Test each failed attempt doubles the delay, jittered to 50-100%."""
+        for attempts, full_delay in [(1, 30), (2, 60), (3, 120), (10, 3600)]:
+            email = OutboundEmail(to="user@example.com", subject="Hi", body="Hello", attempts=attempts)
+
+            email.record_failure("timeout", NOW, max_attempts=20, base_delay=30, max_delay=3600)
+
+            assert email.status is EmailStatus.PENDING
+            assert email.last_error == "timeout"
+            delay = email.next_attempt_at - NOW
+            assert timedelta(seconds=full_delay / 2) <= delay <= timedelta(seconds=full_delay)
+
+    def test_failure_after_max_attempts_is_dead(self):
+        """Test the email is given up once it used all its attempts."""
+        email = OutboundEmail(to="user@example.com", subject="Hi", body="Hello", attempts=3)
+
+        email.record_failure("rejected", NOW, max_attempts=3, base_delay=30, max_delay=3600)
+
+        assert email.status is EmailStatus.DEAD
+        assert email.last_error == "rejected"
+
+    def test_rejected_email_is_dead_at_once(self):
+        """Test an undeliverable email is given up whatever attempts it has left."""
+        email = OutboundEmail(to="user@example.com", subject="Hi", body="Hello", attempts=1)
+
+        email.record_rejected("Email headers must not contain line breaks")
+
+        assert email.status is EmailStatus.DEAD
+        assert email.last_error == "Email headers must not contain line breaks"
@@ -0,0 +1,37 @@
+"""Unit tests for PageCursor value object."""
+
+import pytest
+from datetime import datetime, timezone
+
+from src.domain.value_objects.page_cursor import PageCursor
+
+
+class TestPageCursorValueObject:
+    """Test cases for PageCursor value object."""
+
+    def test_round_trip(self):
+        """Test a cursor survives encoding and decoding."""
+        cursor = PageCursor.after(
+            datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "123e4567-e89b-12d3-a456-426614174000",
+        )
+
+        decoded = PageCursor.from_string(str(cursor))
+
+        assert decoded == cursor
+        assert decoded.created_at.tzinfo is not None
+
+    def test_encoded_cursor_is_url_safe(self):
+        """Test the opaque form can be used as a query parameter."""
+        cursor = PageCursor.after(datetime.now(timezone.utc), "123e4567-e89b-12d3-a456-426614174000")
+        encoded = str(cursor)
+
+        assert "=" not in encoded
+        assert "+" not in encoded
+        assert "/" not in encoded
+
+    @pytest.mark.parametrize("value", ["", "not-a-cursor", "aGVsbG8", "MjAyNC0wMS0wMnxub3QtYS11dWlk"])
+    def test_invalid_cursor(self, value):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            PageCursor.from_string(value)
@@ -0,0 +1,59 @@
+"""Unit tests for the presence registry."""
+
+from src.domain.value_objects.user_id import UserId
+from src.presentation.websockets.presence import PresenceRegistry, user_room
+
+ALICE = UserId.from_string("123e4567-e89b-12d3-a456-426614174000")
+BOB = UserId.from_string("123e4567-e89b-12d3-a456-426614174001")
+
+
+class TestPresenceRegistry:
+    """Test cases for PresenceRegistry."""
+
+    def test_single_device(self):
+        """Test a user comes online and goes offline with one connection."""
+        registry = PresenceRegistry()
+
+        assert registry.add(ALICE, "sid-1") is True
+        assert registry.is_online(ALICE)
+        assert registry.sids(ALICE) == {"sid-1"}
+        assert registry.user_of("sid-1") == ALICE
+
+        assert registry.remove("sid-1") == (ALICE, True)
+        assert not registry.is_online(ALICE)
+        assert registry.sids(ALICE) == frozenset()
+        assert len(registry) == 0
+
+    def test_multiple_devices(self):
+        """Test a user stays online until the last device disconnects."""
+        registry = PresenceRegistry()
+
+        assert registry.add(ALICE, "sid-1") is True
+        assert registry.add(ALICE, "sid-2") is False
+        assert registry.add(ALICE, "sid-3") is False
+        registry.add(BOB, "sid-4")
+
+        assert registry.sids(ALICE) == {"sid-1", "sid-2", "sid-3"}
+        assert registry.online_users == 2
+        assert len(registry) == 4
+
+        assert registry.remove("sid-2") == (ALICE, False)
+        assert registry.remove("sid-1") == (ALICE, False)
+        assert registry.sids(ALICE) == {"sid-3"}
+        assert registry.remove("sid-3") == (ALICE, True)
+        assert registry.sids(BOB) == {"sid-4"}
+
+    def test_unknown_sid_and_duplicate_add(self):
+        """Test anonymous sids and re-adding the same sid are harmless."""
+        registry = PresenceRegistry()
+
+        assert registry.remove("anonymous") == (None, False)
+        assert registry.user_of("anonymous") is None
+        registry.add(ALICE, "sid-1")
+        registry.add(ALICE, "sid-1")
+        assert registry.sids(ALICE) == {"sid-1"}
+        assert registry.remove("sid-1") == (ALICE, True)
+
+    def test_user_room(self):
+        """Test the room name of a user."""
+        assert user_room(ALICE) == "user:123e4567-e89b-12d3-a456-426614174000"
@@ -0,0 +1,66 @@
+"""Unit tests for token bucket rate limiting."""
+
+import pytest
+
+from src.infrastructure.rate_limiting.token_bucket import TokenBucketLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucketLimiter:
+    """Test cases for TokenBucketLimiter."""
+
+    def test_burst_then_refill(self):
+        """Test the burst is allowed, then requests wait for the refill rate."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=2, capacity=3, clock=clock)
+
+        assert [limiter.acquire("sid") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire("sid") == pytest.approx(0.5)
+
+        clock.now = 0.5
+        assert limiter.acquire("sid") == 0.0
+        assert limiter.acquire("sid") == pytest.approx(0.5)
+
+    def test_keys_are_independent(self):
+        """Test one key exhausting its bucket does not affect another."""
+        limiter = TokenBucketLimiter(rate=1, capacity=1, clock=FakeClock())
+
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("a") > 0
+        assert limiter.acquire("b") == 0.0
+
+    def test_refill_is_capped_at_capacity(self):
+        """Test idle time does not accumulate more than the capacity."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=10, capacity=2, clock=clock)
+        limiter.acquire("sid")
+
+        clock.now = 100.0
+        assert [limiter.acquire("sid") for _ in range(2)] == [0.0, 0.0]
+        assert limiter.acquire("sid") > 0
+
+    def test_discard_and_max_keys(self):
+        """Test keys can be forgotten and the oldest key is evicted when full."""
+        limiter = TokenBucketLimiter(rate=1, capacity=1, max_keys=2, clock=FakeClock())
+        limiter.acquire("a")
+        limiter.acquire("b")
+        limiter.acquire("c")
+
+        assert len(limiter) == 2
+        assert limiter.acquire("a") == 0.0  # evicted, so it starts full again
+        limiter.discard("a")
+        assert len(limiter) == 1
+
+    def test_invalid_parameters(self):
+        """Test non-positive rate or capacity is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(rate=0, capacity=1)
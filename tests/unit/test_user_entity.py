@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime
 
 from src.domain.entities.user import User
+from src.domain.events.user_events import UserActivated, UserDeactivated, UserEmailChanged, UserNameChanged
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.user_id import UserId
 
@@ -99,3 +100,47 @@ class TestUserEntity:
         
         assert user.email == new_email
         assert user.updated_at is not None
+
+    def test_from_trusted(self):
+        """Test rebuilding a persisted user without validation."""
+        user_id = UserId.from_trusted("123e4567-e89b-12d3-a456-426614174000")
+        created_at = datetime(2024, 1, 1)
+        
+        user = User.from_trusted(
+            id=user_id,
+            email=Email.from_trusted("test@example.com"),
+            first_name="John",
+            last_name="Doe",
+            is_active=False,
+            created_at=created_at,
+            updated_at=None,
+        )
+        
+        assert user.id == user_id
+        assert user.full_name == "John Doe"
+        assert user.is_active is False
+        assert user.created_at == created_at
+        
+        user.activate()
+        assert user.is_active is True
+        assert [type(event) for event in user.pull_events()] == [UserActivated]
+
+    def test_state_changes_record_events(self):
+        """Test each state change records an event until they are pulled."""
+        user = User(
+            email=Email.from_string("test@example.com"),
+            first_name="John",
+            last_name="Doe",
+        )
+        assert user.pull_events() == []
+
+        user.deactivate()
+        user.update_name("Jane", "Smith")
+        user.update_email(Email.from_string("jane@example.com"))
+        events = user.pull_events()
+
+        assert [type(event) for event in events] == [UserDeactivated, UserNameChanged, UserEmailChanged]
+        assert {event.aggregate_id for event in events} == {str(user.id)}
+        assert events[1].payload() == {"first_name": "Jane", "last_name": "Smith"}
+        assert events[2].payload() == {"email": "jane@example.com"}
+        assert user.pull_events() == []
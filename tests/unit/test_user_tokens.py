@@ -0,0 +1,48 @@
+"""Unit tests for signed user tokens."""
+
+import pytest
+
+from src.domain.value_objects.user_id import UserId
+from src.infrastructure.auth.user_tokens import UserTokenSigner
+
+ALICE = UserId.from_string("123e4567-e89b-12d3-a456-426614174000")
+
+
+class TestUserTokenSigner:
+    """Test cases for UserTokenSigner."""
+
+    def test_issued_token_verifies_to_its_user(self):
+        """Test a token round-trips to the user it was issued for."""
+        signer = UserTokenSigner("secret")
+
+        assert signer.verify(signer.issue(ALICE, 60)) == ALICE
+
+    @pytest.mark.parametrize("token", [None, "", "garbage", f"{ALICE}.9999999999.forged"])
+    def test_malformed_and_forged_tokens_are_rejected(self, token):
+        """Test tokens without a valid signature are refused."""
+        with pytest.raises(ValueError, match="Invalid token"):
+            UserTokenSigner("secret").verify(token)
+
+    def test_token_signed_with_another_secret_is_rejected(self):
+        """Test a token is only valid under the secret it was signed with."""
+        token = UserTokenSigner("other").issue(ALICE, 60)
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            UserTokenSigner("secret").verify(token)
+
+    def test_changed_user_id_is_rejected(self):
+        """Test the user ID cannot be swapped under a valid signature."""
+        signer = UserTokenSigner("secret")
+        _, expires_at, signature = signer.issue(ALICE, 60).split(".")
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            signer.verify(f"123e4567-e89b-12d3-a456-426614174001.{expires_at}.{signature}")
+
+    def test_expired_token_is_rejected(self):
+        """Test tokens stop verifying once they expire."""
+        signer = UserTokenSigner("secret")
+        token = signer.issue(ALICE, 60, now=1000)
+
+        assert signer.verify(token, now=1059) == ALICE
+        with pytest.raises(ValueError, match="Expired token"):
+            signer.verify(token, now=1060)
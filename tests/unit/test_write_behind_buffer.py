@@ -0,0 +1,100 @@
+"""Unit tests for the write-behind buffer."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.database.write_behind import WriteBehindBuffer
+
+
+class TestWriteBehindBuffer:
+    """Test cases for WriteBehindBuffer."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting_for_delay(self):
+        """Test reaching max_batch flushes immediately, in order."""
+        batches = []
+
+        async def flush(batch):
+            batches.append(list(batch))
+
+        buffer = WriteBehindBuffer(flush, max_batch=3, max_delay=60)
+        buffer.start()
+        for i in range(6):
+            buffer.add(i)
+        await asyncio.sleep(0.01)
+
+        assert batches == [[0, 1, 2], [3, 4, 5]]
+        assert buffer.stats.batches == 2
+        assert len(buffer) == 0
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_delay(self):
+        """Test a small batch is written once max_delay has passed."""
+        batches = []
+
+        async def flush(batch):
+            batches.append(list(batch))
+
+        buffer = WriteBehindBuffer(flush, max_batch=100, max_delay=0.02)
+        buffer.start()
+        buffer.add("a")
+        buffer.add("b")
+        await asyncio.sleep(0.005)
+        assert batches == []
+        assert buffer.unwritten() == ["a", "b"]
+
+        await asyncio.sleep(0.05)
+        assert batches == [["a", "b"]]
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_before_newer_items(self):
+        """Test a failing flush keeps its items, in front of later ones."""
+        batches = []
+        failures = [RuntimeError("database down")]
+
+        async def flush(batch):
+            if failures:
+                raise failures.pop()
+            batches.append(list(batch))
+
+        buffer = WriteBehindBuffer(flush, max_batch=10, max_delay=0.001)
+        buffer.start()
+        buffer.add(1)
+        await asyncio.sleep(0.02)
+        buffer.add(2)
+        await asyncio.sleep(0.2)
+
+        assert buffer.stats.failures == 1
+        assert [item for batch in batches for item in batch] == [1, 2]
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_max_pending_drops_oldest(self):
+        """Test memory stays bounded while nothing can be written."""
+        async def flush(batch):
+            pass
+
+        buffer = WriteBehindBuffer(flush, max_batch=2, max_pending=3)
+        for i in range(5):
+            buffer.add(i)
+
+        assert buffer.unwritten() == [2, 3, 4]
+        assert buffer.stats.dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_items(self):
+        """Test shutdown flushes whatever is still buffered."""
+        batches = []
+
+        async def flush(batch):
+            batches.append(list(batch))
+
+        buffer = WriteBehindBuffer(flush, max_batch=2, max_delay=60)
+        buffer.start()
+        buffer.add("x")
+        await buffer.close()
+
+        assert batches == [["x"]]